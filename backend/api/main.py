@@ -1,21 +1,23 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 import sys
 import os
+import json
 from pathlib import Path
 
 # Add backend directory to path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from main.claim_extractor import ClaimExtractor
-from main.claim_discoverer import ClaimDiscoverer
-from main.reasoning import ClaimReasoner
-from main.headline.generator import HeadlineGenerator
-from main.categorizer import ClaimCategorizer
-from database.supabase_client import SupabaseClient
+from main.pipeline import get_pipeline, VerificationError, PipelineBusyError
+from main.jobs import JobQueue, JobWorkerPool
+from main.resources import get_resource, warm_up, registry
+from main.metrics import get_metrics, get_histograms
+from main.rate_limiter import get_limiter_stats
+from main.http_client import aclose_async_http_client, get_hedger_stats
 from reddit.monitor import RedditMonitor
 import threading
 import asyncio
@@ -23,20 +25,46 @@ import asyncio
 app = FastAPI(title="Misinformation Detection API")
 
 # Background task for Reddit Monitor
-def run_reddit_monitor():
+def run_reddit_monitor(loop: asyncio.AbstractEventLoop):
     print("Starting Reddit Monitor in background thread...")
     try:
-        monitor = RedditMonitor()
+        monitor = RedditMonitor(loop)
         monitor.process_posts()
     except Exception as e:
         print(f"Reddit Monitor failed: {e}")
 
+# Durable verification job queue, drained by workers started at startup
+job_queue: Optional[JobQueue] = None
+job_workers: Optional[JobWorkerPool] = None
+
+
 @app.on_event("startup")
 async def startup_event():
-    # Start Reddit monitor in a separate thread so it doesn't block FastAPI
-    monitor_thread = threading.Thread(target=run_reddit_monitor, daemon=True)
+    global job_queue, job_workers
+
+    # Build LLM clients, the tokenizer and the Supabase client once, before the first request
+    await asyncio.to_thread(warm_up)
+
+    # Start Reddit monitor in a separate thread so it doesn't block FastAPI; its
+    # verifications are scheduled back on this loop
+    monitor_thread = threading.Thread(
+        target=run_reddit_monitor, args=(asyncio.get_running_loop(),), daemon=True
+    )
     monitor_thread.start()
 
+    # Resume draining the job queue, including jobs left over from a previous run
+    job_queue = JobQueue()
+    job_workers = JobWorkerPool(job_queue)
+    job_workers.start()
+    print(f"Verification jobs by status: {job_queue.counts()}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if job_workers:
+        await job_workers.stop()
+    await aclose_async_http_client()
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -52,6 +80,7 @@ class VerifyRequest(BaseModel):
     content: str
     user_id: Optional[str] = "0"
     user_email: Optional[str] = "user0@gmail.com"
+    force_refresh: bool = False  # skip the verdict cache
 
 
 class VerifyResponse(BaseModel):
@@ -61,6 +90,19 @@ class VerifyResponse(BaseModel):
     claims: List[str]
     sources: Dict[str, List[str]]
     website_claims: Dict[str, List[str]]
+    cached: bool = False
+    reasoning_tier: Optional[Dict[str, Any]] = None  # which reasoning model answered, and why
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str  # "queued", "running", "succeeded" or "failed"
+    attempts: int = 0
+    created_at: float
+    finished_at: Optional[float] = None
+    result: Optional[VerifyResponse] = None
+    error: Optional[str] = None
+    error_status: Optional[int] = None
 
 
 class HistoryResponse(BaseModel):
@@ -102,7 +144,7 @@ class RedditPost(BaseModel):
 async def get_reddit_posts(limit: int = 50):
     """Get verified Reddit posts."""
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         posts = db.get_reddit_posts(limit=limit)
         return posts
     except Exception as e:
@@ -131,85 +173,38 @@ async def verify_content(request: VerifyRequest):
         print(f"Processing {request.input_type}: {request.content[:100]}...")
         print(f"{'='*70}\n")
 
-        # Step 1: Extract claims
-        extractor = ClaimExtractor(max_tokens_per_chunk=15000)
-
-        if request.input_type == "url":
-            result = extractor.extract_claims_from_url(request.content, key_name="user")
-        else:
-            result = extractor.extract_claims(request.content, key_name="user")
-
-        if not result["user"]:
-            raise HTTPException(
-                status_code=400, detail="No claims could be extracted from the content"
-            )
-
-        print(f"Extracted {len(result['user'])} claims")
-
-        # Step 2: Discover sources
-        discoverer = ClaimDiscoverer()
-        sources = discoverer.discover_sources(result["user"])
-
-        total_links = sum(len(links) for links in sources.values())
-        print(f"Discovered {total_links} sources")
-
-        # Step 3: Extract website claims
-        all_urls = []
-        for urls in sources.values():
-            all_urls.extend(urls)
-        all_urls = list(set(all_urls))
-
-        if not all_urls:
-            raise HTTPException(
-                status_code=400,
-                detail="No sources discovered. Please check your Tavily API key."
-            )
-        
-        website_claims = extractor.extract_website_claims(all_urls, result["user"])
-
-        # Flatten website claims for response
-        all_website_claims_flat = {}
-        for url, claims in website_claims.items():
-            if claims:
-                all_website_claims_flat[url] = claims
-
-        print(f"Extracted claims from {len(all_website_claims_flat)} websites")
-
-        # Step 4: Reasoning
-        if not all_website_claims_flat:
-            raise HTTPException(
-                status_code=400,
-                detail="No credible sources found for verification. Please check your API keys and try again."
-            )
-        
-        reasoner = ClaimReasoner()
-        final_result = reasoner.reason_all_claims(result["user"], all_website_claims_flat)
-        print(f"Final verdict: {final_result['verdict']}")
+        pipeline = get_pipeline()
+        result = await pipeline.run(
+            request.content, request.input_type, force_refresh=request.force_refresh
+        )
 
         # Save to Supabase
-        db = SupabaseClient()
-        saved_record = db.save_verification(
-            user_id=request.user_id,
-            user_email=request.user_email,
-            input_content=request.content,
-            input_type=request.input_type,
-            verdict=final_result["verdict"],
-            reasoning=final_result["reasoning"],
-            claims=result["user"],
-            sources=sources,
+        verification_id = await pipeline.save_verification(
+            result, user_id=request.user_id, user_email=request.user_email
         )
-        verification_id = saved_record.get("id", "")
         print(f"Saved to Supabase with ID: {verification_id}")
 
         return VerifyResponse(
             verification_id=verification_id,
-            verdict=final_result["verdict"],
-            reasoning=final_result["reasoning"],
-            claims=result["user"],
-            sources=sources,
-            website_claims=all_website_claims_flat,
+            verdict=result["verdict"],
+            reasoning=result["reasoning"],
+            claims=result["claims"],
+            sources=result["sources"],
+            website_claims=result["website_claims"],
+            cached=result["cached"],
+            reasoning_tier=result.get("reasoning_tier"),
         )
 
+    except PipelineBusyError as e:
+        print(f"Rejected verification: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Verification service is busy. Please retry shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except VerificationError as e:
+        print(f"Verification failed at {e.stage}: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"Error: {str(e)}")
         import traceback
@@ -218,18 +213,178 @@ async def verify_content(request: VerifyRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def job_to_response(job: Dict) -> JobResponse:
+    return JobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        finished_at=job["finished_at"],
+        result=job["result"],
+        error=job["error"] if job["status"] == JobQueue.FAILED else None,
+        error_status=job["error_status"],
+    )
+
+
+@app.post("/api/verify/jobs", response_model=JobResponse, status_code=202)
+async def create_verification_job(
+    request: VerifyRequest, idempotency_key: Optional[str] = Header(default=None)
+):
+    """
+    Queue a verification and return its job ID immediately.
+
+    Send the same Idempotency-Key header on retries to get the original job back
+    instead of starting a duplicate verification.
+    """
+    try:
+        job = await asyncio.to_thread(
+            job_queue.enqueue,
+            request.content,
+            request.input_type,
+            request.user_id,
+            request.user_email,
+            idempotency_key,
+            request.force_refresh,
+        )
+        job_workers.notify()
+        print(f"Queued verification job {job['id']} ({job['status']})")
+        return job_to_response(job)
+    except Exception as e:
+        print(f"Error queueing verification job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/verify/jobs/{job_id}", response_model=JobResponse)
+async def get_verification_job(job_id: str):
+    """
+    Get the status of a verification job, with its result once it has succeeded.
+    """
+    job = await asyncio.to_thread(job_queue.get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_to_response(job)
+
+
+def format_sse(event: str, data: Dict) -> str:
+    """Format a single Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.post("/api/verify/stream")
+async def verify_content_stream(request: VerifyRequest):
+    """
+    Verify content and stream progress as Server-Sent Events.
+
+    Events: claims (the claims so far, sent as each chunk is extracted and
+    once more with complete set), source (per claim), sources, website_claim
+    (per URL), website_claims, verdict, done (with verification_id) and error.
+    Closing the connection cancels the remaining pipeline stages.
+    """
+    pipeline = get_pipeline()
+    if pipeline.executor.is_saturated():
+        raise HTTPException(
+            status_code=503,
+            detail="Verification service is busy. Please retry shortly.",
+            headers={"Retry-After": str(pipeline.executor.retry_after)},
+        )
+
+    print(f"\n{'='*70}")
+    print(f"Streaming {request.input_type}: {request.content[:100]}...")
+    print(f"{'='*70}\n")
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def on_event(event: str, data: Dict):
+        await queue.put((event, data))
+
+    async def run_pipeline():
+        try:
+            result = await pipeline.run(
+                request.content,
+                request.input_type,
+                on_event=on_event,
+                force_refresh=request.force_refresh,
+            )
+            verification_id = await pipeline.save_verification(
+                result, user_id=request.user_id, user_email=request.user_email
+            )
+            print(f"Saved to Supabase with ID: {verification_id}")
+            await queue.put(("done", {"verification_id": verification_id}))
+        except PipelineBusyError as e:
+            await queue.put(("error", {"status": 503, "detail": str(e), "retry_after": e.retry_after}))
+        except VerificationError as e:
+            await queue.put(("error", {"status": 400, "stage": e.stage, "detail": str(e)}))
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            await queue.put(("error", {"status": 500, "detail": str(e)}))
+        finally:
+            await queue.put(None)
+
+    async def event_stream():
+        task = asyncio.create_task(run_pipeline())
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    break
+                event, data = item
+                yield format_sse(event, data)
+        finally:
+            if not task.done():
+                print("Client disconnected, cancelling verification")
+                task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/health")
 async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/api/metrics")
+async def metrics():
+    """
+    Process counters and load: LLM output parsing, LLM and search cache
+    hits, the evidence corpus, upstream latency histograms and hedging,
+    upstream rate limiters, verification capacity, coalesced requests,
+    warm resources and jobs.
+    """
+    pipeline = get_pipeline()
+    return {
+        "counters": get_metrics(),
+        "latency": get_histograms(),
+        "hedging": get_hedger_stats(),
+        "rate_limits": get_limiter_stats(),
+        "executor": pipeline.executor.stats(),
+        "single_flight": {
+            "in_flight": pipeline.single_flight.in_flight(),
+            "coalesced": pipeline.single_flight.coalesced,
+        },
+        "resources": registry.stats(),
+        "llm_cache": await asyncio.to_thread(lambda: get_resource("llm_cache").stats()),
+        "search_cache": await asyncio.to_thread(lambda: get_resource("search_cache").stats()),
+        "evidence_corpus": await asyncio.to_thread(lambda: get_resource("evidence_corpus").stats()),
+        "jobs": await asyncio.to_thread(job_queue.counts) if job_queue else {},
+    }
+
+
 @app.get("/api/history/{user_id}", response_model=List[HistoryResponse])
 async def get_history(user_id: str, limit: int = 50):
     """
     Get verification history for a user.
     """
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         history = db.get_user_history(user_id, limit)
         return history
     except Exception as e:
@@ -243,7 +398,7 @@ async def get_public_feed(limit: int = 20):
     Get public verifications for the homepage feed.
     """
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         feed = db.get_public_feed(limit)
         return feed
     except Exception as e:
@@ -254,7 +409,7 @@ async def get_public_feed(limit: int = 20):
 @app.post("/api/toggle-public/{verification_id}")
 async def toggle_public_status(verification_id: str, is_public: bool):
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         headline = None
         category = None
         image_url = None
@@ -269,13 +424,13 @@ async def toggle_public_status(verification_id: str, is_public: bool):
                 if not verification.get("headline"):
                     print(f"Generating headline for {verification_id}...")
                     try:
-                        generator = HeadlineGenerator()
+                        generator = get_resource("headline_generator")
                         # Use claims if available, else input content
                         if not claims and verification.get("input_content"):
                             claims = [verification.get("input_content")]
                         
                         if claims:
-                            headline = generator.generate_headline(claims)
+                            headline = await generator.agenerate_headline(claims)
                             print(f"Generated headline: {headline}")
                     except Exception as e:
                         print(f"Error generating headline: {e}")
@@ -287,8 +442,8 @@ async def toggle_public_status(verification_id: str, is_public: bool):
                     if claims:
                         print(f"Categorizing claims for {verification_id}...")
                         try:
-                            categorizer = ClaimCategorizer()
-                            category = categorizer.categorize_claims(claims)
+                            categorizer = get_resource("claim_categorizer")
+                            category = await categorizer.acategorize_claims(claims)
                             print(f"Category: {category}")
                         except Exception as e:
                             print(f"Error categorizing claims: {e}")
@@ -300,11 +455,11 @@ async def toggle_public_status(verification_id: str, is_public: bool):
                 if not verification.get("image_url"):
                     print(f"Searching for image for {verification_id}...")
                     try:
-                        searcher = ImageSearcher()
+                        searcher = get_resource("image_searcher")
                         if claims:
-                            image_url = searcher.get_image_for_claims(claims)
+                            image_url = await searcher.aget_image_for_claims(claims)
                         elif verification.get("input_content"):
-                             image_url = searcher.search_image(verification.get("input_content")[:200])
+                             image_url = await searcher.asearch_image(verification.get("input_content")[:200])
                         
                         print(f"Found image: {image_url}")
                     except Exception as e:
@@ -331,7 +486,7 @@ async def vote(request: VoteRequest):
     Vote on a verification.
     """
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         result = db.vote_verification(request.verification_id, request.user_id, request.vote_type)
         return result
     except Exception as e:
@@ -345,7 +500,7 @@ async def get_top_headlines(limit: int = 9):
     Get top headlines for the ticker.
     """
     try:
-        db = SupabaseClient()
+        db = get_resource("supabase")
         headlines = db.get_top_headlines(limit)
         return headlines
     except Exception as e:
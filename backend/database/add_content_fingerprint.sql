@@ -0,0 +1,16 @@
+-- Add verdict cache columns to verifications table
+-- Run this SQL in your Supabase SQL Editor
+
+-- Hash of the normalized input (canonical URL, or case/whitespace folded text).
+-- Only set on freshly computed verdicts, so cached copies never extend the cache window.
+ALTER TABLE verifications
+ADD COLUMN IF NOT EXISTS content_fingerprint TEXT;
+
+-- Evidence extracted from each source, needed to serve a cached verdict in full
+ALTER TABLE verifications
+ADD COLUMN IF NOT EXISTS website_claims JSONB NOT NULL DEFAULT '{}'::jsonb;
+
+-- Create index for cache lookups (newest verdict for a fingerprint)
+CREATE INDEX IF NOT EXISTS idx_verifications_content_fingerprint
+    ON verifications(content_fingerprint, created_at DESC)
+    WHERE content_fingerprint IS NOT NULL;
@@ -0,0 +1,18 @@
+-- Create claim_verdicts table: one verdict per normalized claim, reused across verifications
+-- Run this SQL in your Supabase SQL Editor
+CREATE TABLE IF NOT EXISTS claim_verdicts (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    claim_key TEXT NOT NULL UNIQUE, -- hash of the case/whitespace folded claim text
+    claim TEXT NOT NULL,
+    verdict BOOLEAN NOT NULL,
+    reasoning TEXT NOT NULL DEFAULT '',
+    evidence_urls JSONB NOT NULL DEFAULT '[]'::jsonb,
+    evidence JSONB NOT NULL DEFAULT '{}'::jsonb, -- url -> claims extracted from that source
+    verified_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Create index on verified_at for freshness filtering
+CREATE INDEX IF NOT EXISTS idx_claim_verdicts_verified_at ON claim_verdicts(verified_at DESC);
+
+-- Disable RLS (backend manages access, same as verifications)
+ALTER TABLE claim_verdicts DISABLE ROW LEVEL SECURITY;
@@ -0,0 +1,42 @@
+import os
+import sqlite3
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load .env from project root
+env_path = Path(__file__).parent.parent.parent / ".env"
+load_dotenv(dotenv_path=env_path)
+
+
+def get_data_dir() -> Path:
+    """
+    Directory for local state (job queue, caches, indexes).
+
+    Defaults to backend/data, override with TRUTHLENS_DATA_DIR.
+    """
+    data_dir = Path(os.getenv("TRUTHLENS_DATA_DIR", Path(__file__).parent.parent / "data"))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+def connect(path) -> sqlite3.Connection:
+    """
+    Open a SQLite database tuned for concurrent use by several threads and processes.
+
+    Args:
+        path: Database file path, or a bare file name placed in get_data_dir()
+
+    Returns:
+        sqlite3.Connection with WAL journaling and dict-like rows
+    """
+    path = Path(path)
+    if not path.is_absolute() and len(path.parts) == 1:
+        path = get_data_dir() / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
@@ -2,7 +2,7 @@ import os
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 # Load .env from project root
@@ -32,6 +32,8 @@ class SupabaseClient:
         claims: List[str],
         sources: Dict[str, List[str]],
         is_public: bool = False,
+        content_fingerprint: Optional[str] = None,
+        website_claims: Optional[Dict[str, List[str]]] = None,
     ) -> Dict:
         """
         Save a verification result to Supabase.
@@ -45,6 +47,8 @@ class SupabaseClient:
             reasoning: AI reasoning for the verdict
             claims: List of extracted claims
             sources: Dictionary of sources found
+            content_fingerprint: Normalized input hash; set to make this verdict servable from cache
+            website_claims: Claims extracted from each source
             
         Returns:
             Dictionary with the saved record
@@ -62,6 +66,10 @@ class SupabaseClient:
                 "is_public": is_public,
                 "created_at": datetime.utcnow().isoformat(),
             }
+            if content_fingerprint:
+                data["content_fingerprint"] = content_fingerprint
+            if website_claims is not None:
+                data["website_claims"] = website_claims
             
             result = self.client.table("verifications").insert(data).execute()
             return result.data[0] if result.data else {}
@@ -123,6 +131,87 @@ class SupabaseClient:
             print(f"Error fetching verification from Supabase: {e}")
             return None
     
+    def get_cached_verification(self, content_fingerprint: str, max_age_seconds: int) -> Optional[Dict]:
+        """
+        Get the newest verification of the same content, if it is recent enough.
+        
+        Args:
+            content_fingerprint: Normalized input hash
+            max_age_seconds: Maximum age of the cached verdict
+            
+        Returns:
+            Verification record or None
+        """
+        try:
+            cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+            result = (
+                self.client.table("verifications")
+                .select("*")
+                .eq("content_fingerprint", content_fingerprint)
+                .gte("created_at", cutoff.isoformat())
+                .order("created_at", desc=True)
+                .limit(1)
+                .execute()
+            )
+            
+            return result.data[0] if result.data else None
+            
+        except Exception as e:
+            print(f"Error fetching cached verification from Supabase: {e}")
+            return None
+    
+    def get_claim_verdicts(self, claim_keys: List[str], max_age_seconds: int) -> Dict[str, Dict]:
+        """
+        Get stored per-claim verdicts that are recent enough to reuse.
+        
+        Args:
+            claim_keys: Normalized claim keys to look up
+            max_age_seconds: Maximum age of a reusable verdict
+            
+        Returns:
+            Dictionary mapping claim_key to its claim_verdicts record
+        """
+        if not claim_keys:
+            return {}
+        try:
+            cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+            result = (
+                self.client.table("claim_verdicts")
+                .select("*")
+                .in_("claim_key", list(claim_keys))
+                .gte("verified_at", cutoff.isoformat())
+                .execute()
+            )
+            
+            return {row["claim_key"]: row for row in (result.data or [])}
+            
+        except Exception as e:
+            print(f"Error fetching claim verdicts from Supabase: {e}")
+            return {}
+    
+    def save_claim_verdicts(self, records: List[Dict]) -> int:
+        """
+        Insert or refresh per-claim verdicts, keyed by claim_key.
+        
+        Args:
+            records: Dictionaries with claim_key, claim, verdict, reasoning,
+                evidence_urls and evidence
+            
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        try:
+            now = datetime.utcnow().isoformat()
+            data = [dict(record, verified_at=now) for record in records]
+            result = self.client.table("claim_verdicts").upsert(data, on_conflict="claim_key").execute()
+            return len(result.data) if result.data else 0
+            
+        except Exception as e:
+            print(f"Error saving claim verdicts to Supabase: {e}")
+            return 0
+    
     def get_public_feed(self, limit: int = 20) -> List[Dict]:
         """
         Get public verifications for the homepage feed.
@@ -1,8 +1,10 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from tavily import TavilyClient
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from main.rate_limiter import get_limiter
+from main.http_client import get_http_client, get_async_http_client
 
 # Load .env from project root
 env_path = Path(__file__).parent.parent.parent / ".env"
@@ -12,34 +14,63 @@ class ImageSearcher:
     def __init__(self):
         # Check for correct spelling and common typo
         self.api_key = os.getenv("TAVILY_API_KEY") or os.getenv("TAVALY_API_KEY")
+        self.api_url = "https://api.tavily.com/search"
         
         if not self.api_key:
             print("Warning: TAVILY_API_KEY (or TAVALY_API_KEY) not set")
-        try:
-            self.client = TavilyClient(api_key=self.api_key)
-        except Exception as e:
-            print(f"Error initializing Tavily client: {e}")
-            self.client = None
+
+    def _payload(self, query: str) -> Dict:
+        # Tavily search with include_images=True
+        return {
+            "api_key": self.api_key,
+            "query": query,
+            "include_images": True,
+            "max_results": 1,
+            "search_depth": "basic",
+        }
+
+    @staticmethod
+    def _first_image(response: Dict) -> Optional[str]:
+        if response and 'images' in response and response['images']:
+            image_url = response['images'][0]
+            print(f"Found image: {image_url}")
+            return image_url
+        
+        print("No images found in Tavily response")
+        return None
 
     def search_image(self, query: str) -> Optional[str]:
         """
         Search for an image using Tavily.
         """
-        if not self.client:
+        if not self.api_key:
             return None
 
         try:
             print(f"Searching for image with query: {query}")
-            # Tavily's search method with include_images=True
-            response = self.client.search(query, include_images=True, max_results=1, search_depth="basic")
+            with get_limiter("tavily_search"):
+                response = get_http_client().post(self.api_url, json=self._payload(query))
+            response.raise_for_status()
             
-            if response and 'images' in response and response['images']:
-                image_url = response['images'][0]
-                print(f"Found image: {image_url}")
-                return image_url
-            
-            print("No images found in Tavily response")
+            return self._first_image(response.json())
+        except Exception as e:
+            print(f"Error searching for image: {e}")
             return None
+
+    async def asearch_image(self, query: str) -> Optional[str]:
+        """
+        Async search_image, on the event loop's pooled HTTP client.
+        """
+        if not self.api_key:
+            return None
+
+        try:
+            print(f"Searching for image with query: {query}")
+            async with get_limiter("tavily_search"):
+                response = await get_async_http_client().post(self.api_url, json=self._payload(query))
+            response.raise_for_status()
+            
+            return self._first_image(response.json())
         except Exception as e:
             print(f"Error searching for image: {e}")
             return None
@@ -54,3 +85,12 @@ class ImageSearcher:
         # Use the first claim, truncated to avoid overly long queries
         query = claims[0][:200]
         return self.search_image(query)
+
+    async def aget_image_for_claims(self, claims: List[str]) -> Optional[str]:
+        """
+        Async get_image_for_claims.
+        """
+        if not claims:
+            return None
+        
+        return await self.asearch_image(claims[0][:200])
@@ -7,6 +7,8 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from main.llm_cache import cached_invoke, acached_invoke
+
 # Load .env from project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -65,28 +67,47 @@ CATEGORY:""")
         if not claims:
             return "technology"  # Default fallback
 
-        # Format claims
-        claims_text = "\n".join([f"- {claim}" for claim in claims])
-
         try:
-            # Create the chain
-            chain = self.categorization_prompt | self.llm | self.output_parser
+            # Invoke the chain (through the shared response cache)
+            category = cached_invoke(
+                "claim_categorizer", self.categorization_prompt, self.llm, self._inputs(claims), "openai"
+            )
+            return self._validate(category)
 
-            # Invoke the chain
-            category = chain.invoke({"claims_text": claims_text})
+        except Exception as e:
+            print(f"Error categorizing claims: {e}")
+            return "technology"  # Default fallback on error
 
-            # Clean and validate the response
-            category = category.strip().lower()
+    async def acategorize_claims(self, claims: List[str]) -> str:
+        """Async categorize_claims, using ainvoke."""
+        if not claims:
+            return "technology"  # Default fallback
 
-            # Ensure it's one of the valid categories
-            valid_categories = ["sports", "technology", "politics", "finance", "crime"]
-            if category in valid_categories:
-                return category
-            else:
-                # If invalid category returned, default to technology
-                print(f"Invalid category '{category}' returned, defaulting to 'technology'")
-                return "technology"
+        try:
+            category = await acached_invoke(
+                "claim_categorizer", self.categorization_prompt, self.llm, self._inputs(claims), "openai"
+            )
+            return self._validate(category)
 
         except Exception as e:
             print(f"Error categorizing claims: {e}")
             return "technology"  # Default fallback on error
+
+    @staticmethod
+    def _inputs(claims: List[str]) -> dict:
+        # Format claims
+        return {"claims_text": "\n".join([f"- {claim}" for claim in claims])}
+
+    @staticmethod
+    def _validate(category: str) -> str:
+        # Clean and validate the response
+        category = category.strip().lower()
+
+        # Ensure it's one of the valid categories
+        valid_categories = ["sports", "technology", "politics", "finance", "crime"]
+        if category in valid_categories:
+            return category
+        else:
+            # If invalid category returned, default to technology
+            print(f"Invalid category '{category}' returned, defaulting to 'technology'")
+            return "technology"
@@ -1,11 +1,17 @@
 import os
-import requests
-from typing import List, Dict
+import asyncio
+from typing import List, Dict, Callable, Optional
 from dotenv import load_dotenv
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+from main.rate_limiter import get_limiter
+from main.http_client import get_http_client, get_async_http_client, get_hedger
+from main.metrics import increment, observe
+from main.resources import get_resource
+from main.source_ranker import SourceRanker
+
 # Load .env from project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -18,6 +24,52 @@ class ClaimDiscoverer:
         """
         self.api_key = os.getenv("TAVALY_API_KEY")
         self.api_url = "https://api.tavily.com/search"
+        # Candidates per claim; the source ranker decides which are scraped
+        self.max_results = int(os.getenv("TAVILY_MAX_RESULTS", "5"))
+        # Ask for page text with the results, saving an extract call per source
+        self.include_raw_content = os.getenv("TAVILY_INCLUDE_RAW_CONTENT", "1").lower() not in ("0", "false", "off", "no")
+        self.raw_content_min_chars = int(os.getenv("TAVILY_RAW_CONTENT_MIN_CHARS", "500"))
+
+    def _payload(self, claim: str) -> Dict:
+        payload = {
+            "api_key": self.api_key,
+            "query": claim,
+            "search_depth": "advanced",
+            "max_results": self.max_results,
+            "include_domains": [],
+            "exclude_domains": [],
+        }
+        if self.include_raw_content:
+            payload["include_raw_content"] = True
+        return payload
+
+    def _raw_content(self, result: Dict) -> Optional[str]:
+        """Page text returned with a search result, or None if it is missing or looks truncated."""
+        content = (result.get("raw_content") or "").strip()
+        if not content:
+            increment("search_raw_content.missing")
+            return None
+        if len(content) < self.raw_content_min_chars or content.endswith(("...", "\u2026", "[...]")):
+            increment("search_raw_content.truncated")
+            return None
+        increment("search_raw_content.used")
+        return content
+
+    def _results(self, data: Dict) -> List[Dict]:
+        # Keep the URL and Tavily's relevance score of each result, plus the
+        # page title and text when the search returned a usable copy
+        results = []
+        for result in data.get("results", []):
+            if not result.get("url"):
+                continue
+            item = {"url": result["url"], "score": result.get("score")}
+            if self.include_raw_content:
+                content = self._raw_content(result)
+                if content:
+                    item["title"] = result.get("title", "")
+                    item["content"] = content
+            results.append(item)
+        return results
 
     def get_links_for_single_claim(self, claim: str) -> List[str]:
         """
@@ -29,69 +81,152 @@ class ClaimDiscoverer:
         Returns:
             List of credible URLs
         """
+        return [result["url"] for result in self.get_results_for_single_claim(claim)]
+
+    def _local_results(self, claim: str) -> Optional[List[Dict]]:
+        # Fresh scraped pages covering the claim, or None when a search is needed
         try:
-            payload = {
-                "api_key": self.api_key,
-                "query": claim,
-                "search_depth": "advanced",
-                "max_results": 3,
-                "include_domains": [],
-                "exclude_domains": [],
-            }
+            return get_resource("evidence_corpus").search(claim, limit=self.max_results)
+        except Exception as e:
+            print(f"Evidence corpus unavailable: {e}")
+            return None
+
+    def get_results_for_single_claim(self, claim: str) -> List[Dict]:
+        """
+        Find sources for a single claim, searching Tavily only when needed.
+
+        The local evidence corpus is queried first; when it holds enough
+        fresh pages covering the claim, no search is made. Otherwise responses
+        are served from the shared search cache when a search with the same
+        normalized query and parameters ran recently.
 
-            response = requests.post(self.api_url, json=payload)
-            response.raise_for_status()
+        Args:
+            claim: Single claim to find sources for
 
-            data = response.json()
+        Returns:
+            List of results with 'url' and Tavily's relevance 'score', and
+            'title' and 'content' when the page text came with the search
+        """
+        local = self._local_results(claim)
+        if local is not None:
+            return local
 
-            # Extract URLs from results
-            if "results" in data:
-                return [result["url"] for result in data["results"]]
+        try:
+            payload = self._payload(claim)
+            cache = get_resource("search_cache")
+            data = cache.get(payload)
+            if data is None:
+                # Timed inside the limiter so queueing does not inflate the hedge threshold
+                with get_limiter("tavily_search"):
+                    started = time.monotonic()
+                    response = get_http_client().post(self.api_url, json=payload)
+                    observe("tavily_search", time.monotonic() - started)
+                response.raise_for_status()
+
+                data = response.json()
+                cache.put(payload, data)
+
+            return self._results(data)
 
+        except Exception as e:
+            print(f"Error getting links for claim: {e}")
             return []
 
+    async def _apost(self, payload: Dict) -> Dict:
+        response = await get_async_http_client().post(self.api_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def aget_links_for_single_claim(self, claim: str) -> List[str]:
+        """
+        Async get_links_for_single_claim, on the event loop's pooled HTTP client.
+        """
+        return [result["url"] for result in await self.aget_results_for_single_claim(claim)]
+
+    async def aget_results_for_single_claim(self, claim: str) -> List[Dict]:
+        """
+        Async get_results_for_single_claim, on the event loop's pooled HTTP client.
+
+        The search runs under a deadline and is hedged when slower than the
+        recent p90 search latency (see get_hedger). The evidence corpus and
+        the search cache are queried from a worker thread.
+        """
+        local = await asyncio.to_thread(self._local_results, claim)
+        if local is not None:
+            return local
+
+        try:
+            payload = self._payload(claim)
+            cache = get_resource("search_cache")
+            data = await asyncio.to_thread(cache.get, payload)
+            if data is None:
+                data = await get_hedger("tavily_search").run(
+                    lambda: self._apost(payload), limiter=get_limiter("tavily_search")
+                )
+                await asyncio.to_thread(cache.put, payload, data)
+
+            return self._results(data)
+
         except Exception as e:
             print(f"Error getting links for claim: {e}")
             return []
 
-    def discover_sources(self, claims: List[str]) -> Dict[str, List[str]]:
+    def discover_sources(
+        self,
+        claims: List[str],
+        on_result: Optional[Callable[[str, List[str]], None]] = None,
+        ranker: Optional[SourceRanker] = None,
+    ) -> Dict[str, List[str]]:
         """
         Discover credible sources for all claims concurrently using Tavily.
 
+        The search results of all claims are ranked together (see SourceRanker),
+        so only the best pages within the per-request source budget are returned.
+
         Args:
             claims: List of all claims to find sources for
+            on_result: Optional callback called with (claim, links) as each search finishes
+            ranker: SourceRanker choosing the pages to keep (default: configured from env)
 
         Returns:
-            Dictionary mapping each claim to its list of related URLs
+            Dictionary mapping each claim to its list of selected URLs
         """
-        claim_to_links = {}
+        claim_to_results = {}
 
         print(f"Processing {len(claims)} claim(s) concurrently using Tavily...")
 
         # Process all claims concurrently
         with ThreadPoolExecutor(max_workers=min(len(claims), 10)) as executor:
             future_to_claim = {
-                executor.submit(self.get_links_for_single_claim, claim): claim
+                executor.submit(self.get_results_for_single_claim, claim): claim
                 for claim in claims
             }
 
             for future in as_completed(future_to_claim):
                 claim = future_to_claim[future]
                 try:
-                    links = future.result()
-                    claim_to_links[claim] = links
-                    print(f"[OK] Found {len(links)} link(s) for claim")
+                    results = future.result()
+                    claim_to_results[claim] = results
+                    print(f"[OK] Found {len(results)} link(s) for claim")
                 except Exception as e:
                     print(f"Error processing claim: {e}")
-                    claim_to_links[claim] = []
+                    claim_to_results[claim] = []
+
+                if on_result:
+                    on_result(claim, [result["url"] for result in claim_to_results[claim]])
 
         # Count total links
-        total_links = sum(len(links) for links in claim_to_links.values())
+        total_links = sum(len(results) for results in claim_to_results.values())
         claims_with_links = sum(
-            1 for links in claim_to_links.values() if len(links) > 0
+            1 for results in claim_to_results.values() if len(results) > 0
         )
         print(
-            f"\nTotal links discovered: {total_links} across {claims_with_links}/{len(claim_to_links)} claims"
+            f"\nTotal links discovered: {total_links} across {claims_with_links}/{len(claim_to_results)} claims"
         )
 
-        return claim_to_links
+        ranker = ranker or SourceRanker(get_resource("domain_reputation"))
+        for claim in claims:
+            ranker.offer(claim, claim_to_results.get(claim, []))
+        ranker.finish()
+        selected = ranker.sources()
+        return {claim: selected.get(claim, []) for claim in claim_to_results}
@@ -0,0 +1,107 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import List
+
+_paragraph_re = re.compile(r"\n\s*\n")
+_sentence_re = re.compile(r"(?<=[.!?])\s+")
+
+
+def _boundaries(pattern: re.Pattern, text: str, offsets: List[int]) -> List[int]:
+    """Token indices at which a paragraph or sentence starts."""
+    indices = []
+    for match in pattern.finditer(text):
+        index = bisect_left(offsets, match.end())
+        if 0 < index < len(offsets) and (not indices or indices[-1] != index):
+            indices.append(index)
+    return indices
+
+
+def _last_boundary(boundaries: List[int], low: int, high: int) -> int:
+    """Largest boundary in (low, high], or -1."""
+    position = bisect_right(boundaries, high) - 1
+    if position >= 0 and boundaries[position] > low:
+        return boundaries[position]
+    return -1
+
+
+def _first_boundary(boundaries: List[int], low: int, high: int) -> int:
+    """Smallest boundary in [low, high), or -1."""
+    position = bisect_left(boundaries, low)
+    if position < len(boundaries) and boundaries[position] < high:
+        return boundaries[position]
+    return -1
+
+
+def split_text_into_chunks(text: str, encoding, max_tokens: int, overlap_tokens: int = 0) -> List[str]:
+    """
+    Split text into chunks of at most max_tokens tokens.
+
+    The document is tokenized once and cut at token offsets, preferring
+    paragraph breaks, then sentence ends, and only splitting inside a
+    sentence when a single sentence is longer than the budget. Every chunk
+    re-encodes to at most max_tokens tokens. Runs in linear time in the
+    document length.
+
+    Args:
+        text: The input text to split
+        encoding: tiktoken Encoding used to count tokens
+        max_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens of context repeated at the start of the next
+            chunk, rounded forward to a sentence start when possible
+
+    Returns:
+        List of text chunks
+    """
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return [text]
+
+    decoded, offsets = encoding.decode_with_offsets(tokens)
+    if decoded != text:
+        # Tokens split a multi-byte character; offsets refer to the decoded text
+        text = decoded
+    paragraphs = _boundaries(_paragraph_re, text, offsets)
+    sentences = _boundaries(_sentence_re, text, offsets)
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+
+    chunks = []
+    total = len(tokens)
+    start = 0
+    while start < total:
+        limit = start + max_tokens
+        if limit >= total:
+            end = total
+        else:
+            # A paragraph break in the second half of the window, else the last
+            # sentence end, else any paragraph break, else a hard cut
+            end = _last_boundary(paragraphs, start + max_tokens // 2, limit)
+            if end < 0:
+                end = _last_boundary(sentences, start, limit)
+            if end < 0:
+                end = _last_boundary(paragraphs, start, limit)
+            if end < 0:
+                end = limit
+
+        chunk_end = offsets[end] if end < total else len(text)
+        chunk = text[offsets[start]:chunk_end]
+        # Re-encoding a slice can merge tokens differently at its edges; trim
+        # until the chunk itself fits so the budget holds for the caller
+        excess = len(encoding.encode(chunk)) - max_tokens
+        while excess > 0 and end - start > 1:
+            end = max(start + 1, end - excess)
+            chunk = text[offsets[start]:offsets[end]]
+            excess = len(encoding.encode(chunk)) - max_tokens
+
+        chunk = chunk.strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= total:
+            break
+
+        next_start = end
+        if overlap_tokens:
+            overlap_start = _first_boundary(sentences, end - overlap_tokens, end)
+            next_start = overlap_start if overlap_start > start else max(end - overlap_tokens, start + 1)
+        start = next_start
+
+    return chunks
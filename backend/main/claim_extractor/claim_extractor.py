@@ -1,12 +1,25 @@
 import os
-import tiktoken
-from typing import List, Dict
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Callable, Optional, Tuple
 from dotenv import load_dotenv
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from web_scraper import WebScraper
+from main.llm_cache import cached_invoke, acached_invoke
+from main.claim_extractor.chunker import split_text_into_chunks
+from main.claim_extractor.output_parser import (
+    CLAIMS_RESPONSE_FORMAT,
+    BATCH_CLAIMS_RESPONSE_FORMAT,
+    parse_claims,
+    parse_source_claims,
+)
+from main.claim_extractor.passage_selector import select_passages
+from main.resources import get_resource
+from main.metrics import increment
 
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
@@ -18,26 +31,49 @@ load_dotenv(dotenv_path=env_path)
 
 
 class ClaimExtractor:
-    def __init__(self, model: str = None, max_tokens_per_chunk: int = 15000):
+    def __init__(self, model: str = None, max_tokens_per_chunk: int = 15000, chunk_overlap_tokens: int = 0):
         """
         Initialize the ClaimExtractor.
         
         Args:
             model: The OpenAI model to use (default: from OPENAI_MODEL env variable)
             max_tokens_per_chunk: Maximum tokens per text chunk (default: 15000)
+            chunk_overlap_tokens: Tokens repeated between consecutive chunks (default: 0)
         """
         model_name = model or os.getenv("OPENAI_MODEL")
-        self.llm = ChatOpenAI(
+        llm = ChatOpenAI(
             model=model_name,
             openai_api_key=os.getenv("OPENAI_API_KEY"),
             temperature=0
         )
+        # Constrain output to the expected JSON shape; OPENAI_RESPONSE_FORMAT=json_object
+        # or none for models without JSON schema support
+        response_format = os.getenv("OPENAI_RESPONSE_FORMAT", "json_schema")
+        if response_format == "json_schema":
+            self.llm = llm.bind(response_format=CLAIMS_RESPONSE_FORMAT)
+            self.batch_llm = llm.bind(response_format=BATCH_CLAIMS_RESPONSE_FORMAT)
+        elif response_format == "json_object":
+            self.llm = self.batch_llm = llm.bind(response_format={"type": "json_object"})
+        else:
+            self.llm = self.batch_llm = llm
         self.max_tokens_per_chunk = max_tokens_per_chunk
-        self.encoding = tiktoken.encoding_for_model("gpt-4")
+        self.chunk_overlap_tokens = chunk_overlap_tokens
+        # Token budget for the page excerpt sent with each website claim extraction
+        self.website_content_tokens = int(os.getenv("WEBSITE_CONTENT_TOKENS", "2000"))
+        # Pages packed into one website extraction call (1 = one call per page)
+        # and the token budget for their combined excerpts
+        self.website_batch_size = int(os.getenv("WEBSITE_BATCH_SIZE", "4"))
+        self.website_batch_tokens = int(os.getenv("WEBSITE_BATCH_TOKENS", "8000"))
+        self.encoding = get_resource("tiktoken")
+        # Token counts of recent page excerpts and claim lists, so batching and
+        # the prompt token counter never re-encode them on the event loop
+        self._token_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._token_counts_lock = threading.Lock()
+        self.scraper = WebScraper()
         
         # Define prompts for claim extraction
         self.claim_extraction_prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a claim extraction assistant. Extract only the 3-7 MOST important and specific claims from the text. Be selective - quality over quantity. Each claim must be DISTINCT and about different aspects. Avoid extracting closely related or redundant claims. Ignore generic statements and filler content. Return them as a Python list of strings."),
+            ("system", "You are a claim extraction assistant. Extract only the 3-7 MOST important and specific claims from the text. Be selective - quality over quantity. Each claim must be DISTINCT and about different aspects. Avoid extracting closely related or redundant claims. Ignore generic statements and filler content. Return them as a JSON object with a \"claims\" array of strings."),
             ("user", """Extract the most important and significant claims from the following text.
 Focus on 'hot claims' - statements that are:
 - Specific and concrete (with numbers, names, dates, or specific details)
@@ -47,8 +83,8 @@ Focus on 'hot claims' - statements that are:
 
 Extract only 3-7 of the MOST important claims. Be selective and concise.
 Ensure each claim is about a DIFFERENT aspect or topic - avoid extracting multiple similar claims.
-Return ONLY a Python list of strings, where each string is a distinct claim.
-Format: ['claim1', 'claim2', 'claim3']
+Return ONLY a JSON object whose "claims" array holds one string per distinct claim.
+Format: {{"claims": ["claim1", "claim2", "claim3"]}}
 
 Text:
 {text}
@@ -57,7 +93,7 @@ Claims:""")
         ])
         
         self.website_claim_prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a claim extraction assistant. Extract claims from website content that relate to the original claim topic. Return only a Python list of strings."),
+            ("system", "You are a claim extraction assistant. Extract claims from website content that relate to the original claim topic. Return only a JSON object with a \"claims\" array of strings."),
             ("user", """You are analyzing website content related to these original claims:
 
 ORIGINAL CLAIMS:
@@ -72,16 +108,71 @@ Extract 3-7 important claims from the website content that are:
 Website content:
 {content}
 
-Return ONLY a Python list of strings, where each string is a distinct claim.
-Format: ["claim1", "claim2", "claim3"]""")
+Return ONLY a JSON object whose "claims" array holds one string per distinct claim.
+Format: {{"claims": ["claim1", "claim2", "claim3"]}}""")
+        ])
+        
+        self.website_batch_prompt = ChatPromptTemplate.from_messages([
+            ("system", "You are a claim extraction assistant. Extract claims from several numbered website sources that relate to the original claim topic. Keep the claims of each source separate. Return only a JSON object with a \"sources\" array."),
+            ("user", """You are analyzing content from several websites related to these original claims:
+
+ORIGINAL CLAIMS:
+{original_claims_text}
+
+For EACH numbered source below, extract 3-7 important claims from that source's content that are:
+- Related to ANY of the original claims (about the same topics or providing context)
+- Specific and concrete (with numbers, names, dates, or specific details)
+- Significant and meaningful
+- DISTINCT and NOT closely related to each other
+Only use a source's own content for its claims. Include every source, with an empty list if it has no relevant claims.
+
+{sources_text}
+
+Return ONLY a JSON object with one entry per source, using the source numbers above.
+Format: {{"sources": [{{"source": 1, "claims": ["claim1", "claim2"]}}, {{"source": 2, "claims": ["claim1"]}}]}}""")
         ])
         
         self.output_parser = StrOutputParser()
+        # Tokens of the website prompts without their variable parts
+        self._website_prompt_tokens = self.count_tokens(
+            self.website_claim_prompt.format(original_claims_text="", content="")
+        )
+        self._website_batch_prompt_tokens = self.count_tokens(
+            self.website_batch_prompt.format(original_claims_text="", sources_text="")
+        )
     
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text."""
         return len(self.encoding.encode(text))
     
+    def _remember_tokens(self, text: str, tokens: int):
+        with self._token_counts_lock:
+            self._token_counts[text] = tokens
+            self._token_counts.move_to_end(text)
+            while len(self._token_counts) > 1024:
+                self._token_counts.popitem(last=False)
+    
+    def excerpt_tokens(self, text: str) -> int:
+        """
+        Token count of a page excerpt or claim list.
+        
+        Excerpts from prepare_website_content are counted while their passages
+        are budgeted; anything else is encoded once and remembered.
+        """
+        if not text:
+            return 0
+        with self._token_counts_lock:
+            tokens = self._token_counts.get(text)
+        if tokens is None:
+            tokens = self.count_tokens(text)
+            self._remember_tokens(text, tokens)
+        return tokens
+    
+    def _select_excerpt(self, content: str, original_claims: List[str]) -> str:
+        excerpt, tokens = select_passages(content, original_claims, self.encoding, self.website_content_tokens)
+        self._remember_tokens(excerpt, tokens)
+        return excerpt
+    
     def split_text_into_chunks(self, text: str) -> List[str]:
         """
         Split text into chunks based on token limit.
@@ -92,48 +183,9 @@ Format: ["claim1", "claim2", "claim3"]""")
         Returns:
             List of text chunks
         """
-        token_count = self.count_tokens(text)
-        
-        if token_count <= self.max_tokens_per_chunk:
-            return [text]
-        
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
-        chunks = []
-        current_chunk = ""
-        
-        for paragraph in paragraphs:
-            test_chunk = current_chunk + "\n\n" + paragraph if current_chunk else paragraph
-            
-            if self.count_tokens(test_chunk) <= self.max_tokens_per_chunk:
-                current_chunk = test_chunk
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                
-                # If single paragraph is too large, split by sentences
-                if self.count_tokens(paragraph) > self.max_tokens_per_chunk:
-                    sentences = paragraph.split('. ')
-                    temp_chunk = ""
-                    
-                    for sentence in sentences:
-                        test_sentence = temp_chunk + ". " + sentence if temp_chunk else sentence
-                        
-                        if self.count_tokens(test_sentence) <= self.max_tokens_per_chunk:
-                            temp_chunk = test_sentence
-                        else:
-                            if temp_chunk:
-                                chunks.append(temp_chunk)
-                            temp_chunk = sentence
-                    
-                    current_chunk = temp_chunk
-                else:
-                    current_chunk = paragraph
-        
-        if current_chunk:
-            chunks.append(current_chunk)
-        
-        return chunks
+        return split_text_into_chunks(
+            text, self.encoding, self.max_tokens_per_chunk, self.chunk_overlap_tokens
+        )
 
     def extract_claims_from_chunk(self, chunk: str) -> List[str]:
         """
@@ -146,27 +198,27 @@ Format: ["claim1", "claim2", "claim3"]""")
             List of extracted claims
         """
         try:
-            # Create the chain
-            chain = self.claim_extraction_prompt | self.llm | self.output_parser
+            # Invoke the chain (through the shared response cache)
+            content = cached_invoke(
+                "claim_extractor", self.claim_extraction_prompt, self.llm, {"text": chunk}, "openai"
+            )
             
-            # Invoke the chain
-            content = chain.invoke({"text": chunk})
-            
-            # Parse the response to extract the list
-            # Handle cases where GPT returns the list with or without markdown
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("python"):
-                    content = content[6:]
-                content = content.strip()
-            
-            # Safely evaluate the list
-            claims = eval(content)
+            claims, _ = parse_claims(content, "claim_extraction")
+            return claims
+                
+        except Exception as e:
+            print(f"Error extracting claims: {e}")
+            return []
+    
+    async def aextract_claims_from_chunk(self, chunk: str) -> List[str]:
+        """Async extract_claims_from_chunk, using ainvoke."""
+        try:
+            content = await acached_invoke(
+                "claim_extractor", self.claim_extraction_prompt, self.llm, {"text": chunk}, "openai"
+            )
             
-            if isinstance(claims, list):
-                return [str(claim) for claim in claims]
-            else:
-                return []
+            claims, _ = parse_claims(content, "claim_extraction")
+            return claims
                 
         except Exception as e:
             print(f"Error extracting claims: {e}")
@@ -185,8 +237,7 @@ Format: ["claim1", "claim2", "claim3"]""")
         """
         print(f"Scraping URL: {url}")
         
-        scraper = WebScraper()
-        scraped_data = scraper.scrape_url(url)
+        scraped_data = self.scraper.scrape_url(url, store=False)
         
         if not scraped_data['content']:
             print(f"Failed to scrape content from {url}")
@@ -238,19 +289,54 @@ Format: ["claim1", "claim2", "claim3"]""")
         
         return {key_name: all_claims}
     
-    def extract_website_claims(self, urls: List[str], original_claims: List[str]) -> Dict[str, List[str]]:
+    async def aextract_claims(self, text: str, key_name: str = "user") -> Dict[str, List[str]]:
+        """
+        Async extract_claims: chunks are extracted concurrently on the event loop.
+        
+        Args:
+            text: The input text to extract claims from
+            key_name: The key name for the output dictionary (default: "user")
+            
+        Returns:
+            Dictionary with key_name as key and list of all extracted claims as value
+        """
+        chunks = self.split_text_into_chunks(text)
+        if not chunks:
+            raise ValueError("No text chunks to process. Input text may be empty.")
+        
+        print(f"Processing {len(chunks)} chunk(s) concurrently...")
+        results = await asyncio.gather(*(self.aextract_claims_from_chunk(chunk) for chunk in chunks))
+        all_claims = [claim for claims in results for claim in claims]
+        print(f"Total claims extracted: {len(all_claims)}")
+        
+        return {key_name: all_claims}
+    
+    def extract_website_claims(
+        self,
+        urls: List[str],
+        original_claims: List[str],
+        on_result: Optional[Callable[[str, List[str]], None]] = None,
+        pages: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Dict[str, List[str]]:
         """
         Scrape websites and extract claims related to the original claims.
         
+        Pages are scraped concurrently; their relevant passages are then packed
+        several to a prompt (see website_batch_size), falling back to one call
+        per page for anything a packed call fails to return.
+        
         Args:
             urls: List of URLs to scrape
             original_claims: List of original user claims to compare against
+            on_result: Optional callback called with (url, claims) as each URL finishes
+            pages: Page text already at hand per URL (search results with 'title' and
+                'content'); those URLs are not scraped again
             
         Returns:
             Dictionary mapping each URL to its list of extracted claims
         """
-        scraper = WebScraper()
         url_claims = {}
+        pages = pages or {}
         
         print(f"\nProcessing {len(urls)} website(s) for claims related to {len(original_claims)} original claim(s)\n")
         
@@ -258,70 +344,367 @@ Format: ["claim1", "claim2", "claim3"]""")
         if not urls:
             raise ValueError("No URLs provided for website claims extraction")
         
+        def finish(url: str, claims: List[str]):
+            url_claims[url] = claims
+            print(f"[OK] Extracted {len(claims)} claim(s) from {url}")
+            if on_result:
+                on_result(url, claims)
+        
         with ThreadPoolExecutor(max_workers=min(len(urls), 5)) as executor:
             future_to_url = {
-                executor.submit(self._process_single_url, url, original_claims, scraper): url
+                executor.submit(self.prepare_website_content, url, original_claims, page=pages.get(url)): url
                 for url in urls
             }
             
+            pages = {}
             for future in as_completed(future_to_url):
                 url = future_to_url[future]
                 try:
-                    result = future.result()
-                    url_claims[url] = result['claims']
-                    print(f"[OK] Extracted {len(result['claims'])} claim(s) from {url}")
+                    pages[url] = future.result()
                 except Exception as e:
                     print(f"[ERROR] Error processing {url}: {e}")
-                    url_claims[url] = []
+                    pages[url] = ""
+            
+            future_to_batch = {
+                executor.submit(self.extract_claims_from_website_batch, batch, original_claims): batch
+                for batch in self.pack_website_batches(pages)
+            }
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Error processing {len(batch)} website(s): {e}")
+                    results = {}
+                for url in batch:
+                    finish(url, results.get(url, []))
         
         return url_claims
     
-    def _process_single_url(self, url: str, original_claim: List[str], scraper: WebScraper) -> Dict[str, List[str]]:
+    async def aextract_website_claims(
+        self,
+        urls: List[str],
+        original_claims: List[str],
+        on_result: Optional[Callable[[str, List[str]], None]] = None,
+        pages: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Dict[str, List[str]]:
         """
-        Process a single URL: scrape and extract claims.
+        Async extract_website_claims: pages are scraped and the packed
+        extraction calls are awaited concurrently on the event loop.
+        
+        Args:
+            urls: List of URLs to scrape
+            original_claims: List of original user claims to compare against
+            on_result: Optional callback called with (url, claims) as each URL finishes
+            pages: Page text already at hand per URL, as for extract_website_claims
+            
+        Returns:
+            Dictionary mapping each URL to its list of extracted claims
+        """
+        if not urls:
+            raise ValueError("No URLs provided for website claims extraction")
+        
+        print(f"\nProcessing {len(urls)} website(s) for claims related to {len(original_claims)} original claim(s)\n")
+        pages = pages or {}
+        
+        async def prepare(url: str) -> str:
+            try:
+                return await self.aprepare_website_content(url, original_claims, pages.get(url))
+            except Exception as e:
+                print(f"[ERROR] Error processing {url}: {e}")
+                return ""
+        
+        contents = await asyncio.gather(*(prepare(url) for url in urls))
+        url_claims = {}
+        for next_done in asyncio.as_completed([
+            self.aextract_claims_from_website_batch(batch, original_claims)
+            for batch in self.pack_website_batches(dict(zip(urls, contents)))
+        ]):
+            for url, claims in (await next_done).items():
+                url_claims[url] = claims
+                print(f"[OK] Extracted {len(claims)} claim(s) from {url}")
+                if on_result:
+                    on_result(url, claims)
+        
+        return url_claims
+    
+    def extract_single_website_claims(self, url: str, original_claims: List[str]) -> List[str]:
+        """
+        Scrape one URL and extract the claims related to the original claims.
         
         Args:
             url: URL to process
-            original_claim: List of original user claims
-            scraper: WebScraper instance
+            original_claims: List of original user claims
             
         Returns:
-            Dictionary with 'claims' key
+            List of claims extracted from the website (empty on failure)
         """
-        # Scrape the website
-        scraped_data = scraper.scrape_url(url)
-        content = scraped_data['content']
+        try:
+            return self._process_single_url(url, original_claims, self.scraper)["claims"]
+        except Exception as e:
+            print(f"[ERROR] Error processing {url}: {e}")
+            return []
+    
+    def prepare_website_content(
+        self,
+        url: str,
+        original_claims: List[str],
+        scraper: WebScraper = None,
+        page: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Scrape a URL and keep only the passages relevant to the original claims.
         
+        Args:
+            url: URL to scrape
+            original_claims: List of original user claims
+            scraper: WebScraper instance (default: the shared one)
+            page: Page text already at hand ('title' and 'content', e.g. from the
+                search results); the URL is then not scraped
+            
+        Returns:
+            Page excerpt within website_content_tokens (empty if nothing was scraped)
+        """
+        scraper = scraper or self.scraper
+        if page and page.get("content"):
+            scraped_data = {"url": url, "title": page.get("title", ""), "content": page["content"]}
+            scraper.store_page(scraped_data)
+        else:
+            scraped_data = scraper.scrape_url(url)
+        content = scraped_data['content']
         if not content:
-            return {"claims": []}
+            return ""
+        return self._select_excerpt(content, original_claims)
+    
+    async def aprepare_website_content(
+        self, url: str, original_claims: List[str], page: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Async prepare_website_content; storing the page and passage selection run on worker threads."""
+        if page and page.get("content"):
+            scraped_data = {"url": url, "title": page.get("title", ""), "content": page["content"]}
+            await asyncio.to_thread(self.scraper.store_page, scraped_data)
+        else:
+            scraped_data = await self.scraper.ascrape_url(url)
+        content = scraped_data['content']
+        if not content:
+            return ""
+        return await asyncio.to_thread(self._select_excerpt, content, original_claims)
+    
+    def pack_website_batches(self, pages: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Group page excerpts into batches for packed extraction calls.
         
+        Pages are taken in order and a new batch is started when the next page
+        would exceed website_batch_size pages or website_batch_tokens tokens.
+        Empty pages are kept in the batch they fall into but cost nothing.
+        
+        Args:
+            pages: Dictionary mapping each URL to its page excerpt
+            
+        Returns:
+            List of {url: excerpt} batches
+        """
+        batches: List[Dict[str, str]] = []
+        current: Dict[str, str] = {}
+        current_tokens = 0
+        for url, content in pages.items():
+            tokens = self.excerpt_tokens(content)
+            if current and (
+                len(current) >= self.website_batch_size
+                or current_tokens + tokens > self.website_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = {}, 0
+            current[url] = content
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _website_content_inputs(self, content: str, original_claims: List[str]) -> Dict[str, str]:
         # Extract claims related to ALL original claims
-        original_claims_text = "\n".join([f"- {claim}" for claim in original_claim])
+        original_claims_text = "\n".join([f"- {claim}" for claim in original_claims])
+        inputs = {
+            "original_claims_text": original_claims_text,
+            "content": content
+        }
+        increment("website_claims.llm_calls")
+        increment(
+            "website_claims.prompt_tokens",
+            self._website_prompt_tokens + self.excerpt_tokens(original_claims_text) + self.excerpt_tokens(content),
+        )
+        return inputs
+    
+    def extract_claims_from_website_content(self, content: str, original_claims: List[str]) -> List[str]:
+        """
+        Extract claims related to the original claims from one page excerpt.
+        
+        Args:
+            content: Page excerpt from prepare_website_content
+            original_claims: List of original user claims
+            
+        Returns:
+            List of extracted claims (empty on failure)
+        """
+        if not content:
+            return []
         
         try:
-            # Create the chain
-            chain = self.website_claim_prompt | self.llm | self.output_parser
+            inputs = self._website_content_inputs(content, original_claims)
+            # Invoke the chain (through the shared response cache)
+            content_response = cached_invoke(
+                "claim_extractor", self.website_claim_prompt, self.llm, inputs, "openai"
+            )
             
-            # Invoke the chain
-            content_response = chain.invoke({
-                "original_claims_text": original_claims_text,
-                "content": content[:15000]
-            })
+            claims, _ = parse_claims(content_response, "website_claims")
+            return claims
             
-            # Parse response
-            if content_response.startswith("```"):
-                content_response = content_response.split("```")[1]
-                if content_response.startswith("python"):
-                    content_response = content_response[6:]
-                content_response = content_response.strip()
+        except Exception as e:
+            print(f"Error extracting claims from URL: {e}")
+            return []
+    
+    async def aextract_claims_from_website_content(self, content: str, original_claims: List[str]) -> List[str]:
+        """Async extract_claims_from_website_content, using ainvoke."""
+        if not content:
+            return []
+        
+        try:
+            inputs = self._website_content_inputs(content, original_claims)
+            content_response = await acached_invoke(
+                "claim_extractor", self.website_claim_prompt, self.llm, inputs, "openai"
+            )
             
-            claims = eval(content_response)
+            claims, _ = parse_claims(content_response, "website_claims")
+            return claims
             
-            if isinstance(claims, list):
-                return {"claims": [str(claim) for claim in claims]}
+        except Exception as e:
+            print(f"Error extracting claims from URL: {e}")
+            return []
+    
+    def _website_batch_inputs(self, filled: List[Tuple[str, str]], original_claims: List[str]) -> Dict[str, str]:
+        original_claims_text = "\n".join([f"- {claim}" for claim in original_claims])
+        sources_text = "\n\n".join(
+            f"SOURCE {i} ({url}):\n{content}" for i, (url, content) in enumerate(filled, 1)
+        )
+        inputs = {
+            "original_claims_text": original_claims_text,
+            "sources_text": sources_text
+        }
+        increment("website_claims.llm_calls")
+        increment("website_claims.batch_calls")
+        increment("website_claims.batch_pages", len(filled))
+        # Only the short source headers are encoded; excerpts were counted when budgeted
+        headers = self.count_tokens("\n\n".join(f"SOURCE {i} ({url}):" for i, (url, _) in enumerate(filled, 1)))
+        increment(
+            "website_claims.prompt_tokens",
+            self._website_batch_prompt_tokens
+            + self.excerpt_tokens(original_claims_text)
+            + sum(self.excerpt_tokens(content) for _, content in filled)
+            + headers,
+        )
+        return inputs
+    
+    @staticmethod
+    def _website_batch_missing(
+        parsed: Dict[int, List[str]], filled: List[Tuple[str, str]], results: Dict[str, List[str]]
+    ) -> List[Tuple[str, str]]:
+        """Record the parsed claims per URL and return the pages the response left out."""
+        missing = []
+        for i, (url, content) in enumerate(filled, 1):
+            if i in parsed:
+                results[url] = parsed[i]
             else:
-                return {"claims": []}
+                missing.append((url, content))
+        
+        if missing:
+            print(f"Packed extraction missed {len(missing)}/{len(filled)} website(s), retrying them one by one")
+            increment("website_claims.batch_fallbacks", len(missing))
+        return missing
+    
+    def extract_claims_from_website_batch(self, pages: Dict[str, str], original_claims: List[str]) -> Dict[str, List[str]]:
+        """
+        Extract claims from several page excerpts with one packed LLM call.
+        
+        Each page is sent as a numbered source and the model returns claims per
+        source number. If the call or its parsing fails, or a source is left
+        out of the response, those pages are retried with one call each.
+        
+        Args:
+            pages: Dictionary mapping each URL to its page excerpt (see pack_website_batches)
+            original_claims: List of original user claims
             
+        Returns:
+            Dictionary mapping each URL to its list of extracted claims
+        """
+        results = {url: [] for url, content in pages.items() if not content}
+        filled = [(url, content) for url, content in pages.items() if content]
+        if len(filled) == 1:
+            url, content = filled[0]
+            results[url] = self.extract_claims_from_website_content(content, original_claims)
+            return results
+        if not filled:
+            return results
+        
+        parsed: Dict[int, List[str]] = {}
+        try:
+            inputs = self._website_batch_inputs(filled, original_claims)
+            response = cached_invoke(
+                "claim_extractor", self.website_batch_prompt, self.batch_llm, inputs, "openai"
+            )
+            
+            parsed, _ = parse_source_claims(response, "website_claims_batch")
         except Exception as e:
-            print(f"Error extracting claims from URL: {e}")
-            return {"claims": []}
+            print(f"Error extracting claims from {len(filled)} websites: {e}")
+        
+        for url, content in self._website_batch_missing(parsed, filled, results):
+            results[url] = self.extract_claims_from_website_content(content, original_claims)
+        
+        return {url: results.get(url, []) for url in pages}
+    
+    async def aextract_claims_from_website_batch(
+        self, pages: Dict[str, str], original_claims: List[str]
+    ) -> Dict[str, List[str]]:
+        """Async extract_claims_from_website_batch, using ainvoke; fallbacks run concurrently."""
+        results = {url: [] for url, content in pages.items() if not content}
+        filled = [(url, content) for url, content in pages.items() if content]
+        if len(filled) == 1:
+            url, content = filled[0]
+            results[url] = await self.aextract_claims_from_website_content(content, original_claims)
+            return results
+        if not filled:
+            return results
+        
+        parsed: Dict[int, List[str]] = {}
+        try:
+            inputs = self._website_batch_inputs(filled, original_claims)
+            response = await acached_invoke(
+                "claim_extractor", self.website_batch_prompt, self.batch_llm, inputs, "openai"
+            )
+            
+            parsed, _ = parse_source_claims(response, "website_claims_batch")
+        except Exception as e:
+            print(f"Error extracting claims from {len(filled)} websites: {e}")
+        
+        missing = self._website_batch_missing(parsed, filled, results)
+        retried = await asyncio.gather(
+            *(self.aextract_claims_from_website_content(content, original_claims) for _, content in missing)
+        )
+        for (url, _), claims in zip(missing, retried):
+            results[url] = claims
+        
+        return {url: results.get(url, []) for url in pages}
+    
+    def _process_single_url(self, url: str, original_claim: List[str], scraper: WebScraper) -> Dict[str, List[str]]:
+        """
+        Process a single URL: scrape and extract claims.
+        
+        Args:
+            url: URL to process
+            original_claim: List of original user claims
+            scraper: WebScraper instance
+            
+        Returns:
+            Dictionary with 'claims' key
+        """
+        content = self.prepare_website_content(url, original_claim, scraper)
+        return {"claims": self.extract_claims_from_website_content(content, original_claim)}
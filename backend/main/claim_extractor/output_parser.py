@@ -0,0 +1,206 @@
+import re
+import ast
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from main.metrics import increment
+
+# JSON schema the extraction prompts ask for, sent as the OpenAI response_format
+CLAIMS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "claims",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"claims": {"type": "array", "items": {"type": "string"}}},
+            "required": ["claims"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Schema for packed website extraction: claims per numbered source
+BATCH_CLAIMS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "source_claims",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "sources": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "source": {"type": "integer"},
+                            "claims": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "required": ["source", "claims"],
+                        "additionalProperties": False,
+                    },
+                }
+            },
+            "required": ["sources"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_fence_re = re.compile(r"^```[a-zA-Z]*\s*|\s*```\s*$")
+_trailing_comma_re = re.compile(r",\s*([\]}])")
+_list_item_re = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+(.+?)\s*$")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+
+def _as_claims(value: Any) -> Optional[List[str]]:
+    """Accept {"claims": [...]}, a bare list, or a single-key object holding a list."""
+    if isinstance(value, dict):
+        if "claims" in value:
+            value = value["claims"]
+        elif len(value) == 1:
+            value = next(iter(value.values()))
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return None
+
+
+def _as_source_claims(value: Any) -> Optional[Dict[int, List[str]]]:
+    """Accept {"sources": [{"source": n, "claims": [...]}]}, a bare list of those, or {"n": [...]}."""
+    if isinstance(value, dict) and "sources" in value:
+        value = value["sources"]
+    if isinstance(value, dict):
+        value = [{"source": key, "claims": item} for key, item in value.items()]
+    if not isinstance(value, list):
+        return None
+
+    results = {}
+    for item in value:
+        if not isinstance(item, dict):
+            continue
+        try:
+            source = int(item.get("source"))
+        except (TypeError, ValueError):
+            continue
+        claims = _as_claims(item.get("claims"))
+        if claims is not None:
+            results[source] = claims
+    return results or None
+
+
+def _loads(text: str, convert: Callable[[Any], Any] = _as_claims) -> Any:
+    try:
+        return convert(json.loads(text))
+    except (ValueError, TypeError):
+        pass
+    try:
+        # Python-style lists with single quotes; literal_eval never executes code
+        return convert(ast.literal_eval(text))
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+def _close_truncated(text: str) -> str:
+    """Close strings and brackets left open by output cut off mid-way."""
+    stack = []
+    in_string = False
+    escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "[{":
+            stack.append("]" if ch == "[" else "}")
+        elif ch in "]}" and stack:
+            stack.pop()
+    if in_string:
+        text += '"'
+    text = text.rstrip().rstrip(",")
+    return text + "".join(reversed(stack))
+
+
+def _repair(text: str, convert: Callable[[Any], Any] = _as_claims, list_items: bool = True) -> Any:
+    candidate = text.translate(_SMART_QUOTES)
+    start = min((i for i in (candidate.find("{"), candidate.find("[")) if i >= 0), default=-1)
+    if start >= 0:
+        candidate = candidate[start:]
+        end = max(candidate.rfind("}"), candidate.rfind("]"))
+        for attempt in (candidate[:end + 1] if end >= 0 else candidate, candidate):
+            attempt = _trailing_comma_re.sub(r"\1", attempt)
+            claims = _loads(attempt, convert)
+            if claims is None:
+                claims = _loads(_close_truncated(attempt), convert)
+            if claims is not None:
+                return claims
+
+    if not list_items:
+        return None
+    # Plain bulleted or numbered list
+    items = [match.group(1).strip().strip("\"'") for match in map(_list_item_re.match, text.splitlines()) if match]
+    return items or None
+
+
+def parse_claims(response: str, component: str = "claim_extraction") -> Tuple[List[str], str]:
+    """
+    Parse a model response into a list of claims without another LLM call.
+
+    Tries strict JSON first, then local repairs for near-valid output:
+    markdown fences, Python-style quoting, smart quotes, trailing commas,
+    surrounding prose, truncated output and plain bulleted lists.
+
+    Args:
+        response: Raw model output
+        component: Counter prefix, e.g. "claim_extraction" or "website_claims"
+
+    Returns:
+        (claims, status) where status is "ok", "repaired" or "failed";
+        claims is empty when parsing failed
+    """
+    claims, status = _parse(response, component, _as_claims, list_items=True)
+    return (claims if claims is not None else []), status
+
+
+def parse_source_claims(response: str, component: str = "website_claims_batch") -> Tuple[Dict[int, List[str]], str]:
+    """
+    Parse a packed website extraction response into claims per source number.
+
+    Applies the same local repairs as parse_claims. Sources the model left
+    out are simply missing from the result so callers can retry them alone.
+
+    Args:
+        response: Raw model output
+        component: Counter prefix
+
+    Returns:
+        (claims by 1-based source number, status) where status is "ok",
+        "repaired" or "failed"
+    """
+    results, status = _parse(response, component, _as_source_claims, list_items=False)
+    return (results if results is not None else {}), status
+
+
+def _parse(response: str, component: str, convert: Callable[[Any], Any], list_items: bool) -> Tuple[Any, str]:
+    text = _fence_re.sub("", (response or "").strip()).strip()
+    value = None
+    try:
+        value = convert(json.loads(text))
+    except ValueError:
+        pass
+
+    if value is not None:
+        status = "ok"
+    else:
+        value = _repair(text, convert, list_items)
+        status = "repaired" if value is not None else "failed"
+        if value is None:
+            print(f"Could not parse {component} output: {text[:200]!r}")
+
+    increment(f"{component}.parse_{status}")
+    return value, status
@@ -0,0 +1,123 @@
+import re
+import math
+from collections import Counter
+from typing import List, Tuple
+
+from main.claim_index import terms
+from main.metrics import increment
+
+_block_re = re.compile(r"\n\s*\n|\n(?=\s*[-*•#])")
+_sentence_re = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_passages(content: str, max_words: int = 120) -> List[str]:
+    """
+    Split page text into passages: paragraphs, with long paragraphs cut into
+    runs of whole sentences of about max_words words.
+    """
+    passages = []
+    for block in _block_re.split(content):
+        block = " ".join(block.split())
+        if not block:
+            continue
+        if len(block.split()) <= max_words:
+            passages.append(block)
+            continue
+        current: List[str] = []
+        words = 0
+        for sentence in _sentence_re.split(block):
+            sentence_words = len(sentence.split())
+            if current and words + sentence_words > max_words:
+                passages.append(" ".join(current))
+                current, words = [], 0
+            current.append(sentence)
+            words += sentence_words
+        if current:
+            passages.append(" ".join(current))
+    return passages
+
+
+def bm25_scores(passages: List[List[str]], query: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """
+    Okapi BM25 score of each passage (as a list of terms) for the query terms.
+    """
+    if not passages:
+        return []
+    count = len(passages)
+    avg_length = sum(len(passage) for passage in passages) / count or 1.0
+    document_frequency = Counter(term for passage in passages for term in set(passage))
+    query_terms = set(query)
+    idf = {
+        term: math.log(1 + (count - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+        for term in query_terms
+    }
+
+    scores = []
+    for passage in passages:
+        frequencies = Counter(passage)
+        norm = k1 * (1 - b + b * len(passage) / avg_length)
+        scores.append(sum(
+            idf[term] * frequencies[term] * (k1 + 1) / (frequencies[term] + norm)
+            for term in query_terms
+            if term in frequencies
+        ))
+    return scores
+
+
+def select_passages(content: str, claims: List[str], encoding, max_tokens: int) -> Tuple[str, int]:
+    """
+    Pack the page passages most relevant to the claims into a token budget.
+
+    Passages are ranked with BM25 against the terms of all claims (figures
+    included), added best first while they fit in max_tokens, and returned
+    in page order so the excerpt still reads naturally. Pages with no
+    matching passage fall back to their opening passages.
+
+    Args:
+        content: Scraped page text
+        claims: Claims the evidence should relate to
+        encoding: tiktoken Encoding used to count tokens
+        max_tokens: Token budget for the returned excerpt
+
+    Returns:
+        (excerpt, tokens): the selected passages joined by blank lines, and
+        the tokens they use out of the budget
+    """
+    passages = split_passages(content)
+    if not passages:
+        return "", 0
+
+    query = [term for claim in claims for term in terms(claim)]
+    passage_terms = [terms(passage) for passage in passages]
+    scores = bm25_scores(passage_terms, query)
+    if any(score > 0 for score in scores):
+        order = sorted(
+            (i for i in range(len(passages)) if scores[i] > 0),
+            key=lambda i: scores[i],
+            reverse=True,
+        )
+    else:
+        order = list(range(len(passages)))
+
+    selected = []
+    used = 0
+    for i in order:
+        tokens = len(encoding.encode(passages[i])) + 1
+        if used + tokens > max_tokens:
+            if used == 0:
+                # Best passage alone is over budget: keep its opening
+                selected.append(i)
+                passages[i] = encoding.decode(encoding.encode(passages[i])[:max_tokens])
+                used = max_tokens
+                break
+            continue
+        selected.append(i)
+        used += tokens
+        if used >= max_tokens:
+            break
+
+    increment("passage_selection.pages")
+    increment("passage_selection.passages_kept", len(selected))
+    increment("passage_selection.passages_total", len(passages))
+    increment("passage_selection.tokens", used)
+    return "\n\n".join(passages[i] for i in sorted(selected)), used
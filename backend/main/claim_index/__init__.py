@@ -0,0 +1,3 @@
+from .claim_index import ClaimIndex, tokenize, terms, jaccard, anchors, anchors_agree
+
+__all__ = ["ClaimIndex", "tokenize", "terms", "jaccard", "anchors", "anchors_agree"]
@@ -0,0 +1,314 @@
+import os
+import re
+import time
+import random
+import hashlib
+import threading
+from array import array
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from database.local_db import connect
+from main.fingerprint import claim_key, normalize_text
+
+_token_re = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*%?")
+_entity_re = re.compile(r"\b[A-Z][a-zA-Z]+\b")
+
+# Words that carry no meaning for matching claims
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "in", "on", "at", "to", "for", "by", "with", "from",
+    "as", "is", "was", "are", "were", "be", "been", "being", "has", "have", "had", "that",
+    "this", "these", "those", "it", "its", "their", "there", "which", "who", "than", "into",
+    "over", "about", "according", "reportedly", "said", "says", "also", "during",
+}
+
+# Words that flip a claim's meaning; claims must agree on them to match
+NEGATIONS = {"not", "no", "never", "none", "nor", "without", "denied", "denies", "false"}
+
+# Irregular forms and near-synonyms common in factual claims, folded to one word
+CANONICAL_WORDS = {
+    "grew": "grow", "grown": "grow", "growth": "grow", "expanded": "grow",
+    "rose": "rise", "risen": "rise", "increase": "rise", "increased": "rise", "up": "rise",
+    "fell": "fall", "fallen": "fall", "decline": "fall", "declined": "fall", "drop": "fall",
+    "dropped": "fall", "decrease": "fall", "decreased": "fall", "down": "fall",
+    "won": "win", "killed": "kill", "died": "die", "dead": "die", "death": "die", "deaths": "die",
+    "percent": "%", "per": "%", "cent": "%",
+}
+
+# Words stating a direction of change; claims must agree on these to match
+DIRECTIONS = {
+    **dict.fromkeys((
+        "rise", "rises", "rose", "risen", "rising", "increase", "increases", "increased", "increasing",
+        "grow", "grows", "grew", "grown", "growing", "growth", "expanded", "gain", "gains", "gained",
+        "jump", "jumps", "jumped", "surge", "surges", "surged", "climb", "climbs", "climbed",
+        "soar", "soars", "soared", "up", "higher", "more", "above", "exceeded", "record",
+    ), "up"),
+    **dict.fromkeys((
+        "fall", "falls", "fell", "fallen", "falling", "decline", "declines", "declined", "declining",
+        "drop", "drops", "dropped", "decrease", "decreases", "decreased", "shrink", "shrinks", "shrank",
+        "shrunk", "plunge", "plunged", "slump", "slumped", "lose", "loses", "lost", "loss", "down",
+        "lower", "less", "fewer", "below",
+    ), "down"),
+}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _stem(token: str) -> str:
+    for suffix in ("ations", "ation", "ings", "ing", "ies", "th", "ed", "es", "s"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[: -len(suffix)]
+    return token
+
+
+def _normalize_token(token: str) -> str:
+    """Normalized form of a raw token, or "" if it carries no meaning."""
+    if any(ch.isdigit() for ch in token):
+        return token.rstrip("%").replace(",", "")
+    if token in STOPWORDS or len(token) < 2:
+        return ""
+    token = CANONICAL_WORDS.get(token, token)
+    return "" if token == "%" else _stem(token)
+
+
+def terms(text: str) -> List[str]:
+    """Normalized terms of a text in order, with repeats (for lexical ranking)."""
+    result = []
+    for token in _token_re.findall(normalize_text(text)):
+        if token not in NEGATIONS:
+            term = _normalize_token(token)
+            if term:
+                result.append(term)
+    return result
+
+
+def tokenize(claim: str) -> Tuple[Set[str], FrozenSet[str], bool]:
+    """
+    Split a claim into word shingles, its figures and its polarity.
+
+    Returns:
+        (shingles, numbers, negated): stemmed content words, the normalized
+        tokens containing digits ("7.2%" -> "7.2", "1,000" -> "1000"), and
+        whether the claim contains a negation
+    """
+    shingles: Set[str] = set()
+    numbers: Set[str] = set()
+    negated = False
+    for token in _token_re.findall(normalize_text(claim)):
+        if token in NEGATIONS:
+            negated = True
+            continue
+        term = _normalize_token(token)
+        if not term:
+            continue
+        if any(ch.isdigit() for ch in token):
+            numbers.add(term)
+        shingles.add(term)
+    return shingles, frozenset(numbers), negated
+
+
+def anchors(claim: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Named entities and directions of change in a claim.
+
+    Returns:
+        (entities, directions): normalized capitalized words ("Apple" ->
+        "apple"), and "up"/"down" for each direction the claim states
+        ("rose", "grew" -> "up"; "fell", "declined" -> "down")
+    """
+    entities = set()
+    for word in _entity_re.findall(claim):
+        lowered = word.lower()
+        if lowered in NEGATIONS or lowered in DIRECTIONS:
+            continue
+        term = _normalize_token(lowered)
+        if term:
+            entities.add(term)
+    directions = {DIRECTIONS[token] for token in _token_re.findall(normalize_text(claim)) if token in DIRECTIONS}
+    return frozenset(entities), frozenset(directions)
+
+
+def anchors_agree(
+    shingles: Set[str],
+    claim_anchors: Tuple[FrozenSet[str], FrozenSet[str]],
+    other_shingles: Set[str],
+    other_anchors: Tuple[FrozenSet[str], FrozenSet[str]],
+) -> bool:
+    """
+    Whether two claims name the same entities and state the same direction.
+
+    An entity of either claim must appear among the other's words in any
+    case, so "Apple revenue rose" agrees with "Revenue at Apple rose" but
+    not with "Microsoft revenue rose" or "Apple revenue fell".
+    """
+    entities, directions = claim_anchors
+    other_entities, other_directions = other_anchors
+    return directions == other_directions and entities <= other_shingles and other_entities <= shingles
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class ClaimIndex:
+    """
+    Near-duplicate index over previously verified claims (MinHash LSH).
+
+    Catches LLM paraphrases such as "GDP grew 7.2% in Q2" vs "Q2 GDP growth
+    was 7.2%". Shingling is number-aware: the figures of a claim, its
+    negation and its direction of change are part of every bucket key, and
+    candidates must also name the same entities, so claims that differ in
+    any number, in polarity, in direction ("rose" vs "fell") or in who they
+    are about never match, however similar the wording.
+
+    Signatures are persisted in SQLite and the buckets are rebuilt from them
+    on startup without rehashing.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = None,
+        seed: int = 1,
+    ):
+        """
+        Initialize the index and load persisted claims.
+
+        Args:
+            path: SQLite file (default: CLAIM_INDEX_PATH or claim_index.sqlite3 in the data dir)
+            num_perm: MinHash signature length
+            bands: LSH bands; num_perm must be divisible by it
+            threshold: Minimum word Jaccard similarity for a match (default: CLAIM_INDEX_THRESHOLD or 0.7)
+            seed: Seed for the hash permutations; must stay fixed for persisted signatures
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.path = path or os.getenv("CLAIM_INDEX_PATH", "claim_index.sqlite3")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold if threshold is not None else float(os.getenv("CLAIM_INDEX_THRESHOLD", "0.7"))
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+        self._lock = threading.Lock()
+        self._claims: Dict[str, str] = {}
+        self._buckets: Dict[Tuple, Set[str]] = {}
+        self._conn = connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS claim_index (
+                claim_key TEXT PRIMARY KEY,
+                claim TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                added_at REAL NOT NULL
+            )
+        """)
+        self._load()
+
+    def _load(self):
+        started = time.monotonic()
+        rows = self._conn.execute("SELECT claim_key, claim, signature FROM claim_index").fetchall()
+        with self._lock:
+            for row in rows:
+                signature = array("Q")
+                signature.frombytes(row["signature"])
+                if len(signature) != self.num_perm:
+                    continue
+                _, numbers, negated = tokenize(row["claim"])
+                _, directions = anchors(row["claim"])
+                self._insert_locked(row["claim_key"], row["claim"], (numbers, negated, directions), signature)
+        print(f"Loaded {len(self._claims)} claims into near-duplicate index in {time.monotonic() - started:.2f}s")
+
+    def _signature(self, shingles: Set[str]) -> array:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+            for shingle in shingles
+        ] or [0]
+        return array("Q", (
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms
+        ))
+
+    def _band_keys(self, exact: Tuple, signature: array) -> List[Tuple]:
+        numbers, negated, directions = exact
+        prefix = (tuple(sorted(numbers)), negated, tuple(sorted(directions)))
+        return [
+            (band, prefix, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def _insert_locked(self, key: str, claim: str, exact: Tuple, signature: array):
+        self._claims[key] = claim
+        for band_key in self._band_keys(exact, signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def add(self, claim: str) -> str:
+        """
+        Index a verified claim.
+
+        Returns:
+            The claim's key
+        """
+        key = claim_key(claim)
+        if key in self._claims:
+            return key
+        shingles, numbers, negated = tokenize(claim)
+        _, directions = anchors(claim)
+        signature = self._signature(shingles)
+        with self._lock:
+            self._insert_locked(key, claim, (numbers, negated, directions), signature)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO claim_index (claim_key, claim, signature, added_at) VALUES (?, ?, ?, ?)",
+                (key, claim, signature.tobytes(), time.time()),
+            )
+        return key
+
+    def match(self, claim: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """
+        Find indexed paraphrases of a claim.
+
+        Args:
+            claim: Claim to look up
+            limit: Maximum number of matches
+
+        Returns:
+            List of (claim_key, similarity), best first; an exact match has similarity 1.0
+        """
+        key = claim_key(claim)
+        shingles, numbers, negated = tokenize(claim)
+        if not shingles:
+            return []
+        claim_anchors = anchors(claim)
+        exact = (numbers, negated, claim_anchors[1])
+        signature = self._signature(shingles)
+
+        with self._lock:
+            if key in self._claims:
+                return [(key, 1.0)]
+            candidates: Set[str] = set()
+            for band_key in self._band_keys(exact, signature):
+                candidates |= self._buckets.get(band_key, set())
+            candidate_claims = [(candidate, self._claims[candidate]) for candidate in candidates]
+
+        matches = []
+        for candidate, candidate_claim in candidate_claims:
+            candidate_shingles, candidate_numbers, candidate_negated = tokenize(candidate_claim)
+            # Bucket keys already agree on figures, polarity and direction; re-check in
+            # case of a hash collision, and require the same entities
+            if candidate_numbers != numbers or candidate_negated != negated:
+                continue
+            if not anchors_agree(shingles, claim_anchors, candidate_shingles, anchors(candidate_claim)):
+                continue
+            similarity = jaccard(shingles, candidate_shingles)
+            if similarity >= self.threshold:
+                matches.append((candidate, similarity))
+        matches.sort(key=lambda item: item[1], reverse=True)
+        return matches[:limit]
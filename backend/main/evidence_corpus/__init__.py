@@ -0,0 +1,3 @@
+from .evidence_corpus import EvidenceCorpus
+
+__all__ = ["EvidenceCorpus"]
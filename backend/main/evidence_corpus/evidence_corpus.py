@@ -0,0 +1,204 @@
+import os
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+from database.local_db import connect
+from main.claim_index import terms, tokenize
+from main.fingerprint import normalize_url
+from main.metrics import increment
+
+
+class EvidenceCorpus:
+    """
+    Local corpus of scraped source pages with a BM25 full-text index.
+
+    Every evidence page the scraper fetches is stored with its cleaned text
+    in SQLite, and its normalized terms (the same stemming and word folding
+    as ClaimIndex) are indexed with FTS5. Claims searched again within the
+    freshness window, typically the same breaking story submitted by many
+    users, are answered from the corpus instead of a Tavily search, and a
+    stored page is reused instead of being extracted again.
+
+    A claim only counts as answered locally when at least min_hits fresh
+    pages contain most of its terms and every figure it mentions, so a
+    thinly covered or outdated topic still goes to Tavily.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        max_age_seconds: int = None,
+        min_hits: int = None,
+        min_coverage: float = None,
+        max_pages: int = None,
+    ):
+        """
+        Initialize the corpus.
+
+        Args:
+            path: SQLite file (default: EVIDENCE_CORPUS_PATH or evidence_corpus.sqlite3 in the data dir)
+            max_age_seconds: Seconds a stored page counts as fresh evidence, 0 disables the corpus
+                (default: EVIDENCE_MAX_AGE_SECONDS or 86400)
+            min_hits: Fresh matching pages needed to skip the Tavily search (default: EVIDENCE_MIN_HITS or 3)
+            min_coverage: Share of a claim's terms a page must contain to match (default: EVIDENCE_MIN_COVERAGE or 0.7)
+            max_pages: Pages kept before the oldest are dropped (default: EVIDENCE_CORPUS_MAX_PAGES or 20000)
+        """
+        self.path = path or os.getenv("EVIDENCE_CORPUS_PATH", "evidence_corpus.sqlite3")
+        if max_age_seconds is None:
+            max_age_seconds = int(os.getenv("EVIDENCE_MAX_AGE_SECONDS", "86400"))
+        self.max_age_seconds = max_age_seconds
+        self.min_hits = min_hits or int(os.getenv("EVIDENCE_MIN_HITS", "3"))
+        self.min_coverage = min_coverage or float(os.getenv("EVIDENCE_MIN_COVERAGE", "0.7"))
+        self.max_pages = max_pages or int(os.getenv("EVIDENCE_CORPUS_MAX_PAGES", "20000"))
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY,
+                url_key TEXT NOT NULL UNIQUE,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                scraped_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_scraped_at ON pages (scraped_at)")
+        # Terms keep decimal points ("7.2"), so figures are indexed whole
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(terms, tokenize = \"unicode61 tokenchars '.'\")"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_seconds > 0
+
+    def add(self, url: str, title: str, content: str):
+        """Store or refresh a scraped page; every 100 writes, old pages are dropped."""
+        if not self.enabled or not content.strip():
+            return
+        url_key = normalize_url(url)
+        indexed = " ".join(terms(f"{title}\n{content}"))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                row = self._conn.execute("SELECT id FROM pages WHERE url_key = ?", (url_key,)).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM pages_fts WHERE rowid = ?", (row["id"],))
+                    self._conn.execute("DELETE FROM pages WHERE id = ?", (row["id"],))
+                page_id = self._conn.execute(
+                    "INSERT INTO pages (url_key, url, title, content, scraped_at) VALUES (?, ?, ?, ?, ?)",
+                    (url_key, url, title, content, time.time()),
+                ).lastrowid
+                self._conn.execute("INSERT INTO pages_fts (rowid, terms) VALUES (?, ?)", (page_id, indexed))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._writes += 1
+            due = self._writes % 100 == 0
+        increment("evidence_corpus.pages_added")
+        if due:
+            self.evict()
+
+    def get_page(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Return a fresh stored copy of a page.
+
+        Returns:
+            Dictionary with 'url', 'title' and 'content', or None if there is none
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, content FROM pages WHERE url_key = ? AND scraped_at >= ?",
+                (normalize_url(url), time.time() - self.max_age_seconds),
+            ).fetchone()
+        increment(f"evidence_corpus.page_{'hit' if row is not None else 'miss'}")
+        if row is None:
+            return None
+        return {"url": url, "title": row["title"], "content": row["content"]}
+
+    def search(self, claim: str, limit: int = 5, candidates: int = 25) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find fresh stored pages that cover a claim.
+
+        Pages are ranked by BM25 over the claim's terms; a page matches when
+        it contains at least min_coverage of the terms and all of the figures.
+
+        Args:
+            claim: Claim to find evidence for
+            limit: Maximum pages returned
+            candidates: BM25 results checked for coverage
+
+        Returns:
+            Results with 'url' and 'score' (term coverage, 0-1) in BM25 order, or
+            None when fewer than min_hits pages match and the claim needs a search
+        """
+        if not self.enabled:
+            return None
+        query_terms = set(terms(claim))
+        if not query_terms:
+            return None
+        _, numbers, _ = tokenize(claim)
+        match = " OR ".join(f'"{term}"' for term in sorted(query_terms))
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pages.url, pages_fts.terms FROM pages_fts JOIN pages ON pages.id = pages_fts.rowid "
+                "WHERE pages_fts MATCH ? AND pages.scraped_at >= ? ORDER BY bm25(pages_fts) LIMIT ?",
+                (match, time.time() - self.max_age_seconds, candidates),
+            ).fetchall()
+
+        hits = []
+        for row in rows:
+            page_terms = set(row["terms"].split())
+            coverage = len(query_terms & page_terms) / len(query_terms)
+            if coverage >= self.min_coverage and numbers <= page_terms:
+                hits.append({"url": row["url"], "score": coverage})
+            if len(hits) >= limit:
+                break
+
+        if len(hits) < self.min_hits:
+            increment("evidence_corpus.miss")
+            return None
+        increment("evidence_corpus.hit")
+        return hits
+
+    def evict(self) -> int:
+        """
+        Drop stale pages and the oldest ones above max_pages.
+
+        Returns:
+            Number of pages removed
+        """
+        with self._lock:
+            cutoff = time.time() - self.max_age_seconds
+            count = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            ids = [
+                row["id"]
+                for row in self._conn.execute(
+                    "SELECT id FROM pages WHERE scraped_at < ? "
+                    "UNION SELECT id FROM (SELECT id FROM pages ORDER BY scraped_at LIMIT ?)",
+                    (cutoff, max(count - self.max_pages, 0)),
+                ).fetchall()
+            ]
+            self._conn.execute("BEGIN")
+            for page_id in ids:
+                self._conn.execute("DELETE FROM pages_fts WHERE rowid = ?", (page_id,))
+                self._conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+            self._conn.execute("COMMIT")
+        if ids:
+            increment("evidence_corpus.evictions", len(ids))
+        return len(ids)
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of stored pages and how many are still fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS pages, SUM(scraped_at >= ?) AS fresh FROM pages",
+                (time.time() - self.max_age_seconds,),
+            ).fetchone()
+        return {"pages": row["pages"], "fresh": row["fresh"] or 0}
@@ -0,0 +1,3 @@
+from .fingerprint import content_fingerprint, claim_key, normalize_url, normalize_text, normalize_content
+
+__all__ = ["content_fingerprint", "claim_key", "normalize_url", "normalize_text", "normalize_content"]
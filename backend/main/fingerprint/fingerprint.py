@@ -0,0 +1,64 @@
+import re
+import hashlib
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the visitor and never change page content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "twclid",
+    "igshid", "mc_cid", "mc_eid", "ref", "ref_src", "ref_url", "referrer", "source",
+    "cmpid", "ocid", "ito", "_ga", "_gl", "s_cid", "spm", "share", "smid", "sr_share",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "vero_")
+
+_whitespace_re = re.compile(r"\s+")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonicalize a URL so trivially different links to the same page compare equal.
+
+    Drops the scheme, "www.", default ports, fragments, tracking parameters and
+    trailing slashes, lowercases the host and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    path = parts.path.rstrip("/") or ""
+    return urlunsplit(("", host, path, urlencode(sorted(query)), "")).lstrip("/")
+
+
+def normalize_text(text: str) -> str:
+    """Fold Unicode forms, case and whitespace."""
+    text = unicodedata.normalize("NFKC", text)
+    return _whitespace_re.sub(" ", text).strip().casefold()
+
+
+def normalize_content(content: str, input_type: str) -> str:
+    """Normalize verification input according to its type."""
+    if input_type == "url":
+        return normalize_url(content)
+    return normalize_text(content)
+
+
+def content_fingerprint(content: str, input_type: str) -> str:
+    """
+    Stable fingerprint of verification input, identical for inputs that
+    only differ in formatting, casing or tracking parameters.
+    """
+    normalized = normalize_content(content, input_type)
+    return hashlib.sha256(f"{input_type}:{normalized}".encode("utf-8")).hexdigest()
+
+
+def claim_key(claim: str) -> str:
+    """Stable key for a single claim, identical across case and whitespace differences."""
+    return hashlib.sha256(f"claim:{normalize_text(claim)}".encode("utf-8")).hexdigest()
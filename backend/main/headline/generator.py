@@ -7,6 +7,8 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from main.llm_cache import cached_invoke, acached_invoke
+
 # Load .env
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
@@ -48,11 +50,26 @@ HEADLINE:""")
         claims_text = "\n".join([f"- {claim}" for claim in user_claims])
         
         try:
-            # Create the chain
-            chain = self.headline_prompt | self.llm | self.output_parser
+            # Invoke the chain (through the shared response cache)
+            response = cached_invoke(
+                "headline_generator", self.headline_prompt, self.llm, {"claims_text": claims_text}, "gemini"
+            )
             
-            # Invoke the chain
-            response = chain.invoke({"claims_text": claims_text})
+            return response.strip().replace('"', '')
+        except Exception as e:
+            print(f"Error generating headline: {e}")
+            return "Verification Report"
+
+    async def agenerate_headline(self, user_claims: List[str]) -> str:
+        """
+        Async generate_headline, using ainvoke.
+        """
+        claims_text = "\n".join([f"- {claim}" for claim in user_claims])
+        
+        try:
+            response = await acached_invoke(
+                "headline_generator", self.headline_prompt, self.llm, {"claims_text": claims_text}, "gemini"
+            )
             
             return response.strip().replace('"', '')
         except Exception as e:
@@ -0,0 +1,11 @@
+from .http_client import get_http_client, get_async_http_client, aclose_async_http_client
+from .hedging import Hedger, get_hedger, get_hedger_stats
+
+__all__ = [
+    "get_http_client",
+    "get_async_http_client",
+    "aclose_async_http_client",
+    "Hedger",
+    "get_hedger",
+    "get_hedger_stats",
+]
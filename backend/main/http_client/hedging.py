@@ -0,0 +1,191 @@
+import os
+import time
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from main.metrics import increment, observe, metrics
+
+T = TypeVar("T")
+
+# Default per-call deadline (seconds) per upstream operation.
+# Override with <OPERATION>_DEADLINE_SECONDS, e.g. TAVILY_SEARCH_DEADLINE_SECONDS.
+DEFAULT_DEADLINES = {
+    "tavily_search": 20.0,
+    "tavily_extract": 30.0,
+}
+
+
+class Hedger:
+    """
+    Deadline and request hedging for one upstream operation.
+
+    Every call gets an overall deadline. If a call has not answered by the
+    recent p90 latency of the operation, a duplicate is sent and whichever
+    returns first wins; the other is cancelled. Duplicates are limited to a
+    budget (a fraction of all calls), so a slow upstream cannot double its
+    own load. Latencies feed a histogram, so the hedge threshold follows the
+    upstream's current behaviour.
+
+    Given the upstream's rate limiter, the first attempt's slot is taken
+    before the clock starts, so queueing behind the limiter counts neither
+    towards the deadline nor the latency histogram, and a duplicate is only
+    sent when the limiter has a slot free at once.
+
+    Deadlines and hedging apply to the async paths only; the sync paths are
+    bounded by the HTTP client's connect and read timeouts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        deadline: float,
+        budget: float,
+        quantile: float = 0.9,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+    ):
+        """
+        Args:
+            name: Operation name, used for the histogram and counters
+            deadline: Seconds before a call fails with TimeoutError
+            budget: Maximum share of calls that may be hedged (0 disables hedging)
+            quantile: Latency quantile after which a duplicate is sent
+            min_samples: Samples needed before hedging starts
+            min_delay: Lower bound on the hedge delay in seconds
+        """
+        self.name = name
+        self.deadline = deadline
+        self.budget = budget
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._calls = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little history."""
+        if self.budget <= 0:
+            return None
+        latency = metrics.quantile(self.name, self.quantile, self.min_samples)
+        if latency is None:
+            return None
+        return max(latency, self.min_delay)
+
+    def _take_hedge(self, limiter=None) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.budget * self._calls:
+                return False
+            if limiter is not None and not limiter.try_acquire():
+                increment(f"{self.name}.hedge_skipped")
+                return False
+            self._hedges += 1
+            return True
+
+    @staticmethod
+    def _start(call: Callable[[], Awaitable[T]], limiter) -> asyncio.Future:
+        attempt = asyncio.ensure_future(call())
+        if limiter is not None:
+            # A callback rather than try/finally, so a slot is returned even
+            # when the attempt is cancelled before it starts running
+            attempt.add_done_callback(lambda _: limiter.release())
+        return attempt
+
+    async def run(self, call: Callable[[], Awaitable[T]], limiter=None) -> T:
+        """
+        Run call() under the deadline, hedging it if it is slow.
+
+        Args:
+            call: Zero-argument coroutine function making one upstream request
+            limiter: ProviderLimiter each attempt holds a slot of; call() must not
+                acquire it itself
+
+        Returns:
+            The result of the first attempt to succeed
+
+        Raises:
+            asyncio.TimeoutError: If no attempt succeeded before the deadline
+        """
+        if limiter is not None:
+            await limiter.acquire_async()
+        with self._lock:
+            self._calls += 1
+        started = time.monotonic()
+        delay = self.hedge_delay()
+        attempts = {self._start(call, limiter)}
+        try:
+            if delay is not None and delay < self.deadline:
+                done, _ = await asyncio.wait(attempts, timeout=delay)
+                if not done and self._take_hedge(limiter):
+                    increment(f"{self.name}.hedged")
+                    attempts.add(self._start(call, limiter))
+
+            error = None
+            while attempts:
+                remaining = self.deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                done, attempts = await asyncio.wait(
+                    attempts, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for attempt in done:
+                    if attempt.exception() is None:
+                        observe(self.name, time.monotonic() - started)
+                        return attempt.result()
+                    error = attempt.exception()
+
+            if error is not None and not attempts:
+                raise error
+            # A timed-out call counts as a deadline-long sample so hangs raise the threshold
+            observe(self.name, self.deadline)
+            increment(f"{self.name}.deadline_exceeded")
+            raise asyncio.TimeoutError(f"{self.name} exceeded its {self.deadline:g}s deadline")
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "deadline": self.deadline,
+                "budget": self.budget,
+                "calls": self._calls,
+                "hedges": self._hedges,
+                "hedge_delay": self.hedge_delay(),
+            }
+
+
+_hedgers: Dict[str, Hedger] = {}
+_hedgers_lock = threading.Lock()
+
+
+def get_hedger(name: str) -> Hedger:
+    """
+    Return the process-wide Hedger for an upstream operation.
+
+    Configured from <NAME>_DEADLINE_SECONDS and HEDGE_BUDGET (share of calls
+    that may be duplicated, default 0.05; 0 disables hedging).
+
+    Args:
+        name: Operation name, e.g. "tavily_search" or "tavily_extract"
+    """
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        with _hedgers_lock:
+            hedger = _hedgers.get(name)
+            if hedger is None:
+                hedger = Hedger(
+                    name,
+                    deadline=float(os.getenv(f"{name.upper()}_DEADLINE_SECONDS", DEFAULT_DEADLINES.get(name, 30.0))),
+                    budget=float(os.getenv("HEDGE_BUDGET", "0.05")),
+                )
+                _hedgers[name] = hedger
+    return hedger
+
+
+def get_hedger_stats() -> Dict[str, Dict[str, float]]:
+    """Stats for every hedger created so far."""
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
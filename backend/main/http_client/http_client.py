@@ -0,0 +1,84 @@
+import os
+import asyncio
+import weakref
+
+import httpx
+
+from main.resources import get_resource
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _timeout() -> httpx.Timeout:
+    """Connect and read timeouts from HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT (seconds)."""
+    connect = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    read = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+    return httpx.Timeout(read, connect=connect)
+
+
+def _limits() -> httpx.Limits:
+    """Connection pool size from HTTP_POOL_SIZE; idle connections are kept alive for reuse."""
+    size = int(os.getenv("HTTP_POOL_SIZE", "32"))
+    return httpx.Limits(max_connections=size, max_keepalive_connections=size, keepalive_expiry=60)
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Build a pooled, keep-alive HTTP client with timeouts (HTTP/2 when h2 is installed).
+
+    The client is thread-safe; use the shared one from get_http_client().
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        timeout=_timeout(),
+        limits=_limits(),
+        follow_redirects=True,
+    )
+
+
+# Async clients are bound to the event loop they were created on
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the process-wide HTTP client.
+
+    Connections to Tavily and scraped sites are pooled and reused across
+    threads instead of a new TCP+TLS handshake per request, and every
+    request has connect and read timeouts so a hung upstream cannot pin a
+    worker.
+    """
+    return get_resource("http_client")
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled async HTTP client of the running event loop.
+
+    Each event loop (API server, Reddit monitor, Telegram bot) gets its own
+    client, created on first use and shared by every coroutine on it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=_timeout(),
+            limits=_limits(),
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_http_client():
+    """Close the running event loop's async client, e.g. on server shutdown."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
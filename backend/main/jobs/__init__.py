@@ -0,0 +1,4 @@
+from .job_queue import JobQueue
+from .worker import JobWorkerPool
+
+__all__ = ["JobQueue", "JobWorkerPool"]
@@ -0,0 +1,300 @@
+import os
+import json
+import sqlite3
+import time
+import uuid
+import threading
+from typing import Any, Dict, Optional
+
+from database.local_db import connect
+
+
+class JobQueue:
+    """
+    Durable verification job queue backed by SQLite.
+
+    Jobs survive API restarts: a worker holds a lease on a running job and
+    renews it while the pipeline runs. If the process dies, the lease
+    expires and another worker (in this or any other process sharing the
+    file) picks the job up again, up to max_attempts times.
+
+    The job's attempts count at claim time fences the lease: heartbeats and
+    terminal updates pass it back and are ignored once the job has been
+    claimed again, so a worker that lost its lease cannot overwrite the
+    run that replaced it.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(self, path: str = None, lease_seconds: int = None, max_attempts: int = None):
+        """
+        Initialize the queue and create its table if needed.
+
+        Args:
+            path: SQLite file (default: JOB_QUEUE_PATH or jobs.sqlite3 in the data dir)
+            lease_seconds: How long a running job is reserved without a heartbeat (default: JOB_LEASE_SECONDS or 90)
+            max_attempts: Attempts before a job is marked failed (default: JOB_MAX_ATTEMPTS or 3)
+        """
+        self.path = path or os.getenv("JOB_QUEUE_PATH", "jobs.sqlite3")
+        self.lease_seconds = lease_seconds or int(os.getenv("JOB_LEASE_SECONDS", "90"))
+        self.max_attempts = max_attempts or int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS verification_jobs (
+                    id TEXT PRIMARY KEY,
+                    idempotency_key TEXT UNIQUE,
+                    status TEXT NOT NULL,
+                    input_type TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    user_id TEXT,
+                    user_email TEXT,
+                    force_refresh INTEGER NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    error_status INTEGER,
+                    available_at REAL NOT NULL,
+                    lease_expires_at REAL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    finished_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS idx_verification_jobs_status
+                    ON verification_jobs(status, available_at);
+            """)
+
+    def _row_to_job(self, row) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def enqueue(
+        self,
+        content: str,
+        input_type: str,
+        user_id: str,
+        user_email: str,
+        idempotency_key: Optional[str] = None,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Add a verification job.
+
+        Args:
+            content: Text or URL to verify
+            input_type: "text" or "url"
+            user_id: Owner of the verification
+            user_email: Owner email
+            idempotency_key: Optional client key; re-submitting the same key returns the existing job
+            force_refresh: Skip the verdict cache when the job runs
+
+        Returns:
+            The job record
+        """
+        now = time.time()
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            if idempotency_key:
+                existing = self._conn.execute(
+                    "SELECT * FROM verification_jobs WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()
+                if existing:
+                    return self._row_to_job(existing)
+
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO verification_jobs
+                        (id, idempotency_key, status, input_type, content, user_id, user_email,
+                         force_refresh, available_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (job_id, idempotency_key, self.QUEUED, input_type, content, user_id, user_email,
+                     int(force_refresh), now, now, now),
+                )
+            except sqlite3.IntegrityError:
+                # Another process inserted the same idempotency key first
+                row = self._conn.execute(
+                    "SELECT * FROM verification_jobs WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()
+                return self._row_to_job(row)
+
+            row = self._conn.execute(
+                "SELECT * FROM verification_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM verification_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row)
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """
+        Atomically take the oldest runnable job and lease it to the caller.
+
+        Runnable means queued and due, or running with an expired lease
+        (its worker died). Jobs that exhausted max_attempts are failed instead.
+
+        Returns:
+            The claimed job, or None if nothing is runnable; its 'attempts'
+            value is the lease token for the updates below
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    """
+                    UPDATE verification_jobs
+                    SET status = ?, error = 'Job abandoned after too many attempts',
+                        error_status = 500, finished_at = ?, updated_at = ?
+                    WHERE status = ? AND lease_expires_at < ? AND attempts >= ?
+                    """,
+                    (self.FAILED, now, now, self.RUNNING, now, self.max_attempts),
+                )
+                row = self._conn.execute(
+                    """
+                    SELECT * FROM verification_jobs
+                    WHERE (status = ? AND available_at <= ?)
+                       OR (status = ? AND lease_expires_at < ?)
+                    ORDER BY created_at
+                    LIMIT 1
+                    """,
+                    (self.QUEUED, now, self.RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                self._conn.execute(
+                    """
+                    UPDATE verification_jobs
+                    SET status = ?, attempts = attempts + 1, lease_expires_at = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (self.RUNNING, now + self.lease_seconds, now, row["id"]),
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM verification_jobs WHERE id = ?", (row["id"],)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._row_to_job(row)
+
+    def heartbeat(self, job_id: str, attempt: int) -> bool:
+        """
+        Extend the lease of a running job.
+
+        Returns:
+            False if the caller no longer holds the lease
+        """
+        now = time.time()
+        with self._lock:
+            return self._conn.execute(
+                "UPDATE verification_jobs SET lease_expires_at = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND attempts = ?",
+                (now + self.lease_seconds, now, job_id, self.RUNNING, attempt),
+            ).rowcount > 0
+
+    def complete(self, job_id: str, attempt: int, result: Dict[str, Any]) -> bool:
+        """
+        Mark a job as succeeded and store its result.
+
+        Args:
+            job_id: Job to complete
+            attempt: The job's 'attempts' value when it was claimed
+            result: Verification result
+
+        Returns:
+            False if the caller no longer holds the lease and nothing was changed
+        """
+        now = time.time()
+        with self._lock:
+            return self._conn.execute(
+                """
+                UPDATE verification_jobs
+                SET status = ?, result = ?, error = NULL, error_status = NULL,
+                    lease_expires_at = NULL, finished_at = ?, updated_at = ?
+                WHERE id = ? AND status = ? AND attempts = ?
+                """,
+                (self.SUCCEEDED, json.dumps(result), now, now, job_id, self.RUNNING, attempt),
+            ).rowcount > 0
+
+    def fail(self, job_id: str, attempt: int, error: str, error_status: int = 500) -> bool:
+        """
+        Mark a job as permanently failed.
+
+        Args:
+            job_id: Job to fail
+            attempt: The job's 'attempts' value when it was claimed
+            error: Error message
+            error_status: HTTP status reported for the job
+
+        Returns:
+            False if the caller no longer holds the lease and nothing was changed
+        """
+        now = time.time()
+        with self._lock:
+            return self._conn.execute(
+                """
+                UPDATE verification_jobs
+                SET status = ?, error = ?, error_status = ?,
+                    lease_expires_at = NULL, finished_at = ?, updated_at = ?
+                WHERE id = ? AND status = ? AND attempts = ?
+                """,
+                (self.FAILED, error, error_status, now, now, job_id, self.RUNNING, attempt),
+            ).rowcount > 0
+
+    def retry_later(
+        self, job_id: str, attempt: int, delay_seconds: float, error: str = None, count_attempt: bool = False
+    ) -> bool:
+        """
+        Put a running job back in the queue after a delay.
+
+        Args:
+            job_id: Job to requeue
+            attempt: The job's 'attempts' value when it was claimed
+            delay_seconds: Seconds before the job becomes runnable again
+            error: Last error, kept for status reporting
+            count_attempt: Whether this run counts towards max_attempts
+                (False when the job never ran, e.g. capacity was full)
+
+        Returns:
+            False if the caller no longer holds the lease and nothing was changed
+        """
+        now = time.time()
+        attempts_sql = "attempts" if count_attempt else "MAX(attempts - 1, 0)"
+        with self._lock:
+            return self._conn.execute(
+                f"""
+                UPDATE verification_jobs
+                SET status = ?, attempts = {attempts_sql}, error = ?,
+                    available_at = ?, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND status = ? AND attempts = ?
+                """,
+                (self.QUEUED, error, now + delay_seconds, now, job_id, self.RUNNING, attempt),
+            ).rowcount > 0
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM verification_jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
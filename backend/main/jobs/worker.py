@@ -0,0 +1,147 @@
+import os
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from main.pipeline import VerificationPipeline, VerificationError, PipelineBusyError, get_pipeline
+from .job_queue import JobQueue
+
+
+class JobWorkerPool:
+    """
+    Pool of asyncio workers that drain the JobQueue through the VerificationPipeline.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        pipeline: Optional[VerificationPipeline] = None,
+        workers: int = None,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize the worker pool.
+
+        Args:
+            queue: JobQueue to drain
+            pipeline: Pipeline that runs each verification (default: the shared pipeline)
+            workers: Number of concurrent workers (default: JOB_WORKERS or 2)
+            poll_interval: Seconds between queue polls when idle
+        """
+        self.queue = queue
+        self._pipeline = pipeline
+        self.workers = workers or int(os.getenv("JOB_WORKERS", "2"))
+        self.poll_interval = poll_interval
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def pipeline(self) -> VerificationPipeline:
+        """Pipeline used by the workers, resolved on first job so startup stays cheap."""
+        if self._pipeline is None:
+            self._pipeline = get_pipeline()
+        return self._pipeline
+
+    def start(self):
+        """Start the workers on the running event loop."""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"verification-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        print(f"Started {self.workers} verification job worker(s)")
+
+    async def stop(self):
+        """
+        Stop the workers. Jobs that were running keep their lease and are
+        picked up again once it expires.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """Wake an idle worker after a job was enqueued."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _worker(self, worker_id: int):
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim_next)
+            except Exception as e:
+                print(f"[JOBS] Worker {worker_id} failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._process(worker_id, job)
+
+    async def _heartbeat(self, job_id: str, attempt: int):
+        interval = max(self.queue.lease_seconds / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            if not await asyncio.to_thread(self.queue.heartbeat, job_id, attempt):
+                print(f"[JOBS] Lost the lease on job {job_id} (attempt {attempt})")
+                return
+
+    async def _finish(self, update, job: Dict[str, Any], *args) -> bool:
+        """Apply a terminal update; a no-op means another worker has taken the job over."""
+        if await asyncio.to_thread(update, job["id"], job["attempts"], *args):
+            return True
+        print(
+            f"[JOBS] Job {job['id']} was claimed again after its lease expired, "
+            f"dropping attempt {job['attempts']}"
+        )
+        return False
+
+    async def _process(self, worker_id: int, job: Dict[str, Any]):
+        job_id = job["id"]
+        print(f"[JOBS] Worker {worker_id} running job {job_id} (attempt {job['attempts']})")
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, job["attempts"]))
+        try:
+            result = await self.pipeline.run(
+                job["content"], job["input_type"], force_refresh=bool(job["force_refresh"])
+            )
+            verification_id = await self.pipeline.save_verification(
+                result, user_id=job["user_id"], user_email=job["user_email"]
+            )
+            completed = await self._finish(
+                self.queue.complete,
+                job,
+                {
+                    "verification_id": verification_id,
+                    "verdict": result["verdict"],
+                    "reasoning": result["reasoning"],
+                    "claims": result["claims"],
+                    "sources": result["sources"],
+                    "website_claims": result["website_claims"],
+                    "cached": result["cached"],
+                    "reasoning_tier": result.get("reasoning_tier"),
+                },
+            )
+            if completed:
+                print(f"[JOBS] Job {job_id} succeeded")
+        except PipelineBusyError as e:
+            await self._finish(self.queue.retry_later, job, e.retry_after, str(e))
+        except VerificationError as e:
+            if await self._finish(self.queue.fail, job, str(e), 400):
+                print(f"[JOBS] Job {job_id} failed at {e.stage}: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[JOBS] Job {job_id} errored: {e}")
+            if job["attempts"] >= self.queue.max_attempts:
+                await self._finish(self.queue.fail, job, str(e), 500)
+            else:
+                await self._finish(self.queue.retry_later, job, 5 * job["attempts"], str(e), True)
+        finally:
+            heartbeat.cancel()
@@ -0,0 +1,3 @@
+from .llm_cache import LLMCache, cached_invoke, acached_invoke
+
+__all__ = ["LLMCache", "cached_invoke", "acached_invoke"]
@@ -0,0 +1,201 @@
+import os
+import json
+import asyncio
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from langchain_core.output_parsers import StrOutputParser
+
+from database.local_db import connect
+from main.metrics import increment
+from main.rate_limiter import get_limiter
+from main.resources import get_resource
+
+
+def _llm_string(llm) -> str:
+    """Model name and parameters of a chat model, including bound kwargs such as response_format."""
+    kwargs = {}
+    while hasattr(llm, "bound"):
+        kwargs = {**llm.kwargs, **kwargs}
+        llm = llm.bound
+    return llm._get_llm_string(**kwargs)
+
+
+class LLMCache:
+    """
+    Local cache of LLM responses keyed on model, parameters and the rendered prompt.
+
+    Entries live in SQLite so they survive restarts and are shared by every
+    process using the same data directory (API, bots, backfill scripts).
+    Entries expire after a TTL, and once the cache holds more than
+    max_entries the least recently used ones are evicted. Caching can be
+    turned off per component (LLM_CACHE_<COMPONENT>=0).
+    """
+
+    def __init__(self, path: str = None, ttl_seconds: int = None, max_entries: int = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file (default: LLM_CACHE_PATH or llm_cache.sqlite3 in the data dir)
+            ttl_seconds: Seconds a response is reused, 0 disables the cache (default: LLM_CACHE_TTL_SECONDS or 604800)
+            max_entries: Entries kept before LRU eviction (default: LLM_CACHE_MAX_ENTRIES or 50000)
+        """
+        self.path = path or os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+        if ttl_seconds is None:
+            ttl_seconds = int(os.getenv("LLM_CACHE_TTL_SECONDS", "604800"))
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries or int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+        self._enabled: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                component TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used_at)")
+        self.evict()
+
+    def enabled(self, component: str) -> bool:
+        """Whether responses of a component are cached (LLM_CACHE_<COMPONENT>, default on)."""
+        if self.ttl_seconds <= 0:
+            return False
+        if component not in self._enabled:
+            flag = os.getenv(f"LLM_CACHE_{component.upper()}", "1")
+            self._enabled[component] = flag.lower() not in ("0", "false", "off", "no")
+        return self._enabled[component]
+
+    @staticmethod
+    def key(llm, messages) -> str:
+        """Cache key for a chat model and a list of prompt messages."""
+        prompt = json.dumps([[message.type, message.content] for message in messages], ensure_ascii=False)
+        return hashlib.sha256(f"{_llm_string(llm)}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str, component: str) -> Optional[str]:
+        """
+        Return a fresh cached response and mark it as recently used.
+
+        Returns:
+            The response text, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE cache_key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE llm_cache SET last_used_at = ? WHERE cache_key = ?", (now, key))
+        increment(f"llm_cache.{component}.{'hit' if row is not None else 'miss'}")
+        return row["response"] if row is not None else None
+
+    def put(self, key: str, component: str, response: str):
+        """Store a response; every 100 writes, expired and least recently used entries are evicted."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, component, response, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, component, response, now, now),
+            )
+            self._writes += 1
+            due = self._writes % 100 == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries and the least recently used ones above max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+            count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key IN "
+                    "(SELECT cache_key FROM llm_cache ORDER BY last_used_at LIMIT ?)",
+                    (count - self.max_entries,),
+                ).rowcount
+        if removed:
+            increment("llm_cache.evictions", removed)
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of cached entries per component."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT component, COUNT(*) AS entries FROM llm_cache GROUP BY component"
+            ).fetchall()
+        return {row["component"]: row["entries"] for row in rows}
+
+
+def _lookup(component: str, prompt, llm, inputs: Dict[str, Any]):
+    messages = prompt.format_messages(**inputs)
+    cache = get_resource("llm_cache")
+    if not cache.enabled(component):
+        return messages, cache, None, None
+    key = cache.key(llm, messages)
+    return messages, cache, key, cache.get(key, component)
+
+
+def cached_invoke(component: str, prompt, llm, inputs: Dict[str, Any], provider: str) -> str:
+    """
+    Run prompt | llm | StrOutputParser through the shared LLM response cache.
+
+    Cache hits skip the upstream rate limiter entirely. Errors are never
+    cached, and neither are empty responses.
+
+    Args:
+        component: Caller name used for enable flags and metrics, e.g. "claim_extractor"
+        prompt: ChatPromptTemplate to render with inputs
+        llm: Chat model, optionally with bound kwargs
+        inputs: Prompt variables
+        provider: Rate limiter used on a miss ("openai" or "gemini")
+
+    Returns:
+        The model's text response
+    """
+    messages, cache, key, response = _lookup(component, prompt, llm, inputs)
+    if response is not None:
+        return response
+
+    chain = llm | StrOutputParser()
+    with get_limiter(provider):
+        response = chain.invoke(messages)
+
+    if key is not None and response.strip():
+        cache.put(key, component, response)
+    return response
+
+
+async def acached_invoke(component: str, prompt, llm, inputs: Dict[str, Any], provider: str) -> str:
+    """
+    Async cached_invoke: awaits the model with ainvoke instead of blocking a thread.
+
+    The cache lookup and write (with its periodic eviction) run on a worker
+    thread so SQLite never blocks the event loop.
+    """
+    messages, cache, key, response = await asyncio.to_thread(_lookup, component, prompt, llm, inputs)
+    if response is not None:
+        return response
+
+    chain = llm | StrOutputParser()
+    async with get_limiter(provider):
+        response = await chain.ainvoke(messages)
+
+    if key is not None and response.strip():
+        await asyncio.to_thread(cache.put, key, component, response)
+    return response
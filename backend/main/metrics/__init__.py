@@ -0,0 +1,3 @@
+from .metrics import Metrics, LatencyHistogram, metrics, increment, get_metrics, observe, get_histograms
+
+__all__ = ["Metrics", "LatencyHistogram", "metrics", "increment", "get_metrics", "observe", "get_histograms"]
@@ -0,0 +1,124 @@
+import bisect
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets, 10 ms to 2 min
+LATENCY_BUCKETS = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0, 120.0,
+)
+
+
+class LatencyHistogram:
+    """
+    Latency distribution of one operation.
+
+    Keeps cumulative bucket counts for export and a window of the most
+    recent samples, so quantiles follow current upstream behaviour rather
+    than the whole process lifetime.
+    """
+
+    def __init__(self, window: int = 500):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Quantile of the recent samples, or None if there are none."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound:g}": count for bound, count in zip(LATENCY_BUCKETS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "sum": round(self.sum, 3),
+            "recent": len(self.recent),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class Metrics:
+    """
+    Process-wide counters and latency histograms, safe to update from any thread.
+
+    Counter names are dotted, component first, e.g.
+    "claim_extraction.parse_repaired".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def increment(self, name: str, amount: int = 1):
+        """Add amount to a counter, creating it at zero if needed."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        """Current value of a counter."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Copy of all counters, sorted by name."""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def observe(self, name: str, seconds: float):
+        """Record one latency sample for an operation, e.g. "tavily_search"."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    def quantile(self, name: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Recent latency quantile of an operation, or None with fewer than min_samples samples."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None or len(histogram.recent) < min_samples:
+                return None
+            return histogram.quantile(q)
+
+    def histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of every latency histogram, sorted by name."""
+        with self._lock:
+            return {name: self._histograms[name].snapshot() for name in sorted(self._histograms)}
+
+
+metrics = Metrics()
+
+
+def increment(name: str, amount: int = 1):
+    """Add amount to a process-wide counter."""
+    metrics.increment(name, amount)
+
+
+def get_metrics() -> Dict[str, int]:
+    """Snapshot of every process-wide counter."""
+    return metrics.snapshot()
+
+
+def observe(name: str, seconds: float):
+    """Record a latency sample in a process-wide histogram."""
+    metrics.observe(name, seconds)
+
+
+def get_histograms() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every process-wide latency histogram."""
+    return metrics.histograms()
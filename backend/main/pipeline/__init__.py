@@ -0,0 +1,12 @@
+from .pipeline import VerificationPipeline, VerificationError, get_pipeline
+from .executor import VerificationExecutor, PipelineBusyError
+from .singleflight import SingleFlight
+
+__all__ = [
+    "VerificationPipeline",
+    "VerificationError",
+    "get_pipeline",
+    "VerificationExecutor",
+    "PipelineBusyError",
+    "SingleFlight",
+]
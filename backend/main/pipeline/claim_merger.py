@@ -0,0 +1,122 @@
+import re
+import math
+from typing import List, Tuple
+
+from main.claim_index import tokenize, jaccard, anchors, anchors_agree
+
+_capitalized_re = re.compile(r"(?<!^)(?<![.!?]\s)\b[A-Z][a-zA-Z]+")
+_year_re = re.compile(r"\b(1[89]|20)\d{2}\b")
+
+# Wording that marks opinion, speculation or advice rather than a checkable fact
+HEDGES = (
+    "may ", "might ", "could ", "should ", "would ", "i think", "i believe", "likely",
+    "possibly", "perhaps", "probably", "opinion", "seems", "appears to", "some say",
+)
+
+
+def check_worthiness(claim: str) -> float:
+    """
+    Heuristic score of how specific and verifiable a claim is.
+
+    Figures, dates and named entities raise the score; hedged or opinion
+    wording and very short or very long claims lower it.
+    """
+    _, numbers, _ = tokenize(claim)
+    lowered = claim.lower()
+    score = 2.0 * min(len(numbers), 3)
+    score += 1.0 if _year_re.search(claim) else 0.0
+    score += 0.5 * min(len(_capitalized_re.findall(claim)), 4)
+    score -= 1.5 * sum(1 for hedge in HEDGES if hedge in lowered)
+
+    words = len(claim.split())
+    if words < 5:
+        score -= 1.0
+    elif words > 40:
+        score -= 0.5 * math.log2(words / 40 + 1)
+    return score
+
+
+class ClaimMerger:
+    """
+    Merge the claims extracted from several chunks into a bounded set.
+
+    Near-duplicates (same figures, polarity, direction and entities, high
+    word overlap) are collapsed to the most check-worthy wording, and at most max_claims
+    claims are kept no matter how long the input is. Claims are released
+    as chunks finish so searches can start early: each chunk may release
+    its best claims up to a fair share of the cap, and the remaining slots
+    are filled from the best leftovers once every chunk is in.
+    """
+
+    def __init__(self, max_claims: int, expected_batches: int = 1, similarity: float = 0.6):
+        """
+        Args:
+            max_claims: Maximum number of claims released in total
+            expected_batches: Number of chunks that will be offered
+            similarity: Word Jaccard similarity at which two claims are duplicates
+        """
+        self.max_claims = max_claims
+        self.share = max(1, math.ceil(max_claims / max(expected_batches, 1)))
+        self.similarity = similarity
+        self.accepted: List[Tuple[str, tuple]] = []
+        self.leftovers: List[Tuple[float, str, tuple]] = []
+        self.duplicates = 0
+
+    def _is_duplicate(self, signature: tuple, others) -> bool:
+        shingles, numbers, negated, claim_anchors = signature
+        for other in others:
+            other_shingles, other_numbers, other_negated, other_anchors = other
+            if (
+                numbers == other_numbers
+                and negated == other_negated
+                and anchors_agree(shingles, claim_anchors, other_shingles, other_anchors)
+                and jaccard(shingles, other_shingles) >= self.similarity
+            ):
+                return True
+        return False
+
+    def _dedupe(self, scored: List[Tuple[float, str, tuple]]) -> List[Tuple[float, str, tuple]]:
+        """Best first, dropping claims that duplicate a better or already released one."""
+        kept = []
+        for item in sorted(scored, key=lambda item: item[0], reverse=True):
+            signature = item[2]
+            if self._is_duplicate(signature, [s for _, s in self.accepted] + [k[2] for k in kept]):
+                self.duplicates += 1
+                continue
+            kept.append(item)
+        return kept
+
+    def _release(self, candidates: List[Tuple[float, str, tuple]], limit: int) -> List[str]:
+        released = []
+        for score, claim, signature in candidates:
+            if len(released) >= limit or len(self.accepted) >= self.max_claims:
+                break
+            self.accepted.append((claim, signature))
+            released.append(claim)
+        return released
+
+    def offer(self, claims: List[str]) -> List[str]:
+        """
+        Add one chunk's claims.
+
+        Returns:
+            The claims released now, best first
+        """
+        scored = [
+            (check_worthiness(claim), claim, (*tokenize(claim), anchors(claim)))
+            for claim in claims if claim.strip()
+        ]
+        candidates = self._dedupe(scored)
+        released = self._release(candidates, self.share)
+        self.leftovers.extend(candidates[len(released):])
+        return released
+
+    def finish(self) -> List[str]:
+        """
+        Fill the remaining slots from the best leftover claims.
+
+        Returns:
+            The additional claims released
+        """
+        leftovers, self.leftovers = self.leftovers, []
+        return self._release(self._dedupe(leftovers), self.max_claims)
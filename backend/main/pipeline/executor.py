@@ -0,0 +1,158 @@
+import os
+import asyncio
+import functools
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PipelineBusyError(Exception):
+    """Raised when the verification executor is saturated and a request is turned away."""
+
+    def __init__(self, retry_after: int):
+        """
+        Args:
+            retry_after: Seconds the caller should wait before retrying
+        """
+        super().__init__(f"Verification capacity exhausted, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class VerificationExecutor:
+    """
+    Bounded thread pool for blocking verification work, with admission control.
+
+    Blocking component calls (LangChain invoke, requests, Supabase) run on a
+    fixed pool so they never block the event loop. At most
+    max_concurrent + max_pending verifications are admitted at once; beyond
+    that admit() fails fast with PipelineBusyError instead of queueing forever.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_concurrent: int = None,
+        max_pending: int = None,
+        retry_after: int = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Threads for blocking calls (default: VERIFY_MAX_WORKERS or 32)
+            max_concurrent: Verifications running at once (default: VERIFY_MAX_CONCURRENT or 8)
+            max_pending: Extra verifications allowed to wait (default: VERIFY_MAX_PENDING or 16)
+            retry_after: Retry-After hint in seconds (default: VERIFY_RETRY_AFTER_SECONDS or 15)
+        """
+        self.max_workers = max_workers or int(os.getenv("VERIFY_MAX_WORKERS", "32"))
+        self.max_concurrent = max_concurrent or int(os.getenv("VERIFY_MAX_CONCURRENT", "8"))
+        self.max_pending = (
+            max_pending if max_pending is not None else int(os.getenv("VERIFY_MAX_PENDING", "16"))
+        )
+        self.retry_after = retry_after or int(os.getenv("VERIFY_RETRY_AFTER_SECONDS", "15"))
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="verify"
+        )
+        # threading primitives so admission works across event loops and threads
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._running = 0
+        # Admitted verifications waiting for a running slot, woken one per release
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def admitted(self) -> int:
+        """Number of verifications currently running or waiting to run."""
+        return self._admitted
+
+    def is_saturated(self) -> bool:
+        """True when a new verification would be rejected by admit()."""
+        return self._admitted >= self.max_concurrent + self.max_pending
+
+    @asynccontextmanager
+    async def admit(self):
+        """
+        Reserve a verification slot for the duration of the block.
+
+        Raises:
+            PipelineBusyError: If running and waiting verifications are at capacity
+        """
+        with self._lock:
+            if self.is_saturated():
+                raise PipelineBusyError(self.retry_after)
+            self._admitted += 1
+
+        try:
+            await self._acquire_running()
+            try:
+                yield
+            finally:
+                self._release_running()
+        finally:
+            with self._lock:
+                self._admitted -= 1
+
+    async def _acquire_running(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._running < self.max_concurrent:
+                    self._running += 1
+                    return
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter.done() and not waiter.cancelled():
+                        # Woken just before being cancelled: pass the wakeup on
+                        self._wake_next_locked()
+                    else:
+                        try:
+                            self._waiters.remove((loop, waiter))
+                        except ValueError:
+                            pass
+                raise
+
+    def _release_running(self):
+        with self._lock:
+            self._running -= 1
+            self._wake_next_locked()
+
+    def _wake_next_locked(self):
+        """Wake the longest waiting verification, on its own loop. Must hold self._lock."""
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._resolve_waiter, waiter)
+                return
+            except RuntimeError:
+                # Its loop is closed; try the next one
+                continue
+
+    def _resolve_waiter(self, waiter: asyncio.Future):
+        if waiter.done():
+            # Cancelled after it was picked: pass the wakeup on
+            with self._lock:
+                self._wake_next_locked()
+        else:
+            waiter.set_result(None)
+
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking callable on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+
+    def stats(self) -> dict:
+        """Snapshot of executor limits and load."""
+        return {
+            "max_workers": self.max_workers,
+            "max_concurrent": self.max_concurrent,
+            "max_pending": self.max_pending,
+            "admitted": self._admitted,
+            "running": self._running,
+        }
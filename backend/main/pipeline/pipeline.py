@@ -0,0 +1,692 @@
+import os
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from main.claim_extractor import ClaimExtractor
+from main.claim_discoverer import ClaimDiscoverer
+from main.reasoning import ClaimReasoner
+from main.claim_index import ClaimIndex
+from main.source_ranker import SourceRanker
+from database.supabase_client import SupabaseClient
+from main.resources import get_resource
+from .executor import VerificationExecutor
+from main.fingerprint import content_fingerprint, claim_key
+from .singleflight import SingleFlight
+from .claim_merger import ClaimMerger
+
+
+# Async callback invoked as each stage finishes: on_event(event_name, payload)
+EventCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class VerificationError(Exception):
+    """Raised when a verification cannot produce a verdict."""
+
+    def __init__(self, message: str, stage: str):
+        """
+        Args:
+            message: Human readable reason, safe to show to end users
+            stage: Pipeline stage that failed ("extract", "discover" or "evidence")
+        """
+        super().__init__(message)
+        self.stage = stage
+
+
+class VerificationPipeline:
+    """
+    Shared claim verification flow used by every entry point.
+
+    Runs ClaimExtractor -> ClaimDiscoverer -> website claim extraction ->
+    ClaimReasoner with long-lived clients. All stages are awaitable so the
+    API, extension backend, Telegram bot and Reddit monitor can share it.
+    LLM, search and scraping calls are awaited natively on pooled async
+    clients; the remaining blocking calls (database, CPU-bound text work)
+    run on a bounded VerificationExecutor.
+
+    Claims, searches and URLs flow through the stages one item at a time:
+    a claim's search starts as soon as its chunk is extracted, and its best
+    source is scraped as soon as its search returns. Once every search is
+    in, the rest of the per-request source budget goes to the best remaining
+    pages (see SourceRanker). Scraped pages are packed several to an
+    extraction call as they arrive. Bounded queues between the stages
+    provide backpressure; only reasoning waits for all the evidence.
+
+    Concurrent runs for the same content (after normalization) are coalesced
+    into one execution whose events and result are shared by every caller,
+    and a verdict saved within the cache TTL is served without rerunning.
+    Claims with a fresh stored per-claim verdict, or a close paraphrase of
+    one, skip search, scraping and reasoning; only novel claims are sent
+    upstream.
+    """
+
+    def __init__(
+        self,
+        extractor: Optional[ClaimExtractor] = None,
+        discoverer: Optional[ClaimDiscoverer] = None,
+        reasoner: Optional[ClaimReasoner] = None,
+        db: Optional[SupabaseClient] = None,
+        executor: Optional[VerificationExecutor] = None,
+        max_tokens_per_chunk: int = 15000,
+        search_concurrency: int = None,
+        url_concurrency: int = None,
+        queue_size: int = None,
+        single_flight: Optional[SingleFlight] = None,
+        verdict_cache_ttl: int = None,
+        claim_verdict_ttl: int = None,
+        claim_index: Optional[ClaimIndex] = None,
+        max_claims: int = None,
+        batch_linger: float = None,
+        source_budget: int = None,
+    ):
+        """
+        Initialize the pipeline and its clients.
+
+        Args:
+            extractor: ClaimExtractor instance (default: created once here)
+            discoverer: ClaimDiscoverer instance (default: created once here)
+            reasoner: ClaimReasoner instance (default: created once here)
+            db: SupabaseClient instance (default: the shared client, fetched on first use)
+            executor: VerificationExecutor for blocking calls (default: configured from env)
+            max_tokens_per_chunk: Chunk size for the default ClaimExtractor
+            search_concurrency: Parallel searches per verification (default: PIPELINE_SEARCH_CONCURRENCY or 10)
+            url_concurrency: Parallel URL scrapes per verification (default: PIPELINE_URL_CONCURRENCY or 8)
+            queue_size: Capacity of the queues between stages (default: PIPELINE_QUEUE_SIZE or 16)
+            single_flight: SingleFlight used to coalesce identical in-flight runs
+            verdict_cache_ttl: Seconds a saved verdict is reused for the same content, 0 disables (default: VERDICT_CACHE_TTL_SECONDS or 86400)
+            claim_verdict_ttl: Seconds a stored per-claim verdict is reused, 0 disables (default: CLAIM_VERDICT_TTL_SECONDS or 86400)
+            claim_index: Near-duplicate index used to reuse verdicts of paraphrased claims (default: loaded once here)
+            max_claims: Cap on claims verified per input after cross-chunk dedupe (default: PIPELINE_MAX_CLAIMS or 10)
+            batch_linger: Seconds a partly filled batch of scraped pages waits for more before extraction (default: PIPELINE_BATCH_LINGER_SECONDS or 0.5)
+            source_budget: Source pages scraped per verification (default: SOURCE_BUDGET or 12)
+        """
+        self.extractor = extractor or ClaimExtractor(max_tokens_per_chunk=max_tokens_per_chunk)
+        self.discoverer = discoverer or ClaimDiscoverer()
+        self.reasoner = reasoner or ClaimReasoner()
+        self._db = db
+        self._db_lock = threading.Lock()
+        self.executor = executor or VerificationExecutor()
+        self.search_concurrency = search_concurrency or int(os.getenv("PIPELINE_SEARCH_CONCURRENCY", "10"))
+        self.url_concurrency = url_concurrency or int(os.getenv("PIPELINE_URL_CONCURRENCY", "8"))
+        self.queue_size = queue_size or int(os.getenv("PIPELINE_QUEUE_SIZE", "16"))
+        self.single_flight = single_flight or SingleFlight()
+        if verdict_cache_ttl is None:
+            verdict_cache_ttl = int(os.getenv("VERDICT_CACHE_TTL_SECONDS", "86400"))
+        self.verdict_cache_ttl = verdict_cache_ttl
+        if claim_verdict_ttl is None:
+            claim_verdict_ttl = int(os.getenv("CLAIM_VERDICT_TTL_SECONDS", "86400"))
+        self.claim_verdict_ttl = claim_verdict_ttl
+        if claim_index is None and claim_verdict_ttl > 0:
+            claim_index = ClaimIndex()
+        self.claim_index = claim_index
+        self.max_claims = max_claims or int(os.getenv("PIPELINE_MAX_CLAIMS", "10"))
+        if batch_linger is None:
+            batch_linger = float(os.getenv("PIPELINE_BATCH_LINGER_SECONDS", "0.5"))
+        self.batch_linger = batch_linger
+        self.source_budget = source_budget
+
+    @property
+    def db(self) -> SupabaseClient:
+        """Supabase client, fetched lazily so verification works without it."""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    self._db = get_resource("supabase")
+        return self._db
+
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Run a blocking component call on the bounded executor."""
+        return await self.executor.run(func, *args, **kwargs)
+
+    async def _emit(self, on_event: Optional[EventCallback], event: str, data: Dict[str, Any]):
+        if on_event is None:
+            return
+        try:
+            await on_event(event, data)
+        except Exception as e:
+            print(f"Error in pipeline event handler for '{event}': {e}")
+
+    async def extract_claims(self, content: str, input_type: str = "text") -> List[str]:
+        """
+        Extract claims from text or from the page behind a URL.
+
+        Args:
+            content: Text to verify, or a URL when input_type is "url"
+            input_type: "text" or "url"
+
+        Returns:
+            List of extracted claims (may be empty)
+        """
+        claims = []
+        async for chunk_claims in self._iter_claims(content, input_type):
+            claims.extend(chunk_claims)
+        return claims
+
+    async def _iter_claims(self, content: str, input_type: str) -> AsyncIterator[List[str]]:
+        """
+        Yield the claims of each chunk as soon as that chunk is extracted.
+
+        Claims go through a ClaimMerger, so near-duplicates across chunks are
+        dropped and at most max_claims claims are yielded in total.
+        """
+        if input_type == "url":
+            print(f"Scraping URL: {content}")
+            scraped_data = await self.extractor.scraper.ascrape_url(content, store=False)
+            text = scraped_data["content"]
+            if not text:
+                print(f"Failed to scrape content from {content}")
+                return
+        else:
+            text = content
+
+        chunks = await self._run_blocking(self.extractor.split_text_into_chunks, text)
+        if not chunks:
+            return
+        print(f"Processing {len(chunks)} chunk(s) concurrently...")
+
+        merger = ClaimMerger(self.max_claims, expected_batches=len(chunks))
+        tasks = [
+            asyncio.ensure_future(self.extractor.aextract_claims_from_chunk(chunk))
+            for chunk in chunks
+        ]
+        extracted = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                chunk_claims = await next_done
+                extracted += len(chunk_claims)
+                yield merger.offer(chunk_claims)
+            yield merger.finish()
+            if extracted > len(merger.accepted):
+                print(
+                    f"Kept {len(merger.accepted)} of {extracted} extracted claims "
+                    f"({merger.duplicates} near-duplicates, cap {self.max_claims})"
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _single(self, claims: List[str]) -> AsyncIterator[List[str]]:
+        yield claims
+
+    def _candidate_keys(self, claims: List[str]) -> Dict[str, List[str]]:
+        """Exact key of each claim followed by the keys of its indexed paraphrases."""
+        candidates = {}
+        for claim in claims:
+            keys = [claim_key(claim)]
+            if self.claim_index is not None:
+                keys += [key for key, _ in self.claim_index.match(claim) if key not in keys]
+            candidates[claim] = keys
+        return candidates
+
+    async def lookup_claim_verdicts(self, claims: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Find fresh stored verdicts for claims or for close paraphrases of them.
+
+        Returns:
+            Dictionary mapping each claim with a reusable verdict to its record
+        """
+        if self.claim_verdict_ttl <= 0 or not claims:
+            return {}
+        try:
+            candidates = await self._run_blocking(self._candidate_keys, claims)
+            all_keys = {key for keys in candidates.values() for key in keys}
+            records = await self._run_blocking(
+                self.db.get_claim_verdicts, list(all_keys), self.claim_verdict_ttl
+            )
+        except Exception as e:
+            print(f"Claim verdict store unavailable: {e}")
+            return {}
+
+        reused = {}
+        for claim, keys in candidates.items():
+            key = next((key for key in keys if key in records), None)
+            if key is not None:
+                reused[claim] = records[key]
+                if key != keys[0]:
+                    print(f"Reusing verdict of paraphrase: {records[key]['claim']!r} for {claim!r}")
+        return reused
+
+    async def store_claim_verdicts(
+        self,
+        claims: List[str],
+        claim_verdicts: List[Optional[Dict[str, Any]]],
+        sources: Dict[str, List[str]],
+        website_claims: Dict[str, List[str]],
+    ):
+        """Persist the per-claim verdicts of freshly reasoned claims for reuse."""
+        if self.claim_verdict_ttl <= 0:
+            return
+        records = []
+        for claim, claim_verdict in zip(claims, claim_verdicts):
+            if not claim_verdict:
+                continue
+            evidence_urls = [url for url in sources.get(claim, []) if url in website_claims]
+            records.append({
+                "claim_key": claim_key(claim),
+                "claim": claim,
+                "verdict": claim_verdict["verdict"],
+                "reasoning": claim_verdict["reasoning"],
+                "evidence_urls": evidence_urls,
+                "evidence": {url: website_claims[url] for url in evidence_urls},
+            })
+        if not records:
+            return
+        try:
+            saved = await self._run_blocking(self.db.save_claim_verdicts, records)
+            print(f"Stored {saved} claim verdict(s)")
+        except Exception as e:
+            print(f"Claim verdict store unavailable: {e}")
+            return
+        if saved and self.claim_index is not None:
+            for record in records:
+                await self._run_blocking(self.claim_index.add, record["claim"])
+
+    @staticmethod
+    def _with_reused_evidence(
+        website_claims: Dict[str, List[str]], reused_verdicts: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, List[str]]:
+        merged = dict(website_claims)
+        for record in reused_verdicts.values():
+            for url, url_claims in (record.get("evidence") or {}).items():
+                merged.setdefault(url, url_claims)
+        return merged
+
+    async def _verify_stream(
+        self, claim_batches: AsyncIterator[List[str]], on_event: Optional[EventCallback]
+    ) -> Dict[str, Any]:
+        """
+        Drive claims through search and website extraction as they arrive.
+
+        Claims with a reusable stored verdict are not searched.
+
+        Returns:
+            Dictionary with 'claims', 'sources', 'website_claims' (URLs with claims
+            only, gathered for novel claims), 'novel_claims' and 'reused_verdicts'
+        """
+        claim_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        url_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        claims: List[str] = []
+        novel_claims: List[str] = []
+        reused_verdicts: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, List[str]] = {}
+        website_claims: Dict[str, List[str]] = {}
+        candidates: Dict[str, List[str]] = {}
+        # Page text that came with the search results, so those URLs skip the scraper
+        search_pages: Dict[str, Dict[str, Any]] = {}
+        ranker = SourceRanker(get_resource("domain_reputation"), budget=self.source_budget)
+
+        async def search_worker():
+            while True:
+                claim = await claim_queue.get()
+                if claim is None:
+                    return
+                try:
+                    results = await self.discoverer.aget_results_for_single_claim(claim)
+                except Exception as e:
+                    print(f"Error processing claim: {e}")
+                    results = []
+                candidates[claim] = [result["url"] for result in results]
+                for result in results:
+                    if result.get("content"):
+                        search_pages.setdefault(result["url"], result)
+                print(f"[OK] Found {len(results)} link(s) for claim")
+                await self._emit(on_event, "source", {"claim": claim, "urls": candidates[claim]})
+                for url in ranker.offer(claim, results):
+                    await url_queue.put(url)
+
+        async def add_website_claims(url: str, url_claims: List[str]):
+            print(f"[OK] Extracted {len(url_claims)} claim(s) from {url}")
+            if url_claims:
+                website_claims[url] = url_claims
+            await self._emit(on_event, "website_claim", {"url": url, "claims": url_claims})
+
+        async def url_worker():
+            while True:
+                url = await url_queue.get()
+                if url is None:
+                    return
+                # Novel claims known so far; for single-chunk inputs that is all of them
+                url_novel_claims = list(novel_claims)
+                try:
+                    content = await self.extractor.aprepare_website_content(
+                        url, url_novel_claims, search_pages.get(url)
+                    )
+                except Exception as e:
+                    print(f"[ERROR] Error processing {url}: {e}")
+                    content = ""
+                if batching:
+                    await page_queue.put((url, content))
+                else:
+                    url_claims = await self.extractor.aextract_claims_from_website_content(content, url_novel_claims)
+                    await add_website_claims(url, url_claims)
+
+        async def extract_batch(pages: Dict[str, str]):
+            results = await self.extractor.aextract_claims_from_website_batch(pages, list(novel_claims))
+            for url in pages:
+                await add_website_claims(url, results.get(url, []))
+
+        async def batch_worker():
+            # Pack scraped pages into extraction calls: a batch is sent when it is
+            # full or when no further page arrives within the linger time
+            pending: Dict[str, str] = {}
+            pending_tokens = 0
+            done = False
+            while not done:
+                try:
+                    item = await asyncio.wait_for(
+                        page_queue.get(), timeout=self.batch_linger if pending else None
+                    )
+                except asyncio.TimeoutError:
+                    item = False
+                if item is None:
+                    done = True
+                elif item:
+                    url, content = item
+                    tokens = self.extractor.excerpt_tokens(content)
+                    if pending and pending_tokens + tokens > self.extractor.website_batch_tokens:
+                        batch_tasks.append(asyncio.create_task(extract_batch(pending)))
+                        pending, pending_tokens = {}, 0
+                    pending[url] = content
+                    pending_tokens += tokens
+                    if len(pending) < self.extractor.website_batch_size:
+                        continue
+                if pending:
+                    batch_tasks.append(asyncio.create_task(extract_batch(pending)))
+                    pending, pending_tokens = {}, 0
+            await asyncio.gather(*batch_tasks)
+
+        batching = self.extractor.website_batch_size > 1
+        page_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        batch_tasks: List[asyncio.Task] = []
+
+        search_tasks = [asyncio.create_task(search_worker()) for _ in range(self.search_concurrency)]
+        url_tasks = [asyncio.create_task(url_worker()) for _ in range(self.url_concurrency)]
+        if batching:
+            url_tasks.append(asyncio.create_task(batch_worker()))
+        try:
+            seen_claims = set()
+            async for batch in claim_batches:
+                new_claims = []
+                for claim in batch:
+                    if claim not in seen_claims:
+                        seen_claims.add(claim)
+                        new_claims.append(claim)
+                claims.extend(new_claims)
+                if new_claims:
+                    # Sent per chunk, before any of these claims' "source" events
+                    await self._emit(on_event, "claims", {"claims": list(claims), "complete": False})
+                reused = await self.lookup_claim_verdicts(new_claims)
+                reused_verdicts.update(reused)
+                for claim in new_claims:
+                    if claim in reused:
+                        sources[claim] = list(reused[claim].get("evidence_urls") or [])
+                    else:
+                        novel_claims.append(claim)
+                        await claim_queue.put(claim)
+
+            print(f"Extracted {len(claims)} claims ({len(reused_verdicts)} with a stored verdict)")
+            await self._emit(on_event, "claims", {"claims": claims, "complete": True})
+            if not claims:
+                raise VerificationError(
+                    "No claims could be extracted from the content", stage="extract"
+                )
+
+            for _ in search_tasks:
+                await claim_queue.put(None)
+            await asyncio.gather(*search_tasks)
+
+            for url in ranker.finish():
+                await url_queue.put(url)
+            sources.update(ranker.sources())
+            sources = {claim: sources.get(claim, []) for claim in claims}
+            total_links = sum(len(candidates.get(claim, [])) for claim in novel_claims)
+            print(f"Discovered {total_links} sources, scraping {len(ranker.selected)}")
+            await self._emit(on_event, "sources", {"sources": sources})
+            if novel_claims and total_links == 0:
+                raise VerificationError(
+                    "No sources discovered. Please check your Tavily API key.", stage="discover"
+                )
+
+            for _ in range(self.url_concurrency):
+                await url_queue.put(None)
+            await asyncio.gather(*url_tasks[:self.url_concurrency])
+            if batching:
+                await page_queue.put(None)
+                await asyncio.gather(*url_tasks[self.url_concurrency:])
+        finally:
+            for task in search_tasks + url_tasks + batch_tasks:
+                task.cancel()
+
+        print(f"Extracted claims from {len(website_claims)} websites")
+        await self._emit(
+            on_event, "website_claims", {"website_claims": self._with_reused_evidence(website_claims, reused_verdicts)}
+        )
+        if novel_claims and not website_claims:
+            raise VerificationError(
+                "No credible sources found for verification. Please check your API keys and try again.",
+                stage="evidence",
+            )
+
+        return {
+            "claims": claims,
+            "sources": sources,
+            "website_claims": website_claims,
+            "novel_claims": novel_claims,
+            "reused_verdicts": reused_verdicts,
+        }
+
+    async def reason(self, claims: List[str], website_claims: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Produce the final verdict and reasoning for the claims."""
+        return await self.reasoner.areason_all_claims(claims, website_claims)
+
+    async def _finish(self, evidence: Dict[str, Any], on_event: Optional[EventCallback]) -> Dict[str, Any]:
+        novel_claims = evidence["novel_claims"]
+        reused_verdicts = evidence["reused_verdicts"]
+        if novel_claims:
+            final_result = await self.reason(novel_claims, evidence["website_claims"])
+            await self.store_claim_verdicts(
+                novel_claims,
+                final_result.get("claim_verdicts") or [],
+                evidence["sources"],
+                evidence["website_claims"],
+            )
+        else:
+            print("All claims have a stored verdict, skipping reasoning")
+            final_result = {"verdict": True, "reasoning": "", "claim_verdicts": [], "tier": None, "tiers": []}
+
+        fresh_verdicts = dict(zip(novel_claims, final_result.get("claim_verdicts") or []))
+        claim_verdicts = []
+        for claim in evidence["claims"]:
+            record = reused_verdicts.get(claim)
+            if record:
+                claim_verdicts.append({
+                    "claim": claim,
+                    "verdict": record["verdict"],
+                    "reasoning": record.get("reasoning", ""),
+                    "evidence_urls": record.get("evidence_urls") or [],
+                    "reused": True,
+                    "matched_claim": record.get("claim", claim),
+                })
+            else:
+                claim_verdict = fresh_verdicts.get(claim) or {}
+                claim_verdicts.append({
+                    "claim": claim,
+                    "verdict": claim_verdict.get("verdict"),
+                    "reasoning": claim_verdict.get("reasoning", ""),
+                    "evidence_urls": [
+                        url for url in evidence["sources"].get(claim, []) if url in evidence["website_claims"]
+                    ],
+                    "reused": False,
+                })
+
+        verdict = final_result["verdict"]
+        reasoning = final_result["reasoning"]
+        if reused_verdicts:
+            if verdict is not None:
+                verdict = verdict and all(record["verdict"] for record in reused_verdicts.values())
+            reused_lines = "\n".join(
+                f"- {item['matched_claim']}: {item['verdict']}" + (f" ({item['reasoning']})" if item["reasoning"] else "")
+                for item in claim_verdicts
+                if item["reused"]
+            )
+            reasoning = (reasoning + "\n\n" if reasoning else "") + f"Previously verified claims:\n{reused_lines}"
+        print(f"Final verdict: {verdict}")
+
+        result = {
+            "claims": evidence["claims"],
+            "sources": evidence["sources"],
+            "website_claims": self._with_reused_evidence(evidence["website_claims"], reused_verdicts),
+            "claim_verdicts": claim_verdicts,
+            "verdict": verdict,
+            "reasoning": reasoning,
+            # Which reasoning tier answered, for tracking cascade savings
+            "reasoning_tier": {
+                "tier": final_result.get("tier"),
+                "model": final_result.get("model"),
+                "escalation_reason": final_result.get("escalation_reason"),
+                "tiers": final_result.get("tiers", []),
+            },
+        }
+        await self._emit(
+            on_event,
+            "verdict",
+            {"verdict": result["verdict"], "reasoning": result["reasoning"], "reasoning_tier": result["reasoning_tier"]},
+        )
+        return result
+
+    async def verify_claims(
+        self, claims: List[str], on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify already extracted claims: discover sources, gather evidence and reason.
+
+        Args:
+            claims: Claims to verify
+            on_event: Optional async callback notified as results arrive
+
+        Returns:
+            Dictionary with 'claims', 'sources', 'website_claims', 'verdict' and 'reasoning'
+
+        Raises:
+            VerificationError: If no sources or no usable evidence could be found
+        """
+        evidence = await self._verify_stream(self._single(claims), on_event)
+        return await self._finish(evidence, on_event)
+
+    async def cached_result(self, fingerprint: str, on_event: Optional[EventCallback] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a saved verdict for the same content within the cache TTL.
+
+        Emits the same stage events as a fresh run so streaming clients
+        render a cached verdict like any other.
+
+        Returns:
+            Result dictionary with 'cached' set, or None on a miss
+        """
+        if self.verdict_cache_ttl <= 0:
+            return None
+        try:
+            record = await self._run_blocking(
+                self.db.get_cached_verification, fingerprint, self.verdict_cache_ttl
+            )
+        except Exception as e:
+            print(f"Verdict cache unavailable: {e}")
+            return None
+        if not record:
+            return None
+
+        print(f"Serving cached verdict from verification {record.get('id')}")
+        result = {
+            "claims": record.get("claims") or [],
+            "sources": record.get("sources") or {},
+            "website_claims": record.get("website_claims") or {},
+            "verdict": record["verdict"],
+            "reasoning": record["reasoning"],
+            "cached": True,
+            "cached_verification_id": record.get("id"),
+        }
+        await self._emit(on_event, "claims", {"claims": result["claims"], "complete": True})
+        await self._emit(on_event, "sources", {"sources": result["sources"]})
+        await self._emit(on_event, "website_claims", {"website_claims": result["website_claims"]})
+        await self._emit(
+            on_event, "verdict", {"verdict": result["verdict"], "reasoning": result["reasoning"], "cached": True}
+        )
+        return result
+
+    async def run(
+        self,
+        content: str,
+        input_type: str = "text",
+        on_event: Optional[EventCallback] = None,
+        force_refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Run the full verification pipeline for a piece of content.
+
+        A verdict saved for the same content within the cache TTL is returned
+        as is. If the same content is already being verified, this attaches
+        to that run instead of starting another one.
+
+        Args:
+            content: Text to verify, or a URL when input_type is "url"
+            input_type: "text" or "url"
+            on_event: Optional async callback notified as results arrive
+            force_refresh: Skip the verdict cache and verify again
+
+        Returns:
+            Dictionary with 'input_content', 'input_type', 'content_fingerprint',
+            'cached', 'claims', 'sources', 'website_claims', 'verdict' and 'reasoning'
+
+        Raises:
+            PipelineBusyError: If the executor is saturated (raised before any work starts)
+            VerificationError: If any stage produced nothing to continue with
+        """
+        key = content_fingerprint(content, input_type)
+        shared = None
+        if not force_refresh:
+            shared = await self.cached_result(key, on_event)
+        if shared is None:
+            shared = await self.single_flight.run(
+                key, lambda broadcast: self._run(content, input_type, broadcast), on_event
+            )
+        result = dict(shared)
+        result.setdefault("cached", False)
+        result["input_content"] = content
+        result["input_type"] = input_type
+        result["content_fingerprint"] = key
+        return result
+
+    async def _run(self, content: str, input_type: str, on_event: Optional[EventCallback]) -> Dict[str, Any]:
+        async with self.executor.admit():
+            evidence = await self._verify_stream(self._iter_claims(content, input_type), on_event)
+            return await self._finish(evidence, on_event)
+
+    async def save_verification(self, result: Dict[str, Any], user_id: str, user_email: str) -> str:
+        """
+        Persist a pipeline result to the verifications table.
+
+        Cached results are saved for the user's history without a fingerprint,
+        so re-serving a verdict never extends how long it stays cached.
+
+        Returns:
+            ID of the saved verification record
+        """
+        saved_record = await self._run_blocking(
+            self.db.save_verification,
+            user_id=user_id,
+            user_email=user_email,
+            input_content=result["input_content"],
+            input_type=result["input_type"],
+            verdict=result["verdict"],
+            reasoning=result["reasoning"],
+            claims=result["claims"],
+            sources=result["sources"],
+            content_fingerprint=None if result.get("cached") else result.get("content_fingerprint"),
+            website_claims=result.get("website_claims"),
+        )
+        return saved_record.get("id", "")
+
+
+def get_pipeline() -> VerificationPipeline:
+    """Return the process-wide VerificationPipeline, creating it on first use."""
+    return get_resource("pipeline")
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import concurrent.futures
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+EventCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class _Call:
+    """One in-flight execution and everyone waiting on it."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.task: Optional[asyncio.Task] = None
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+        self.subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent executions that share a key.
+
+    The first caller starts the work; callers that arrive while it is running
+    attach to it and get the same result (or exception). Progress events are
+    broadcast to every attached caller in order, and callers that join late
+    get the events they missed replayed first. Futures are loop-agnostic, so
+    callers on different event loops in the same process can share one
+    execution. The work is only cancelled once every caller has gone away.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def in_flight(self) -> int:
+        """Number of distinct executions currently running."""
+        return len(self._calls)
+
+    async def run(
+        self,
+        key: str,
+        func: Callable[[EventCallback], Awaitable[Any]],
+        on_event: Optional[EventCallback] = None,
+    ) -> Any:
+        """
+        Run func once per key across concurrent callers.
+
+        Args:
+            key: Coalescing key
+            func: Coroutine factory taking the broadcast event callback
+            on_event: Optional callback for this caller's progress events
+
+        Returns:
+            The shared result of func
+        """
+        loop = asyncio.get_running_loop()
+        events: Optional[asyncio.Queue] = asyncio.Queue() if on_event is not None else None
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call(loop)
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+            call.waiters += 1
+            if events is not None:
+                for item in call.events:
+                    events.put_nowait(item)
+                call.subscribers.append((loop, events))
+
+        if leader:
+            call.task = loop.create_task(self._execute(key, call, func))
+        else:
+            print("Attached to in-flight verification")
+
+        pump = loop.create_task(self._pump(events, on_event)) if events is not None else None
+        try:
+            # Shielded so one caller going away does not cancel the shared future
+            result = await asyncio.shield(asyncio.wrap_future(call.future))
+            if pump is not None:
+                # Deliver everything emitted before the result, then stop
+                events.put_nowait(None)
+                await pump
+            return result
+        finally:
+            if pump is not None and not pump.done():
+                pump.cancel()
+            with self._lock:
+                call.waiters -= 1
+                call.subscribers = [s for s in call.subscribers if s[1] is not events]
+                abandoned = call.waiters == 0 and not call.future.done()
+            if abandoned and call.task is not None:
+                call.loop.call_soon_threadsafe(call.task.cancel)
+
+    async def _pump(self, events: asyncio.Queue, on_event: EventCallback):
+        while True:
+            item = await events.get()
+            if item is None:
+                return
+            event, data = item
+            try:
+                await on_event(event, data)
+            except Exception as e:
+                print(f"Error in pipeline event handler for '{event}': {e}")
+
+    async def _execute(self, key: str, call: _Call, func):
+        async def broadcast(event: str, data: Dict[str, Any]):
+            with self._lock:
+                call.events.append((event, data))
+                for loop, queue in call.subscribers:
+                    loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+        try:
+            result = await func(broadcast)
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except BaseException as e:
+            call.future.set_exception(e)
+        else:
+            call.future.set_result(result)
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
@@ -0,0 +1,3 @@
+from .rate_limiter import ProviderLimiter, get_limiter, get_limiter_stats
+
+__all__ = ["ProviderLimiter", "get_limiter", "get_limiter_stats"]
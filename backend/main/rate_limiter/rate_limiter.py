@@ -0,0 +1,226 @@
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from dotenv import load_dotenv
+from pathlib import Path
+
+# Load .env from project root
+env_path = Path(__file__).parent.parent.parent.parent / ".env"
+load_dotenv(dotenv_path=env_path)
+
+
+# Default (requests per second, max in-flight) per upstream provider.
+# Override with RATE_LIMIT_<PROVIDER>_RPS and RATE_LIMIT_<PROVIDER>_CONCURRENCY.
+DEFAULT_LIMITS = {
+    "tavily_search": (5.0, 10),
+    "tavily_extract": (5.0, 10),
+    "openai": (8.0, 16),
+    "gemini": (4.0, 8),
+}
+
+
+class ProviderLimiter:
+    """
+    Token bucket on requests/sec plus a cap on in-flight requests for one upstream.
+
+    Shared by every thread and event loop in the process. Use as a context
+    manager around a single upstream call:
+
+        with get_limiter("openai"):
+            chain.invoke(...)
+
+        async with get_limiter("tavily_search"):
+            await client.post(...)
+    """
+
+    def __init__(self, name: str, rate: float, max_in_flight: int, burst: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Provider name, for logs and stats
+            rate: Sustained requests per second (0 disables the rate limit)
+            max_in_flight: Maximum concurrent requests
+            burst: Bucket size (default: max(rate, 1))
+        """
+        self.name = name
+        self.rate = rate
+        self.max_in_flight = max_in_flight
+        self.burst = burst or max(rate, 1.0)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        # Coroutines waiting for an in-flight slot, woken one per release
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._acquired = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+
+    def _try_acquire_locked(self) -> Optional[float]:
+        """
+        Take a slot if possible. Must hold self._cond.
+
+        Returns:
+            0 if acquired, seconds until a token is available, or None if
+            waiting on an in-flight request to finish
+        """
+        if self._in_flight >= self.max_in_flight:
+            return None
+
+        if self.rate > 0:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+
+        self._in_flight += 1
+        self._acquired += 1
+        return 0
+
+    def _record_wait(self, started: float):
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            self._waited += 1
+            self._wait_seconds += waited
+
+    def acquire(self):
+        """Block the calling thread until a request may be sent."""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                wait = self._try_acquire_locked()
+                if wait == 0:
+                    self._record_wait(started)
+                    return
+                self._cond.wait(timeout=wait)
+
+    def try_acquire(self) -> bool:
+        """Take a slot only if one is free right now, without waiting."""
+        with self._cond:
+            return self._try_acquire_locked() == 0
+
+    async def acquire_async(self):
+        """
+        Wait without blocking the event loop until a request may be sent.
+
+        Waiting for a token sleeps exactly until one is due; waiting for an
+        in-flight slot parks the coroutine until release() wakes it.
+        """
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = None
+            with self._cond:
+                wait = self._try_acquire_locked()
+                if wait == 0:
+                    self._record_wait(started)
+                    return
+                if wait is None:
+                    waiter = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+            if waiter is None:
+                await asyncio.sleep(wait)
+                continue
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if waiter.done() and not waiter.cancelled():
+                        # Woken just before being cancelled: pass the wakeup on
+                        self._wake_async_locked()
+                    else:
+                        try:
+                            self._async_waiters.remove((loop, waiter))
+                        except ValueError:
+                            pass
+                raise
+
+    def _wake_async_locked(self):
+        """Wake the longest waiting coroutine, on its own loop. Must hold self._cond."""
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(self._resolve_waiter, waiter)
+                return
+            except RuntimeError:
+                # Its loop is closed; try the next one
+                continue
+
+    def _resolve_waiter(self, waiter: asyncio.Future):
+        if waiter.done():
+            # Cancelled after it was picked: pass the wakeup on
+            with self._cond:
+                self._wake_async_locked()
+        else:
+            waiter.set_result(None)
+
+    def release(self):
+        """Mark a request as finished."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+            self._wake_async_locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    def stats(self) -> Dict:
+        """Snapshot of limits and usage."""
+        with self._cond:
+            return {
+                "rate": self.rate,
+                "max_in_flight": self.max_in_flight,
+                "in_flight": self._in_flight,
+                "acquired": self._acquired,
+                "waited": self._waited,
+                "wait_seconds": round(self._wait_seconds, 3),
+            }
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """
+    Return the process-wide limiter for an upstream provider.
+
+    Args:
+        provider: One of "tavily_search", "tavily_extract", "openai", "gemini"
+    """
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(provider)
+            if limiter is None:
+                default_rate, default_in_flight = DEFAULT_LIMITS.get(provider, (0, 8))
+                prefix = f"RATE_LIMIT_{provider.upper()}"
+                limiter = ProviderLimiter(
+                    provider,
+                    rate=float(os.getenv(f"{prefix}_RPS", default_rate)),
+                    max_in_flight=int(os.getenv(f"{prefix}_CONCURRENCY", default_in_flight)),
+                )
+                _limiters[provider] = limiter
+    return limiter
+
+
+def get_limiter_stats() -> Dict[str, Dict]:
+    """Stats for every limiter created so far."""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
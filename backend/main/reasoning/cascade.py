@@ -0,0 +1,110 @@
+import re
+from typing import Any, Dict, List, Optional
+
+_figure_re = re.compile(r"(?<![\w.])\d[\d,]*(?:\.\d+)?")
+
+
+def figures(text: str) -> List[float]:
+    """Numbers mentioned in a text ("1,200", "7.5%", "2024")."""
+    values = []
+    for match in _figure_re.finditer(text):
+        try:
+            values.append(float(match.group().replace(",", "")))
+        except ValueError:
+            continue
+    return values
+
+
+def _is_year(value: float) -> bool:
+    return value.is_integer() and 1800 <= value <= 2100
+
+
+def _relative_gap(a: float, b: float) -> float:
+    if a == b:
+        return 0.0
+    if _is_year(a) or _is_year(b):
+        # Years are never "close": 2023 is not within 5% of 2024
+        return 1.0
+    return abs(a - b) / max(abs(a), abs(b))
+
+
+def numeric_conflicts(
+    user_claims: List[str],
+    all_website_claims: Dict[str, List[str]],
+    tolerance: float = 0.05,
+    near_miss: float = 0.25,
+) -> Dict[int, str]:
+    """
+    Find claims whose figures need a careful reading of the evidence.
+
+    A figure is "matched" when some evidence figure is within tolerance of it
+    (years must match exactly). A "near_miss" is an unmatched figure with an
+    evidence figure within near_miss of it (e.g. 52% claimed, 47% reported),
+    the case the strict 5% rule is most often misapplied on. An "unmatched"
+    figure has nothing close in the evidence at all.
+
+    Args:
+        user_claims: Claims being verified
+        all_website_claims: Evidence claims per URL
+        tolerance: Relative difference still counted as the same figure
+        near_miss: Relative difference counted as a near miss
+
+    Returns:
+        Dictionary mapping claim index to "near_miss" or "unmatched"
+    """
+    evidence = [value for claims in all_website_claims.values() for claim in claims for value in figures(claim)]
+    conflicts = {}
+    for i, claim in enumerate(user_claims):
+        for value in figures(claim):
+            gaps = [_relative_gap(value, other) for other in evidence]
+            closest = min(gaps, default=1.0)
+            if closest <= tolerance:
+                continue
+            if closest <= near_miss:
+                conflicts[i] = "near_miss"
+                break
+            conflicts.setdefault(i, "unmatched")
+    return conflicts
+
+
+def escalation_reason(
+    result: Dict[str, Any],
+    user_claims: List[str],
+    all_website_claims: Dict[str, List[str]],
+    min_confidence: float,
+    tolerance: float = 0.05,
+) -> Optional[str]:
+    """
+    Decide whether a fast-tier answer must be re-checked by the strong model.
+
+    Args:
+        result: Parsed fast-tier response (see ClaimReasoner.parse_response)
+        user_claims: Claims being verified
+        all_website_claims: Evidence claims per URL
+        min_confidence: Confidence (0-1) below which the answer is escalated
+        tolerance: Relative difference still counted as the same figure
+
+    Returns:
+        None to accept the answer, otherwise the reason: "error",
+        "low_confidence", "disagreement" or "numeric_conflict"
+    """
+    if result.get("verdict") is None:
+        return "error"
+
+    confidence = result.get("confidence")
+    if confidence is None or confidence < min_confidence:
+        return "low_confidence"
+
+    # The overall verdict must follow from the per-claim verdicts
+    claim_verdicts = result.get("claim_verdicts") or []
+    if any(item is None for item in claim_verdicts):
+        return "disagreement"
+    if result["verdict"] != all(item["verdict"] for item in claim_verdicts):
+        return "disagreement"
+
+    for i, kind in numeric_conflicts(user_claims, all_website_claims, tolerance).items():
+        # Near misses always need the strict reading; an unmatched figure
+        # only matters if the fast model still called the claim true
+        if kind == "near_miss" or claim_verdicts[i]["verdict"]:
+            return "numeric_conflict"
+    return None
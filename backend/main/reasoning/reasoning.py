@@ -1,30 +1,66 @@
 import os
-from typing import List, Dict
+import re
+import time
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 from pathlib import Path
 
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from main.llm_cache import cached_invoke, acached_invoke
+from main.metrics import increment
+from main.reasoning.cascade import escalation_reason
+
 # Load .env from project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+_claim_verdict_re = re.compile(r"^\W*CLAIM\s*(\d+)\s*:\W*(true|false)\b\W*(.*)$", re.IGNORECASE)
+_confidence_re = re.compile(r"(\d+(?:\.\d+)?)\s*(%)?")
+
 
 class ClaimReasoner:
-    def __init__(self, model: str = "gemini-2.5-pro"):
+    def __init__(
+        self,
+        model: str = "gemini-2.5-pro",
+        fast_model: str = None,
+        min_confidence: float = None,
+        numeric_tolerance: float = None,
+    ):
         """
         Initialize the ClaimReasoner using LangChain with Gemini API.
 
+        Reasoning is tiered: the fast model answers first with a confidence
+        score, and the strong model is only called when that answer has low
+        confidence, is internally inconsistent, or rests on figures that do
+        not clearly match the evidence.
+
         Args:
-            model: The Gemini model to use (default: gemini-2.5-pro)
+            model: The strong Gemini model to use (default: gemini-2.5-pro)
+            fast_model: First-tier model; a Gemini model name, "openai" for OPENAI_MODEL,
+                or "none" to always use the strong model (default: REASONER_FAST_MODEL or gemini-2.5-flash)
+            min_confidence: Fast-tier confidence (0-1) below which the strong model is used
+                (default: REASONER_MIN_CONFIDENCE or 0.8)
+            numeric_tolerance: Relative difference at which a claimed figure counts as
+                matched by the evidence (default: REASONER_NUMERIC_TOLERANCE or 0.05)
         """
-        self.llm = ChatGoogleGenerativeAI(
-            model=model,
-            google_api_key=os.getenv("GEMINI_API_KEY"),
-            temperature=0
-        )
+        self.model = model
+        self.llm = self._build_llm(model)
+        self.fast_model = fast_model or os.getenv("REASONER_FAST_MODEL", "gemini-2.5-flash")
+        if self.fast_model.lower() in ("", "none", "off"):
+            self.fast_model = None
+        elif self.fast_model.lower() == "openai":
+            self.fast_model = os.getenv("OPENAI_MODEL")
+        self.fast_llm = self._build_llm(self.fast_model) if self.fast_model else None
+        if min_confidence is None:
+            min_confidence = float(os.getenv("REASONER_MIN_CONFIDENCE", "0.8"))
+        self.min_confidence = min_confidence
+        if numeric_tolerance is None:
+            numeric_tolerance = float(os.getenv("REASONER_NUMERIC_TOLERANCE", "0.05"))
+        self.numeric_tolerance = numeric_tolerance
         
         self.reasoning_prompt = ChatPromptTemplate.from_messages([
             ("system", "You are a STRICT fact-checker with ZERO tolerance for numerical inaccuracies or information manipulation. Your primary duty is to catch false numbers and manipulated information."),
@@ -82,7 +118,12 @@ VERDICT RULES:
 
 Provide your response in this exact format:
 VERDICT: [True/False]
-REASONING: [State EXACTLY which numbers you verified or found incorrect. Quote specific evidence. If ANY number is wrong or unverified, explain why it's FALSE. Be explicit about manipulation if detected.]""")
+CONFIDENCE: [0-100, how conclusively the evidence settles EVERY claim; low if evidence is thin, indirect or conflicting]
+REASONING: [State EXACTLY which numbers you verified or found incorrect. Quote specific evidence. If ANY number is wrong or unverified, explain why it's FALSE. Be explicit about manipulation if detected.]
+CLAIM VERDICTS:
+CLAIM 1: [True/False] - [One sentence on the evidence for this claim alone]
+CLAIM 2: [True/False] - [...]
+(one line for every user claim, numbered as above)""")
         ])
         
         self.output_parser = StrOutputParser()
@@ -98,8 +139,43 @@ REASONING: [State EXACTLY which numbers you verified or found incorrect. Quote s
             all_website_claims: Dictionary mapping URLs to their extracted claims
 
         Returns:
-            Dictionary with 'verdict' (True/False) and 'reasoning' keys
+            Dictionary with 'verdict' (True/False), 'confidence', 'reasoning', per-claim
+            'claim_verdicts', the answering 'tier' ("fast" or "pro") and 'model',
+            'escalation_reason' (None unless the fast answer was escalated) and
+            'tiers', one {'tier', 'model', 'seconds', 'confidence'} entry per call made
         """
+        inputs = self._inputs(user_claims, all_website_claims)
+        tiers = []
+
+        reason = None
+        if self.fast_llm is not None:
+            result = self._invoke("fast", self.fast_model, self.fast_llm, inputs, len(user_claims), tiers)
+            reason = self._escalation(result, user_claims, all_website_claims)
+            if reason is None:
+                return self._with_tiers(result, "fast", self.fast_model, None, tiers)
+
+        result = self._invoke("pro", self.model, self.llm, inputs, len(user_claims), tiers)
+        return self._with_tiers(result, "pro", self.model, reason, tiers)
+
+    async def areason_all_claims(
+        self, user_claims: List[str], all_website_claims: Dict[str, List[str]]
+    ) -> Dict[str, any]:
+        """Async reason_all_claims, using ainvoke; same tiers and result."""
+        inputs = self._inputs(user_claims, all_website_claims)
+        tiers = []
+
+        reason = None
+        if self.fast_llm is not None:
+            result = await self._ainvoke("fast", self.fast_model, self.fast_llm, inputs, len(user_claims), tiers)
+            reason = self._escalation(result, user_claims, all_website_claims)
+            if reason is None:
+                return self._with_tiers(result, "fast", self.fast_model, None, tiers)
+
+        result = await self._ainvoke("pro", self.model, self.llm, inputs, len(user_claims), tiers)
+        return self._with_tiers(result, "pro", self.model, reason, tiers)
+
+    @staticmethod
+    def _inputs(user_claims: List[str], all_website_claims: Dict[str, List[str]]) -> Dict[str, str]:
         # Format user claims
         user_claims_text = "\n".join([f"{i+1}. {claim}" for i, claim in enumerate(user_claims)])
 
@@ -111,28 +187,146 @@ REASONING: [State EXACTLY which numbers you verified or found incorrect. Quote s
                 website_evidence.append(f"  {i}. {claim}")
         website_evidence_text = "\n".join(website_evidence)
 
+        return {
+            "user_claims_text": user_claims_text,
+            "website_evidence_text": website_evidence_text
+        }
+
+    def _escalation(
+        self, result: Dict[str, any], user_claims: List[str], all_website_claims: Dict[str, List[str]]
+    ) -> Optional[str]:
+        reason = escalation_reason(
+            result, user_claims, all_website_claims, self.min_confidence, self.numeric_tolerance
+        )
+        if reason is not None:
+            print(f"Escalating reasoning to {self.model}: {reason}")
+            increment("reasoning.escalations")
+            increment(f"reasoning.escalation.{reason}")
+        return reason
+
+    @staticmethod
+    def _build_llm(model: str):
+        if model.startswith("gemini"):
+            return ChatGoogleGenerativeAI(
+                model=model,
+                google_api_key=os.getenv("GEMINI_API_KEY"),
+                temperature=0
+            )
+        return ChatOpenAI(
+            model=model,
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            temperature=0
+        )
+
+    def _invoke(self, tier: str, model: str, llm, inputs: Dict[str, str], num_claims: int, tiers: List[Dict]) -> Dict[str, any]:
+        """Run the reasoning prompt on one tier and record its latency."""
+        started = time.monotonic()
         try:
-            # Create the chain
-            chain = self.reasoning_prompt | self.llm | self.output_parser
-            
-            # Invoke the chain
-            response_text = chain.invoke({
-                "user_claims_text": user_claims_text,
-                "website_evidence_text": website_evidence_text
-            })
-            
-            response_text = response_text.strip()
-            verdict = None
-            reasoning = ""
-            lines = response_text.split("\n")
-            for i, line in enumerate(lines):
-                if line.upper().startswith("VERDICT:"):
-                    verdict_text = line.split(":", 1)[1].strip().lower()
-                    verdict = "true" in verdict_text
-                elif line.upper().startswith("REASONING:"):
-                    reasoning = "\n".join(lines[i + 1:]).strip()
-                    break
-            return {"verdict": verdict, "reasoning": reasoning}
+            # Invoke the chain (through the shared response cache)
+            response_text = cached_invoke(
+                "claim_reasoner", self.reasoning_prompt, llm, inputs, self._provider(model)
+            )
+            result = self.parse_response(response_text, num_claims)
         except Exception as e:
-            print(f"Error reasoning about claim: {e}")
-            return {"verdict": None, "reasoning": f"Error: {str(e)}"}
+            result = self._error_result(e, num_claims)
+        return self._record_tier(tier, model, started, result, tiers)
+
+    async def _ainvoke(self, tier: str, model: str, llm, inputs: Dict[str, str], num_claims: int, tiers: List[Dict]) -> Dict[str, any]:
+        """Async _invoke, using ainvoke."""
+        started = time.monotonic()
+        try:
+            response_text = await acached_invoke(
+                "claim_reasoner", self.reasoning_prompt, llm, inputs, self._provider(model)
+            )
+            result = self.parse_response(response_text, num_claims)
+        except Exception as e:
+            result = self._error_result(e, num_claims)
+        return self._record_tier(tier, model, started, result, tiers)
+
+    @staticmethod
+    def _provider(model: str) -> str:
+        return "gemini" if model.startswith("gemini") else "openai"
+
+    @staticmethod
+    def _error_result(error: Exception, num_claims: int) -> Dict[str, any]:
+        print(f"Error reasoning about claim: {error}")
+        return {
+            "verdict": None,
+            "confidence": None,
+            "reasoning": f"Error: {str(error)}",
+            "claim_verdicts": [None] * num_claims,
+        }
+
+    @staticmethod
+    def _record_tier(tier: str, model: str, started: float, result: Dict[str, any], tiers: List[Dict]) -> Dict[str, any]:
+        seconds = time.monotonic() - started
+        increment(f"reasoning.{tier}_calls")
+        increment(f"reasoning.{tier}_ms", int(seconds * 1000))
+        tiers.append({"tier": tier, "model": model, "seconds": round(seconds, 3), "confidence": result["confidence"]})
+        return result
+
+    @staticmethod
+    def _with_tiers(result: Dict[str, any], tier: str, model: str, escalation: Optional[str], tiers: List[Dict]) -> Dict[str, any]:
+        return {
+            **result,
+            "tier": tier,
+            "model": model,
+            "escalation_reason": escalation,
+            "tiers": tiers,
+        }
+
+    @staticmethod
+    def parse_response(response_text: str, num_claims: int) -> Dict[str, any]:
+        """
+        Parse the VERDICT / REASONING / CLAIM VERDICTS response format.
+
+        Args:
+            response_text: Raw model output
+            num_claims: Number of user claims in the prompt
+
+        Returns:
+            Dictionary with 'verdict', 'confidence' (0-1, None if not given),
+            'reasoning' and 'claim_verdicts', a list aligned with the user claims
+            of {'verdict', 'reasoning'} or None where the model gave no verdict
+            for that claim
+        """
+        verdict = None
+        confidence = None
+        reasoning_lines = []
+        claim_verdicts = [None] * num_claims
+        section = None
+        for line in response_text.strip().split("\n"):
+            stripped = line.strip()
+            upper = stripped.upper().lstrip("*# ")
+            if upper.startswith("VERDICT:"):
+                verdict = "true" in stripped.split(":", 1)[1].strip().lower()
+                section = None
+            elif upper.startswith("CONFIDENCE:"):
+                match = _confidence_re.search(stripped.split(":", 1)[1])
+                if match:
+                    value = float(match.group(1))
+                    # Accept 0-100 (as asked) as well as 0-1
+                    confidence = min(value / 100 if value > 1 or match.group(2) else value, 1.0)
+                section = None
+            elif upper.startswith("REASONING:"):
+                rest = stripped.split(":", 1)[1].strip()
+                if rest:
+                    reasoning_lines.append(rest)
+                section = "reasoning"
+            elif upper.startswith("CLAIM VERDICTS"):
+                section = "claims"
+            elif section == "claims":
+                match = _claim_verdict_re.match(stripped)
+                if match and 1 <= int(match.group(1)) <= num_claims:
+                    claim_verdicts[int(match.group(1)) - 1] = {
+                        "verdict": match.group(2).lower() == "true",
+                        "reasoning": match.group(3).strip(),
+                    }
+            elif section == "reasoning":
+                reasoning_lines.append(line)
+        return {
+            "verdict": verdict,
+            "confidence": confidence,
+            "reasoning": "\n".join(reasoning_lines).strip(),
+            "claim_verdicts": claim_verdicts,
+        }
@@ -0,0 +1,3 @@
+from .registry import ResourceRegistry, registry, get_resource, warm_up
+
+__all__ = ["ResourceRegistry", "registry", "get_resource", "warm_up"]
@@ -0,0 +1,215 @@
+import time
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ResourceRegistry:
+    """
+    Process-wide registry of expensive, shareable objects.
+
+    Each resource (tiktoken encoder, LLM-backed components, Supabase client,
+    the verification pipeline) is built once on first use, or eagerly by
+    warm_up() at startup, and then shared by every request and thread.
+    Construction of one resource is guarded by its own lock, so slow
+    resources do not block each other.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """
+        Register a factory for a resource.
+
+        Args:
+            name: Resource name used with get()
+            factory: Zero-argument callable building the resource
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.Lock())
+
+    def set(self, name: str, instance: Any):
+        """Use an already built instance for a resource (e.g. in scripts)."""
+        with self._lock:
+            self._locks.setdefault(name, threading.Lock())
+            self._instances[name] = instance
+
+    def get(self, name: str) -> Any:
+        """
+        Return the shared instance of a resource, building it on first use.
+
+        Raises:
+            KeyError: If no factory is registered under name
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        if name not in self._factories:
+            raise KeyError(f"Unknown resource: {name}")
+
+        with self._locks[name]:
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.monotonic()
+                instance = self._factories[name]()
+                self._timings[name] = time.monotonic() - started
+                self._instances[name] = instance
+        return instance
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, Optional[float]]:
+        """
+        Build resources eagerly and log how long it took.
+
+        A resource that fails to build (e.g. a missing API key) is logged and
+        skipped; it will be retried on first use.
+
+        Args:
+            names: Resources to build, in order (default: all registered)
+
+        Returns:
+            Dictionary mapping each resource to its build time in seconds, or None if it failed
+        """
+        started = time.monotonic()
+        timings = {}
+        for name in names or list(self._factories):
+            try:
+                self.get(name)
+                timings[name] = self._timings.get(name, 0.0)
+            except Exception as e:
+                print(f"[STARTUP] Failed to warm up {name}: {e}")
+                timings[name] = None
+
+        ready = {name: seconds for name, seconds in timings.items() if seconds is not None}
+        details = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in ready.items())
+        print(
+            f"[STARTUP] Warmed up {len(ready)}/{len(timings)} resources in "
+            f"{time.monotonic() - started:.2f}s ({details})"
+        )
+        return timings
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Which resources are built and how long each took."""
+        return {
+            name: {"ready": name in self._instances, "build_seconds": self._timings.get(name)}
+            for name in self._factories
+        }
+
+
+def _tiktoken():
+    import tiktoken
+
+    return tiktoken.encoding_for_model("gpt-4")
+
+
+def _http_client():
+    from main.http_client.http_client import create_http_client
+
+    return create_http_client()
+
+
+def _supabase():
+    from database.supabase_client import SupabaseClient
+
+    return SupabaseClient()
+
+
+def _claim_extractor():
+    from main.claim_extractor import ClaimExtractor
+
+    return ClaimExtractor()
+
+
+def _claim_discoverer():
+    from main.claim_discoverer import ClaimDiscoverer
+
+    return ClaimDiscoverer()
+
+
+def _claim_reasoner():
+    from main.reasoning import ClaimReasoner
+
+    return ClaimReasoner()
+
+
+def _claim_categorizer():
+    from main.categorizer import ClaimCategorizer
+
+    return ClaimCategorizer()
+
+
+def _headline_generator():
+    from main.headline import HeadlineGenerator
+
+    return HeadlineGenerator()
+
+
+def _image_searcher():
+    from image_retrieve.image_searcher import ImageSearcher
+
+    return ImageSearcher()
+
+
+def _llm_cache():
+    from main.llm_cache import LLMCache
+
+    return LLMCache()
+
+
+def _search_cache():
+    from main.search_cache import SearchCache
+
+    return SearchCache()
+
+
+def _evidence_corpus():
+    from main.evidence_corpus import EvidenceCorpus
+
+    return EvidenceCorpus()
+
+
+def _domain_reputation():
+    from main.source_ranker import DomainReputation
+
+    return DomainReputation()
+
+
+def _pipeline():
+    from main.pipeline import VerificationPipeline
+
+    return VerificationPipeline(
+        extractor=registry.get("claim_extractor"),
+        discoverer=registry.get("claim_discoverer"),
+        reasoner=registry.get("claim_reasoner"),
+    )
+
+
+registry = ResourceRegistry()
+registry.register("tiktoken", _tiktoken)
+registry.register("http_client", _http_client)
+registry.register("supabase", _supabase)
+registry.register("llm_cache", _llm_cache)
+registry.register("search_cache", _search_cache)
+registry.register("evidence_corpus", _evidence_corpus)
+registry.register("domain_reputation", _domain_reputation)
+registry.register("claim_extractor", _claim_extractor)
+registry.register("claim_discoverer", _claim_discoverer)
+registry.register("claim_reasoner", _claim_reasoner)
+registry.register("claim_categorizer", _claim_categorizer)
+registry.register("headline_generator", _headline_generator)
+registry.register("image_searcher", _image_searcher)
+registry.register("pipeline", _pipeline)
+
+
+def get_resource(name: str) -> Any:
+    """Return the process-wide instance of a registered resource."""
+    return registry.get(name)
+
+
+def warm_up(names: Optional[Iterable[str]] = None) -> Dict[str, Optional[float]]:
+    """Build registered resources eagerly; see ResourceRegistry.warm_up."""
+    return registry.warm_up(names)
@@ -0,0 +1,3 @@
+from .search_cache import SearchCache
+
+__all__ = ["SearchCache"]
@@ -0,0 +1,117 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+from database.local_db import connect
+from main.fingerprint import normalize_text
+from main.metrics import increment
+
+
+class SearchCache:
+    """
+    Local cache of Tavily search responses.
+
+    Keyed by the normalized query plus every other search parameter (depth,
+    result count, domains, ...), so "Is GDP up 7%?" and "is gdp up 7% ?"
+    share an entry while a basic and an advanced search do not. Responses
+    with results are kept for the TTL; empty responses are cached only
+    briefly, so a query that found nothing is retried soon but not on every
+    request. Entries live in SQLite in the data dir, shared by the API, the
+    bots and the Reddit monitor.
+    """
+
+    def __init__(self, path: str = None, ttl_seconds: int = None, negative_ttl_seconds: int = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file (default: SEARCH_CACHE_PATH or search_cache.sqlite3 in the data dir)
+            ttl_seconds: Seconds a response with results is reused, 0 disables the cache
+                (default: SEARCH_CACHE_TTL_SECONDS or 21600)
+            negative_ttl_seconds: Seconds an empty response is reused
+                (default: SEARCH_CACHE_NEGATIVE_TTL_SECONDS or 300)
+        """
+        self.path = path or os.getenv("SEARCH_CACHE_PATH", "search_cache.sqlite3")
+        if ttl_seconds is None:
+            ttl_seconds = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "21600"))
+        self.ttl_seconds = ttl_seconds
+        if negative_ttl_seconds is None:
+            negative_ttl_seconds = int(os.getenv("SEARCH_CACHE_NEGATIVE_TTL_SECONDS", "300"))
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = connect(self.path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                response TEXT NOT NULL,
+                negative INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_expires ON search_cache (expires_at)")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> str:
+        """Cache key of a search request: normalized query plus the other parameters (never the API key)."""
+        params = {name: value for name, value in payload.items() if name not in ("api_key", "query")}
+        query = normalize_text(payload.get("query", "")).rstrip(" .?!")
+        raw = json.dumps([query, params], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response for a search request.
+
+        Returns:
+            The Tavily response, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, negative FROM search_cache WHERE cache_key = ? AND expires_at > ?",
+                (self.key(payload), time.time()),
+            ).fetchone()
+        if row is None:
+            increment("search_cache.miss")
+            return None
+        increment("search_cache.negative_hit" if row["negative"] else "search_cache.hit")
+        return json.loads(row["response"])
+
+    def put(self, payload: Dict[str, Any], response: Dict[str, Any]):
+        """Store a search response; empty responses get the short negative TTL."""
+        if not self.enabled:
+            return
+        negative = not response.get("results")
+        ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+        if ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (cache_key, query, response, negative, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.key(payload), payload.get("query", ""), json.dumps(response), int(negative), now + ttl),
+            )
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+
+    def stats(self) -> Dict[str, int]:
+        """Live positive and negative entries."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS entries, COALESCE(SUM(negative), 0) AS negative "
+                "FROM search_cache WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return {"entries": row["entries"], "negative": row["negative"]}
@@ -0,0 +1,3 @@
+from .source_ranker import SourceRanker, DomainReputation, DEFAULT_DOMAIN_REPUTATION, site_of
+
+__all__ = ["SourceRanker", "DomainReputation", "DEFAULT_DOMAIN_REPUTATION", "site_of"]
@@ -0,0 +1,257 @@
+import os
+import json
+from typing import Any, Dict, List, Optional
+
+from main.fingerprint import normalize_url
+from main.metrics import increment
+
+# Built-in reputation (0-1) of common evidence sources. Entries match the
+# domain and its subdomains; suffix entries such as "gov" match a whole TLD.
+# Extend or override with a JSON file of {"domain": score} at SOURCE_REPUTATION_PATH.
+DEFAULT_DOMAIN_REPUTATION = {
+    # Government, intergovernmental and academic
+    "gov": 0.9, "mil": 0.85, "edu": 0.85, "int": 0.9,
+    "gov.uk": 0.9, "gov.in": 0.9, "nic.in": 0.85, "gc.ca": 0.9, "gov.au": 0.9, "europa.eu": 0.9, "ac.uk": 0.85,
+    "who.int": 0.95, "un.org": 0.9, "worldbank.org": 0.9, "imf.org": 0.9, "oecd.org": 0.9,
+    "nasa.gov": 0.95, "noaa.gov": 0.95, "cdc.gov": 0.95, "nih.gov": 0.95, "rbi.org.in": 0.9,
+    # Journals and reference works
+    "nature.com": 0.9, "science.org": 0.9, "thelancet.com": 0.9, "nejm.org": 0.9, "bmj.com": 0.9,
+    "sciencedirect.com": 0.8, "springer.com": 0.8, "pubmed.ncbi.nlm.nih.gov": 0.9, "arxiv.org": 0.7,
+    "britannica.com": 0.8, "wikipedia.org": 0.7, "ourworldindata.org": 0.85, "statista.com": 0.7,
+    # Wire services, broadcasters and newspapers of record
+    "reuters.com": 0.9, "apnews.com": 0.9, "afp.com": 0.9, "pti.in": 0.85, "bbc.co.uk": 0.85, "bbc.com": 0.85,
+    "npr.org": 0.8, "pbs.org": 0.8, "theguardian.com": 0.8, "nytimes.com": 0.8, "washingtonpost.com": 0.8,
+    "wsj.com": 0.8, "ft.com": 0.8, "economist.com": 0.8, "bloomberg.com": 0.8, "thehindu.com": 0.8,
+    "indianexpress.com": 0.75, "hindustantimes.com": 0.7, "timesofindia.indiatimes.com": 0.7,
+    "aljazeera.com": 0.75, "cnn.com": 0.7, "cbsnews.com": 0.75, "nbcnews.com": 0.75, "abcnews.go.com": 0.75,
+    # Fact checkers
+    "snopes.com": 0.85, "politifact.com": 0.85, "factcheck.org": 0.85, "fullfact.org": 0.85,
+    "altnews.in": 0.8, "boomlive.in": 0.8, "factchecker.in": 0.8,
+    # User-generated content and aggregators
+    "medium.com": 0.35, "substack.com": 0.35, "blogspot.com": 0.25, "wordpress.com": 0.25,
+    "reddit.com": 0.2, "quora.com": 0.2, "x.com": 0.2, "twitter.com": 0.2, "facebook.com": 0.15,
+    "instagram.com": 0.15, "tiktok.com": 0.15, "youtube.com": 0.3, "pinterest.com": 0.1, "scribd.com": 0.3,
+}
+
+# Second-level labels under which the registrable domain has three labels (bbc.co.uk)
+_SECOND_LEVEL = {"co", "com", "org", "net", "gov", "ac", "edu", "nic", "res", "gen"}
+
+# Score bonus for each extra claim a page is a candidate for
+OVERLAP_BONUS = 0.1
+# Filling the budget, each page already taken from the same site, and each
+# page already covering the same claim, scales a candidate's score by these
+DIVERSITY_DECAY = 0.7
+COVERAGE_DECAY = 0.8
+
+
+def _host(url: str) -> str:
+    return normalize_url(url).split("/", 1)[0].split(":", 1)[0]
+
+
+def site_of(url: str) -> str:
+    """Registrable domain of a URL, e.g. "bbc.co.uk" for https://www.bbc.co.uk/news/..."""
+    labels = _host(url).split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in _SECOND_LEVEL:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class DomainReputation:
+    """
+    Reputation table of source domains.
+
+    A URL gets the score of its most specific matching entry: the host, then
+    each parent domain, then the TLD, so "news.bbc.co.uk" matches
+    "bbc.co.uk" and "data.census.gov" matches "gov".
+    """
+
+    def __init__(self, table: Optional[Dict[str, float]] = None, path: str = None, default: float = None):
+        """
+        Args:
+            table: Domain scores (default: DEFAULT_DOMAIN_REPUTATION)
+            path: JSON file of {"domain": score} merged over the table (default: SOURCE_REPUTATION_PATH)
+            default: Score of domains with no entry (default: SOURCE_DEFAULT_REPUTATION or 0.5)
+        """
+        self.table = dict(DEFAULT_DOMAIN_REPUTATION if table is None else table)
+        path = path or os.getenv("SOURCE_REPUTATION_PATH")
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                overrides = json.load(f)
+            self.table.update({domain.lower().lstrip("."): float(score) for domain, score in overrides.items()})
+            print(f"[OK] Loaded {len(overrides)} domain reputation override(s) from {path}")
+        if default is None:
+            default = float(os.getenv("SOURCE_DEFAULT_REPUTATION", "0.5"))
+        self.default = default
+
+    def score(self, url: str) -> float:
+        """Reputation of the domain serving a URL, in [0, 1]."""
+        labels = _host(url).split(".")
+        for i in range(len(labels)):
+            score = self.table.get(".".join(labels[i:]))
+            if score is not None:
+                return score
+        return self.default
+
+
+class SourceRanker:
+    """
+    Choose which discovered URLs to scrape for one verification.
+
+    Every search result is a candidate. Candidates are deduplicated across
+    claims by canonical URL, so a page found for two claims is scraped once
+    and scores higher for covering both. A candidate's score mixes Tavily's
+    relevance score with the reputation of its domain. At most budget pages
+    are selected per verification:
+
+    - as each claim's search returns, its best candidate is released at once
+      (unless an already selected page covers the claim), so scraping starts
+      without waiting for the other searches and every claim gets evidence;
+    - once every search is in, the remaining budget is filled with the best
+      leftovers, penalizing sites and claims that already have pages so the
+      evidence comes from several independent sources. Leftovers below
+      min_score or over max_per_domain pages per site are never scraped.
+    """
+
+    def __init__(
+        self,
+        reputation: Optional[DomainReputation] = None,
+        budget: int = None,
+        max_per_domain: int = None,
+        relevance_weight: float = None,
+        min_score: float = None,
+    ):
+        """
+        Args:
+            reputation: Domain reputation table (default: built-in table)
+            budget: Pages scraped per verification (default: SOURCE_BUDGET or 12)
+            max_per_domain: Pages per site when filling the budget (default: SOURCE_MAX_PER_DOMAIN or 2)
+            relevance_weight: Weight of Tavily relevance vs domain reputation (default: SOURCE_RELEVANCE_WEIGHT or 0.5)
+            min_score: Score below which leftovers are not scraped (default: SOURCE_MIN_SCORE or 0.35)
+        """
+        self.reputation = reputation or DomainReputation()
+        self.budget = budget or int(os.getenv("SOURCE_BUDGET", "12"))
+        self.max_per_domain = max_per_domain or int(os.getenv("SOURCE_MAX_PER_DOMAIN", "2"))
+        if relevance_weight is None:
+            relevance_weight = float(os.getenv("SOURCE_RELEVANCE_WEIGHT", "0.5"))
+        self.relevance_weight = relevance_weight
+        if min_score is None:
+            min_score = float(os.getenv("SOURCE_MIN_SCORE", "0.35"))
+        self.min_score = min_score
+        self.candidates: Dict[str, Dict[str, Any]] = {}
+        self.selected: List[str] = []
+        self._site_counts: Dict[str, int] = {}
+        self._claim_counts: Dict[str, int] = {}
+
+    def score(self, candidate: Dict[str, Any]) -> float:
+        """Relevance and reputation mix, plus a bonus per extra claim the page covers."""
+        return (
+            self.relevance_weight * candidate["relevance"]
+            + (1 - self.relevance_weight) * candidate["reputation"]
+            + OVERLAP_BONUS * (len(candidate["claims"]) - 1)
+        )
+
+    def _add(self, claim: str, results: List[Dict[str, Any]]) -> List[str]:
+        keys = []
+        for rank, result in enumerate(results):
+            url = result.get("url")
+            if not url:
+                continue
+            relevance = result.get("score")
+            if relevance is None:
+                # No score from the search: fall back to the result's rank
+                relevance = 1.0 - rank / max(len(results), 1)
+            key = normalize_url(url)
+            candidate = self.candidates.get(key)
+            if candidate is None:
+                candidate = self.candidates[key] = {
+                    "url": url,
+                    "site": site_of(url),
+                    "reputation": self.reputation.score(url),
+                    "relevance": float(relevance),
+                    "claims": [],
+                    "selected": False,
+                }
+            else:
+                candidate["relevance"] = max(candidate["relevance"], float(relevance))
+            if claim not in candidate["claims"]:
+                candidate["claims"].append(claim)
+                if candidate["selected"]:
+                    # Already picked for another claim, so it covers this one too
+                    self._claim_counts[claim] = self._claim_counts.get(claim, 0) + 1
+            keys.append(key)
+        return keys
+
+    def _select(self, candidate: Dict[str, Any]) -> str:
+        candidate["selected"] = True
+        self.selected.append(candidate["url"])
+        self._site_counts[candidate["site"]] = self._site_counts.get(candidate["site"], 0) + 1
+        for claim in candidate["claims"]:
+            self._claim_counts[claim] = self._claim_counts.get(claim, 0) + 1
+        return candidate["url"]
+
+    def offer(self, claim: str, results: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add one claim's search results.
+
+        Args:
+            claim: Claim the search was made for
+            results: Search results with "url" and optionally Tavily's "score"
+
+        Returns:
+            URLs to scrape now (the claim's best candidate, if it is not covered yet)
+        """
+        keys = self._add(claim, results)
+        increment("sources.candidates", len(results))
+        if len(self.selected) >= self.budget or self._claim_counts.get(claim):
+            return []
+
+        pool = [self.candidates[key] for key in keys if not self.candidates[key]["selected"]]
+        if not pool:
+            return []
+        # Prefer a site that still has room, but cover the claim regardless
+        open_sites = [c for c in pool if self._site_counts.get(c["site"], 0) < self.max_per_domain]
+        best = max(open_sites or pool, key=self.score)
+        return [self._select(best)]
+
+    def finish(self) -> List[str]:
+        """
+        Fill the remaining budget from the best leftover candidates.
+
+        Returns:
+            The additional URLs to scrape, best first
+        """
+        released = []
+        while len(self.selected) < self.budget:
+            best, best_score = None, self.min_score
+            for candidate in self.candidates.values():
+                if candidate["selected"] or self._site_counts.get(candidate["site"], 0) >= self.max_per_domain:
+                    continue
+                score = self.score(candidate)
+                if score < self.min_score:
+                    continue
+                score *= DIVERSITY_DECAY ** self._site_counts.get(candidate["site"], 0)
+                score *= COVERAGE_DECAY ** min(self._claim_counts.get(claim, 0) for claim in candidate["claims"])
+                if best is None or score > best_score:
+                    best, best_score = candidate, score
+            if best is None:
+                break
+            released.append(self._select(best))
+
+        pruned = len(self.candidates) - len(self.selected)
+        increment("sources.selected", len(self.selected))
+        increment("sources.pruned", pruned)
+        print(
+            f"[OK] Selected {len(self.selected)} of {len(self.candidates)} unique source(s) "
+            f"(budget {self.budget}, {pruned} pruned)"
+        )
+        return released
+
+    def sources(self) -> Dict[str, List[str]]:
+        """Selected URLs per claim, in selection order."""
+        per_claim: Dict[str, List[str]] = {}
+        for candidate in sorted(
+            (c for c in self.candidates.values() if c["selected"]), key=lambda c: self.selected.index(c["url"])
+        ):
+            for claim in candidate["claims"]:
+                per_claim.setdefault(claim, []).append(candidate["url"])
+        return per_claim
@@ -1,14 +1,24 @@
 import os
-import requests
-from typing import Dict
+import time
+import asyncio
+from typing import Dict, Optional
 from dotenv import load_dotenv
 from pathlib import Path
 from bs4 import BeautifulSoup
 
+from main.rate_limiter import get_limiter
+from main.http_client import get_http_client, get_async_http_client, get_hedger
+from main.metrics import observe
+from main.resources import get_resource
+
 # Load .env from project root
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
 
 class WebScraper:
     def __init__(self):
@@ -18,6 +28,28 @@ class WebScraper:
         self.api_key = os.getenv("TAVALY_API_KEY")
         self.api_url = "https://api.tavily.com/extract"
 
+    @staticmethod
+    def _parse_html(url: str, html: bytes) -> Dict[str, str]:
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Extract title
+        title = soup.find("title")
+        title_text = title.get_text().strip() if title else ""
+
+        # Remove script and style elements
+        for script in soup(["script", "style", "nav", "footer", "header"]):
+            script.decompose()
+
+        # Get text content
+        text = soup.get_text()
+
+        # Clean up text
+        lines = (line.strip() for line in text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        text = "\n".join(chunk for chunk in chunks if chunk)
+
+        return {"url": url, "title": title_text, "content": text}
+
     def scrape_with_beautifulsoup(self, url: str) -> Dict[str, str]:
         """
         Fallback method to scrape URL using BeautifulSoup.
@@ -29,73 +61,151 @@ class WebScraper:
             Dictionary with 'url', 'content', and 'title' keys
         """
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_client().get(url, headers=BROWSER_HEADERS, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            return self._parse_html(url, response.content)
 
-            # Extract title
-            title = soup.find("title")
-            title_text = title.get_text().strip() if title else ""
-
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
-
-            # Get text content
-            text = soup.get_text()
+        except Exception as e:
+            print(f"Error with BeautifulSoup scraping: {e}")
+            return {"url": url, "title": "", "content": ""}
 
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
+    async def ascrape_with_beautifulsoup(self, url: str) -> Dict[str, str]:
+        """
+        Async scrape_with_beautifulsoup; HTML parsing runs on a worker thread.
+        """
+        try:
+            response = await get_async_http_client().get(url, headers=BROWSER_HEADERS, timeout=10)
+            response.raise_for_status()
 
-            return {"url": url, "title": title_text, "content": text}
+            return await asyncio.to_thread(self._parse_html, url, response.content)
 
         except Exception as e:
             print(f"Error with BeautifulSoup scraping: {e}")
             return {"url": url, "title": "", "content": ""}
 
-    def scrape_url(self, url: str) -> Dict[str, str]:
+    @staticmethod
+    def _extract_result(url: str, data: Dict) -> Dict[str, str]:
+        # Extract content from results
+        if "results" in data and len(data["results"]) > 0:
+            result = data["results"][0]
+            return {
+                "url": url,
+                "title": result.get("title", ""),
+                "content": result.get("raw_content", ""),
+            }
+        elif "failed_results" in data:
+            print(f"Failed to extract: {data['failed_results']}")
+
+        return {"url": url, "title": "", "content": ""}
+
+    @staticmethod
+    def _stored_page(url: str) -> Optional[Dict[str, str]]:
+        try:
+            return get_resource("evidence_corpus").get_page(url)
+        except Exception as e:
+            print(f"Evidence corpus unavailable: {e}")
+            return None
+
+    @staticmethod
+    def store_page(result: Dict[str, str]):
+        """Add a page obtained elsewhere (e.g. with search results) to the evidence corpus."""
+        if not result["content"]:
+            return
+        try:
+            get_resource("evidence_corpus").add(result["url"], result["title"], result["content"])
+        except Exception as e:
+            print(f"Evidence corpus unavailable: {e}")
+
+    def scrape_url(self, url: str, store: bool = True) -> Dict[str, str]:
         """
         Extract the entire content from a given URL using Tavily.
 
+        Evidence pages are kept in the local evidence corpus: a fresh stored
+        copy is returned without a request, and a newly scraped page is stored.
+
         Args:
             url: The URL to scrape
+            store: Use and update the evidence corpus (False for user-submitted pages,
+                which must never become evidence for their own claims)
 
         Returns:
             Dictionary with 'url', 'content', and 'title' keys
         """
+        if store:
+            stored = self._stored_page(url)
+            if stored is not None:
+                return stored
+
+        result = self._fetch_url(url)
+        if store:
+            self.store_page(result)
+        return result
+
+    def _fetch_url(self, url: str) -> Dict[str, str]:
         try:
             payload = {"api_key": self.api_key, "urls": [url]}
 
             print(f"Sending request to Tavily extract API...")
-            response = requests.post(self.api_url, json=payload)
+            # Timed inside the limiter so queueing does not inflate the hedge threshold
+            with get_limiter("tavily_extract"):
+                started = time.monotonic()
+                response = get_http_client().post(self.api_url, json=payload)
+                observe("tavily_extract", time.monotonic() - started)
             
             print(f"Response status: {response.status_code}")
             print(f"Response: {response.text[:500]}")
             
             response.raise_for_status()
 
-            data = response.json()
+            return self._extract_result(url, response.json())
+
+        except Exception as e:
+            print(f"Error scraping URL with Tavily: {e}")
+            print("Falling back to BeautifulSoup...")
+            return self.scrape_with_beautifulsoup(url)
 
-            # Extract content from results
-            if "results" in data and len(data["results"]) > 0:
-                result = data["results"][0]
-                return {
-                    "url": url,
-                    "title": result.get("title", ""),
-                    "content": result.get("raw_content", ""),
-                }
-            elif "failed_results" in data:
-                print(f"Failed to extract: {data['failed_results']}")
+    async def _apost(self, payload: Dict) -> Dict:
+        response = await get_async_http_client().post(self.api_url, json=payload)
+        print(f"Tavily extract response status: {response.status_code}")
+        response.raise_for_status()
+        return response.json()
 
-            return {"url": url, "title": "", "content": ""}
+    async def ascrape_url(self, url: str, store: bool = True) -> Dict[str, str]:
+        """
+        Async scrape_url, on the event loop's pooled HTTP client.
+
+        The extract call runs under a deadline and is hedged when slower than
+        the recent p90 extract latency (see get_hedger).
+
+        Args:
+            url: The URL to scrape
+            store: Use and update the evidence corpus (False for user-submitted pages)
+
+        Returns:
+            Dictionary with 'url', 'content', and 'title' keys
+        """
+        # The evidence corpus (SQLite FTS5 and term indexing) is used from a worker thread
+        if store:
+            stored = await asyncio.to_thread(self._stored_page, url)
+            if stored is not None:
+                return stored
+
+        result = await self._afetch_url(url)
+        if store:
+            await asyncio.to_thread(self.store_page, result)
+        return result
+
+    async def _afetch_url(self, url: str) -> Dict[str, str]:
+        try:
+            payload = {"api_key": self.api_key, "urls": [url]}
+
+            data = await get_hedger("tavily_extract").run(
+                lambda: self._apost(payload), limiter=get_limiter("tavily_extract")
+            )
+            return self._extract_result(url, data)
 
         except Exception as e:
             print(f"Error scraping URL with Tavily: {e}")
             print("Falling back to BeautifulSoup...")
-            return self.scrape_with_beautifulsoup(url)
+            return await self.ascrape_with_beautifulsoup(url)
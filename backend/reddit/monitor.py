@@ -5,6 +5,8 @@ import praw
 from dotenv import load_dotenv
 from pathlib import Path
 import sys
+import asyncio
+from typing import Optional
 
 # Add backend directory to path
 # Current file: backend/reddit/monitor.py
@@ -12,11 +14,8 @@ import sys
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from main.claim_extractor import ClaimExtractor
-from main.claim_discoverer import ClaimDiscoverer
-from main.reasoning import ClaimReasoner
-from main.headline import HeadlineGenerator
-from database.supabase_client import SupabaseClient
+from main.pipeline import get_pipeline, VerificationError
+from main.resources import get_resource
 
 # Load env
 # .env is in project root (parent of backend)
@@ -29,7 +28,14 @@ print(f"YOUR_CLIENT_ID found: {bool(os.getenv('YOUR_CLIENT_ID'))}")
 
 
 class RedditMonitor:
-    def __init__(self):
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Args:
+            loop: Running event loop that owns the shared pipeline and its LLM
+                clients (the API's loop); the monitor's verifications are
+                scheduled on it. Without one, e.g. when run standalone, the
+                monitor drives the pipeline on a loop of its own.
+        """
         self.reddit = praw.Reddit(
             client_id=os.getenv("YOUR_CLIENT_ID"),
             client_secret=os.getenv("YOUR_CLIENT_SECRET"),
@@ -38,11 +44,19 @@ class RedditMonitor:
             password=os.getenv("YOUR_PASSWORD")
         )
         self.subreddit_name = "eyeoftruth"
-        self.db = SupabaseClient()
-        self.extractor = ClaimExtractor(max_tokens_per_chunk=15000)
-        self.discoverer = ClaimDiscoverer()
-        self.reasoner = ClaimReasoner()
-        self.headline_generator = HeadlineGenerator()
+        self.db = get_resource("supabase")
+        self.pipeline = get_pipeline()
+        self.headline_generator = get_resource("headline_generator")
+        # praw is synchronous, so this thread blocks on each pipeline call. Inside the
+        # API the calls run on the API's loop, so the shared async clients stay on one loop
+        self.main_loop = loop
+        self.loop = asyncio.new_event_loop() if loop is None else None
+
+    def run(self, coro):
+        """Run a pipeline coroutine to completion and return its result."""
+        if self.main_loop is not None:
+            return asyncio.run_coroutine_threadsafe(coro, self.main_loop).result()
+        return self.loop.run_until_complete(coro)
 
     def process_posts(self):
         try:
@@ -94,74 +108,68 @@ class RedditMonitor:
         print("Verifying content...")
         print(f"Content preview: {content_to_verify[:200]}...")
         
-        # 1. Extract Claims (with retry)
+        # 1. Extract Claims (retrying only on errors; malformed model output is
+        # repaired locally and an empty result is a real answer)
         claims = []
         for attempt in range(3):
             try:
-                if input_type == "url":
-                    claims_data = self.extractor.extract_claims_from_url(content_to_verify, key_name="user")
-                else:
-                    claims_data = self.extractor.extract_claims(content_to_verify, key_name="user")
-                
-                claims = claims_data.get("user", [])
-                if claims:
-                    print(f"Successfully extracted {len(claims)} claims")
-                    break
-                else:
-                    print(f"Attempt {attempt + 1}: No claims extracted, retrying...")
+                claims = self.run(self.pipeline.extract_claims(content_to_verify, input_type))
+                print(f"Extracted {len(claims)} claims")
+                break
             except Exception as e:
                 print(f"Attempt {attempt + 1} failed: {e}")
                 if attempt < 2:
-                    import time
                     time.sleep(2)
             
         if not claims:
             print("No claims found. Saving with empty claims...")
             # Still save to DB with empty claims
-            self.db.save_reddit_post(
-                reddit_id=post.id,
-                title=post.title,
-                body=post.selftext,
-                url=post.url if not post.is_self else None,
+            self.save_post(
+                post,
                 headline=None,
                 verdict=False,  # Default to False if no claims
                 reasoning="No claims could be extracted from this content.",
                 claims=[],
                 sources={},
-                author=str(post.author),
-                subreddit=self.subreddit_name
             )
             print("Post saved with no claims.")
             return
 
-        # 2. Discover Sources
-        sources = self.discoverer.discover_sources(claims)
-        
-        # 3. Reason
-        verdict_data = self.reasoner.reason_all_claims(claims, sources)
+        # 2. Discover sources, gather evidence and reason
+        try:
+            verdict_data = self.run(self.pipeline.verify_claims(claims))
+        except VerificationError as e:
+            print(f"Verification failed at {e.stage}: {e}")
+            self.save_post(
+                post,
+                headline=None,
+                verdict=False,
+                reasoning=str(e),
+                claims=claims,
+                sources={},
+            )
+            print("Post saved without a verdict.")
+            return
+
         verdict = verdict_data["verdict"]
         reasoning = verdict_data["reasoning"]
+        sources = verdict_data["sources"]
 
         print(f"Verdict: {verdict}")
 
-        # 4. Generate Headline
+        # 3. Generate Headline
         print("Generating headline...")
         headline = self.headline_generator.generate_headline(claims)
         print(f"Headline: {headline}")
 
         # Save to DB
-        self.db.save_reddit_post(
-            reddit_id=post.id,
-            title=post.title,
-            body=post.selftext,
-            url=post.url if not post.is_self else None,
+        self.save_post(
+            post,
             headline=headline,
             verdict=verdict,
             reasoning=reasoning,
             claims=claims,
             sources=sources,
-            author=str(post.author),
-            subreddit=self.subreddit_name
         )
 
         # Moderation
@@ -183,6 +191,22 @@ class RedditMonitor:
             except Exception as e:
                 print(f"Failed to approve post: {e}")
 
+    def save_post(self, post, headline, verdict, reasoning, claims, sources):
+        """Save a processed Reddit post to the database."""
+        self.db.save_reddit_post(
+            reddit_id=post.id,
+            title=post.title,
+            body=post.selftext,
+            url=post.url if not post.is_self else None,
+            headline=headline,
+            verdict=verdict,
+            reasoning=reasoning,
+            claims=claims,
+            sources=sources,
+            author=str(post.author),
+            subreddit=self.subreddit_name
+        )
+
 if __name__ == "__main__":
     monitor = RedditMonitor()
     monitor.process_posts()
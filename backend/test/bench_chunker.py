@@ -0,0 +1,140 @@
+import sys
+import os
+import time
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import tiktoken
+
+from main.claim_extractor.chunker import split_text_into_chunks
+
+
+def legacy_split_text_into_chunks(text, encoding, max_tokens):
+    """The previous ClaimExtractor.split_text_into_chunks, which re-encodes the growing chunk."""
+
+    def count_tokens(value):
+        return len(encoding.encode(value))
+
+    if count_tokens(text) <= max_tokens:
+        return [text]
+
+    paragraphs = text.split('\n\n')
+    chunks = []
+    current_chunk = ""
+
+    for paragraph in paragraphs:
+        test_chunk = current_chunk + "\n\n" + paragraph if current_chunk else paragraph
+
+        if count_tokens(test_chunk) <= max_tokens:
+            current_chunk = test_chunk
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+
+            if count_tokens(paragraph) > max_tokens:
+                sentences = paragraph.split('. ')
+                temp_chunk = ""
+
+                for sentence in sentences:
+                    test_sentence = temp_chunk + ". " + sentence if temp_chunk else sentence
+
+                    if count_tokens(test_sentence) <= max_tokens:
+                        temp_chunk = test_sentence
+                    else:
+                        if temp_chunk:
+                            chunks.append(temp_chunk)
+                        temp_chunk = sentence
+
+                current_chunk = temp_chunk
+            else:
+                current_chunk = paragraph
+
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    return chunks
+
+
+WORDS = (
+    "government announced percent growth million budget report minister economy inflation "
+    "election court ruling vaccine study researchers climate emissions record quarter market "
+    "shares company revenue billion official data survey population city state country"
+).split()
+
+
+def make_document(encoding, target_tokens, seed=7):
+    """Build a news-like document of roughly target_tokens tokens."""
+    rng = random.Random(seed)
+    paragraphs = []
+    tokens = 0
+    while tokens < target_tokens:
+        sentences = []
+        for _ in range(rng.randint(2, 8)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(8, 25))]
+            words.insert(rng.randrange(len(words)), f"{rng.randint(1, 2025)}")
+            sentences.append(" ".join(words).capitalize() + ".")
+        paragraph = " ".join(sentences)
+        paragraphs.append(paragraph)
+        tokens += len(encoding.encode(paragraph)) + 1
+    # One oversized paragraph to exercise sentence-level splitting
+    paragraphs.insert(len(paragraphs) // 2, " ".join(paragraphs[:60]))
+    return "\n\n".join(paragraphs)
+
+
+def bench(name, func, repeat):
+    best = float("inf")
+    chunks = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = func()
+        best = min(best, time.perf_counter() - started)
+    return best, chunks
+
+
+def test_chunker_benchmark(target_tokens=100_000, max_tokens=15000, overlap=200, repeat=3):
+    """Compare the legacy and linear chunkers on a long document."""
+    print("\n" + "=" * 70)
+    print(f"CHUNKER BENCHMARK - {target_tokens:,} token document, {max_tokens:,} token chunks")
+    print("=" * 70 + "\n")
+
+    encoding = tiktoken.encoding_for_model("gpt-4")
+    text = make_document(encoding, target_tokens)
+    print(f"Document: {len(text):,} chars, {len(encoding.encode(text)):,} tokens\n")
+
+    runs = [
+        ("legacy", lambda: legacy_split_text_into_chunks(text, encoding, max_tokens)),
+        ("linear", lambda: split_text_into_chunks(text, encoding, max_tokens)),
+        (f"linear+overlap{overlap}", lambda: split_text_into_chunks(text, encoding, max_tokens, overlap)),
+    ]
+    results = {}
+    for name, func in runs:
+        seconds, chunks = bench(name, func, repeat)
+        sizes = [len(encoding.encode(chunk)) for chunk in chunks]
+        results[name] = seconds
+        print(
+            f"{name:<22} {seconds * 1000:>9.1f} ms  {len(chunks):>3} chunks  "
+            f"max {max(sizes):>6,} tokens  min {min(sizes):>6,} tokens"
+        )
+        if name.startswith("linear"):
+            assert max(sizes) <= max_tokens, f"{name} produced a chunk over the budget"
+
+    print(f"\nSpeedup: {results['legacy'] / results['linear']:.1f}x")
+
+
+if __name__ == "__main__":
+    print("Starting Chunker Benchmark...")
+
+    try:
+        test_chunker_benchmark()
+
+        print("\n" + "=" * 70)
+        print("BENCHMARK COMPLETED SUCCESSFULLY! ✓")
+        print("=" * 70)
+
+    except Exception as e:
+        print(f"\n✗ Benchmark failed with error: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,108 @@
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from concurrent.futures import ThreadPoolExecutor
+
+from main.claim_extractor import ClaimExtractor
+from main.claim_discoverer import ClaimDiscoverer
+from main.metrics import get_metrics
+
+
+CLAIMS = [
+    "Global temperatures have risen by approximately 1.1°C since pre-industrial times",
+    "Atmospheric carbon dioxide concentrations exceeded 420 parts per million in 2023",
+    "Arctic sea ice extent has declined by about 13% per decade since 1979",
+]
+
+COUNTERS = ("website_claims.llm_calls", "website_claims.prompt_tokens", "website_claims.batch_fallbacks")
+
+
+def run_mode(name, extract, pages, repeat):
+    """Run one extraction mode over the already scraped pages."""
+    best = float("inf")
+    results = {}
+    before = get_metrics()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = extract(pages)
+        best = min(best, time.perf_counter() - started)
+    after = get_metrics()
+    usage = {counter: (after.get(counter, 0) - before.get(counter, 0)) / repeat for counter in COUNTERS}
+    claims = sum(len(claims) for claims in results.values())
+    print(
+        f"{name:<10} {best:>7.2f} s  {usage['website_claims.llm_calls']:>5.1f} calls  "
+        f"{usage['website_claims.prompt_tokens']:>9,.0f} prompt tokens  "
+        f"{usage['website_claims.batch_fallbacks']:>4.1f} fallbacks  {claims:>4} claims"
+    )
+    return best, usage
+
+
+def test_website_batching_benchmark(repeat=1):
+    """Compare one extraction call per page with packed multi-page calls."""
+    print("\n" + "=" * 70)
+    print("WEBSITE CLAIM EXTRACTION BENCHMARK - per URL vs packed")
+    print("=" * 70 + "\n")
+
+    extractor = ClaimExtractor()
+    discoverer = ClaimDiscoverer()
+
+    urls = []
+    for claim in CLAIMS:
+        for url in discoverer.get_links_for_single_claim(claim):
+            if url not in urls:
+                urls.append(url)
+    print(f"Discovered {len(urls)} URL(s) for {len(CLAIMS)} claim(s)")
+
+    # Scrape once so both modes see identical page excerpts
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(lambda url: extractor.prepare_website_content(url, CLAIMS), urls))
+    pages = {url: content for url, content in zip(urls, contents) if content}
+    print(f"Scraped {len(pages)} page(s) with content\n")
+    assert pages, "No pages could be scraped"
+
+    def per_url(pages):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            claims = executor.map(lambda content: extractor.extract_claims_from_website_content(content, CLAIMS), pages.values())
+            return dict(zip(pages, claims))
+
+    def packed(pages):
+        batches = extractor.pack_website_batches(pages)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = {}
+            for batch_results in executor.map(lambda batch: extractor.extract_claims_from_website_batch(batch, CLAIMS), batches):
+                results.update(batch_results)
+            return results
+
+    print(
+        f"Batch size {extractor.website_batch_size} pages, budget {extractor.website_batch_tokens:,} tokens, "
+        f"{len(extractor.pack_website_batches(pages))} batch(es)\n"
+    )
+    per_url_seconds, per_url_usage = run_mode("per-url", per_url, pages, repeat)
+    packed_seconds, packed_usage = run_mode("packed", packed, pages, repeat)
+
+    print(
+        f"\nCalls: {per_url_usage['website_claims.llm_calls'] / max(packed_usage['website_claims.llm_calls'], 1):.1f}x fewer, "
+        f"prompt tokens: {per_url_usage['website_claims.prompt_tokens'] / max(packed_usage['website_claims.prompt_tokens'], 1):.2f}x, "
+        f"wall time: {per_url_seconds / packed_seconds:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    print("Starting Website Batching Benchmark...")
+
+    try:
+        test_website_batching_benchmark()
+
+        print("\n" + "=" * 70)
+        print("BENCHMARK COMPLETED SUCCESSFULLY! ✓")
+        print("=" * 70)
+
+    except Exception as e:
+        print(f"\n✗ Benchmark failed with error: {e}")
+        import traceback
+
+        traceback.print_exc()
@@ -0,0 +1,56 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.claim_index import ClaimIndex
+
+APPLE_ROSE = "Apple revenue rose to 90 billion dollars in 2023"
+
+
+def make_index(tmp_path, *claims):
+    index = ClaimIndex(path=str(tmp_path / "claim_index.sqlite3"))
+    for claim in claims:
+        index.add(claim)
+    return index
+
+
+def test_paraphrase_matches(tmp_path):
+    index = make_index(tmp_path, "GDP grew 7.2% in Q2")
+    assert len(index.match("Q2 GDP growth was 7.2%")) == 1
+
+    index = make_index(tmp_path, APPLE_ROSE)
+    assert len(index.match("Revenue at Apple rose to 90 billion dollars in 2023")) == 1
+
+
+def test_entity_swap_does_not_match(tmp_path):
+    index = make_index(tmp_path, APPLE_ROSE)
+    assert index.match("Microsoft revenue rose to 90 billion dollars in 2023") == []
+    assert index.match("Apple and Microsoft revenue rose to 90 billion dollars in 2023") == []
+
+
+def test_direction_flip_does_not_match(tmp_path):
+    index = make_index(tmp_path, APPLE_ROSE)
+    assert index.match("Apple revenue fell to 90 billion dollars in 2023") == []
+    assert index.match("Apple revenue declined to 90 billion dollars in 2023") == []
+    # Same direction in other words still matches
+    assert len(index.match("Apple revenue increased to 90 billion dollars in 2023")) == 1
+
+
+def test_negation_does_not_match(tmp_path):
+    index = make_index(tmp_path, APPLE_ROSE)
+    assert index.match("Apple revenue never rose to 90 billion dollars in 2023") == []
+
+
+def test_different_figures_do_not_match(tmp_path):
+    index = make_index(tmp_path, APPLE_ROSE)
+    assert index.match("Apple revenue rose to 95 billion dollars in 2023") == []
+
+
+def test_matches_survive_reload(tmp_path):
+    make_index(tmp_path, APPLE_ROSE)
+    index = make_index(tmp_path)
+    assert len(index) == 1
+    assert len(index.match("Revenue at Apple rose to 90 billion dollars in 2023")) == 1
+    assert index.match("Apple revenue fell to 90 billion dollars in 2023") == []
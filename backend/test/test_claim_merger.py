@@ -0,0 +1,61 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.pipeline.claim_merger import ClaimMerger
+
+
+def merge(*claims):
+    merger = ClaimMerger(max_claims=10)
+    released = merger.offer(list(claims)) + merger.finish()
+    return released, merger.duplicates
+
+
+def test_paraphrases_are_merged():
+    released, duplicates = merge(
+        "India's GDP grew 7.2% in 2024",
+        "India's GDP grew by 7.2% in 2024",
+    )
+    assert len(released) == 1
+    assert duplicates == 1
+
+
+def test_different_entities_with_shared_figures_are_kept():
+    released, duplicates = merge(
+        "Apple revenue rose to 90 billion dollars in 2023",
+        "Microsoft revenue rose to 90 billion dollars in 2023",
+    )
+    assert len(released) == 2
+    assert duplicates == 0
+
+
+def test_opposite_directions_are_kept():
+    released, duplicates = merge(
+        "Apple revenue rose to 90 billion dollars in 2023",
+        "Apple revenue fell to 90 billion dollars in 2023",
+    )
+    assert len(released) == 2
+    assert duplicates == 0
+
+
+def test_negated_claims_are_kept():
+    released, duplicates = merge(
+        "Apple revenue rose to 90 billion dollars in 2023",
+        "Apple revenue never rose to 90 billion dollars in 2023",
+    )
+    assert len(released) == 2
+    assert duplicates == 0
+
+
+def test_duplicates_across_chunks_are_merged():
+    merger = ClaimMerger(max_claims=10, expected_batches=2)
+    first = merger.offer(["Apple revenue rose to 90 billion dollars in 2023"])
+    second = merger.offer([
+        "Revenue at Apple rose to 90 billion dollars in 2023",
+        "Microsoft revenue rose to 90 billion dollars in 2023",
+    ])
+    assert len(first) == 1
+    assert second == ["Microsoft revenue rose to 90 billion dollars in 2023"]
+    assert merger.duplicates == 1
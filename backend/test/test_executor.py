@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.pipeline import VerificationExecutor
+from main.rate_limiter.rate_limiter import ProviderLimiter
+
+
+def test_admission_wakes_waiters_in_order():
+    async def scenario():
+        executor = VerificationExecutor(max_workers=1, max_concurrent=1, max_pending=4)
+        order = []
+
+        async def verify(i):
+            async with executor.admit():
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(verify(i) for i in range(4)))
+        return executor, order
+
+    executor, order = asyncio.run(scenario())
+    assert order == [0, 1, 2, 3]
+    assert executor.stats()["running"] == 0
+    assert executor.admitted == 0
+
+
+def test_cancelled_woken_waiter_passes_the_slot_on():
+    async def scenario():
+        executor = VerificationExecutor(max_workers=1, max_concurrent=1, max_pending=4)
+        ran = asyncio.Event()
+
+        async def verify(event=None):
+            async with executor.admit():
+                if event is not None:
+                    event.set()
+
+        await executor._acquire_running()
+        first = asyncio.create_task(verify())
+        second = asyncio.create_task(verify(ran))
+        await asyncio.sleep(0.01)
+        woken = executor._waiters[0][1]
+
+        executor._release_running()
+        # Let the wakeup land on the first waiter, then cancel it before it resumes
+        await asyncio.sleep(0)
+        assert woken.done() and not woken.cancelled()
+        first.cancel()
+
+        await asyncio.wait_for(ran.wait(), 1)
+        await asyncio.gather(first, second, return_exceptions=True)
+        return executor
+
+    executor = asyncio.run(scenario())
+    assert executor.stats()["running"] == 0
+    assert executor.admitted == 0
+
+
+def test_cancelled_woken_limiter_waiter_passes_the_slot_on():
+    async def scenario():
+        limiter = ProviderLimiter("test", rate=0, max_in_flight=1)
+        ran = asyncio.Event()
+
+        async def call(event=None):
+            async with limiter:
+                if event is not None:
+                    event.set()
+
+        await limiter.acquire_async()
+        first = asyncio.create_task(call())
+        second = asyncio.create_task(call(ran))
+        await asyncio.sleep(0.01)
+        woken = limiter._async_waiters[0][1]
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert woken.done() and not woken.cancelled()
+        first.cancel()
+
+        await asyncio.wait_for(ran.wait(), 1)
+        await asyncio.gather(first, second, return_exceptions=True)
+        return limiter
+
+    limiter = asyncio.run(scenario())
+    assert limiter.stats()["in_flight"] == 0
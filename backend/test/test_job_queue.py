@@ -0,0 +1,195 @@
+import sys
+import os
+import time
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.jobs import JobQueue, JobWorkerPool
+from main.pipeline import PipelineBusyError
+
+
+def make_queue(tmp_path, **kwargs):
+    return JobQueue(path=str(tmp_path / "jobs.sqlite3"), **kwargs)
+
+
+def enqueue(queue, content="GDP grew 7.2% in 2024", **kwargs):
+    return queue.enqueue(content, "text", "user-1", "user@example.com", **kwargs)
+
+
+class FailingPipeline:
+    """Pipeline stand-in whose run raises the given exception."""
+
+    def __init__(self, error):
+        self.error = error
+        self.runs = 0
+
+    async def run(self, content, input_type, force_refresh=False):
+        self.runs += 1
+        raise self.error
+
+
+def test_expired_lease_is_claimed_again(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.2)
+    job = enqueue(queue)
+
+    claimed = queue.claim_next()
+    assert claimed["id"] == job["id"]
+    assert claimed["status"] == JobQueue.RUNNING
+    assert claimed["attempts"] == 1
+    # Leased to the first worker, so nobody else gets it
+    assert queue.claim_next() is None
+
+    time.sleep(0.3)
+    reclaimed = queue.claim_next()
+    assert reclaimed["id"] == job["id"]
+    assert reclaimed["attempts"] == 2
+
+
+def test_heartbeat_keeps_the_lease(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.3)
+    job = enqueue(queue)
+    queue.claim_next()
+
+    time.sleep(0.2)
+    assert queue.heartbeat(job["id"], 1)
+    time.sleep(0.2)
+    assert queue.claim_next() is None
+
+
+def test_expired_lease_after_max_attempts_fails_the_job(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.1, max_attempts=2)
+    job = enqueue(queue)
+    queue.claim_next()
+    time.sleep(0.15)
+    queue.claim_next()
+    time.sleep(0.15)
+
+    assert queue.claim_next() is None
+    failed = queue.get(job["id"])
+    assert failed["status"] == JobQueue.FAILED
+    assert failed["attempts"] == 2
+
+
+def test_duplicate_idempotency_key_returns_existing_job(tmp_path):
+    queue = make_queue(tmp_path)
+    first = enqueue(queue, idempotency_key="client-key")
+    second = enqueue(queue, content="something else", idempotency_key="client-key")
+
+    assert second["id"] == first["id"]
+    assert second["content"] == first["content"]
+    assert queue.counts() == {JobQueue.QUEUED: 1}
+
+    # The key stays bound to the job while it runs and after it finishes
+    claimed = queue.claim_next()
+    queue.complete(first["id"], claimed["attempts"], {"verdict": True})
+    again = enqueue(queue, idempotency_key="client-key")
+    assert again["id"] == first["id"]
+    assert again["status"] == JobQueue.SUCCEEDED
+    assert again["result"] == {"verdict": True}
+
+
+def test_duplicate_idempotency_key_across_queue_instances(tmp_path):
+    # Two processes sharing the same file
+    first = enqueue(make_queue(tmp_path), idempotency_key="client-key")
+    second = enqueue(make_queue(tmp_path), idempotency_key="client-key")
+    assert second["id"] == first["id"]
+
+
+def test_retry_later_delays_the_job(tmp_path):
+    queue = make_queue(tmp_path)
+    job = enqueue(queue)
+    claimed = queue.claim_next()
+
+    queue.retry_later(job["id"], claimed["attempts"], 0.2, "upstream down", count_attempt=True)
+    retried = queue.get(job["id"])
+    assert retried["status"] == JobQueue.QUEUED
+    assert retried["attempts"] == 1
+    assert retried["error"] == "upstream down"
+    assert queue.claim_next() is None
+
+    time.sleep(0.25)
+    assert queue.claim_next()["id"] == job["id"]
+
+
+def test_retry_later_without_counting_the_attempt(tmp_path):
+    queue = make_queue(tmp_path)
+    job = enqueue(queue)
+    claimed = queue.claim_next()
+
+    queue.retry_later(job["id"], claimed["attempts"], 0, "capacity full")
+    assert queue.get(job["id"])["attempts"] == 0
+
+
+def test_worker_retries_errors_with_backoff_then_fails(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    job = enqueue(queue)
+    pool = JobWorkerPool(queue, pipeline=FailingPipeline(RuntimeError("boom")), workers=1)
+
+    started = time.time()
+    asyncio.run(pool._process(0, queue.claim_next()))
+    retried = queue.get(job["id"])
+    assert retried["status"] == JobQueue.QUEUED
+    assert retried["attempts"] == 1
+    assert retried["error"] == "boom"
+    # Backoff grows with the attempt number: 5 s after the first failure
+    assert retried["available_at"] >= started + 5
+
+    # Make the retry due now instead of after the backoff
+    queue._conn.execute("UPDATE verification_jobs SET available_at = 0 WHERE id = ?", (job["id"],))
+    asyncio.run(pool._process(0, queue.claim_next()))
+    failed = queue.get(job["id"])
+    assert failed["status"] == JobQueue.FAILED
+    assert failed["attempts"] == 2
+    assert failed["error_status"] == 500
+
+
+def test_worker_requeues_busy_jobs_without_using_an_attempt(tmp_path):
+    queue = make_queue(tmp_path)
+    job = enqueue(queue)
+    pool = JobWorkerPool(queue, pipeline=FailingPipeline(PipelineBusyError(7)), workers=1)
+
+    started = time.time()
+    asyncio.run(pool._process(0, queue.claim_next()))
+    retried = queue.get(job["id"])
+    assert retried["status"] == JobQueue.QUEUED
+    assert retried["attempts"] == 0
+    assert retried["available_at"] >= started + 7
+
+
+def test_stale_worker_cannot_finish_a_reclaimed_job(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.1)
+    job = enqueue(queue)
+    stale = queue.claim_next()
+    time.sleep(0.15)
+    current = queue.claim_next()
+    assert current["attempts"] == stale["attempts"] + 1
+
+    # The first worker finishes late: every update it makes is ignored
+    assert not queue.complete(job["id"], stale["attempts"], {"verdict": False})
+    assert not queue.fail(job["id"], stale["attempts"], "late failure")
+    assert not queue.retry_later(job["id"], stale["attempts"], 0, "late retry")
+    assert not queue.heartbeat(job["id"], stale["attempts"])
+    running = queue.get(job["id"])
+    assert running["status"] == JobQueue.RUNNING
+    assert running["result"] is None
+
+    assert queue.complete(job["id"], current["attempts"], {"verdict": True})
+    assert queue.get(job["id"])["result"] == {"verdict": True}
+    assert not queue.complete(job["id"], current["attempts"], {"verdict": False})
+
+
+def test_worker_drops_its_result_after_losing_the_lease(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.1)
+    job = enqueue(queue)
+    stale = queue.claim_next()
+    time.sleep(0.15)
+    current = queue.claim_next()
+
+    pool = JobWorkerPool(queue, pipeline=FailingPipeline(RuntimeError("boom")), workers=1)
+    asyncio.run(pool._process(0, stale))
+    running = queue.get(job["id"])
+    assert running["status"] == JobQueue.RUNNING
+    assert running["attempts"] == current["attempts"]
+    assert running["error"] is None
@@ -0,0 +1,92 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.claim_extractor.output_parser import parse_claims, parse_source_claims
+from main.metrics import metrics
+
+# Model outputs seen in practice
+STRICT_JSON = '{"claims": ["GDP grew 7.2% in 2024", "Inflation was 4.1%"]}'
+
+FENCED_JSON = """```json
+{"claims": ["GDP grew 7.2% in 2024", "Inflation was 4.1%"]}
+```"""
+
+TRAILING_COMMAS = """{
+  "claims": [
+    "GDP grew 7.2% in 2024",
+    "Inflation was 4.1%",
+  ],
+}"""
+
+PROSE_WRAPPED_ARRAY = """Sure! Here are the factual claims I found in the text:
+
+["GDP grew 7.2% in 2024", "Inflation was 4.1%"]
+
+Let me know if you need anything else."""
+
+UNRECOVERABLE = "I'm sorry, but I can't identify any verifiable claims in this content."
+
+CLAIMS = ["GDP grew 7.2% in 2024", "Inflation was 4.1%"]
+
+
+def parse(response, component):
+    before = {status: metrics.get(f"{component}.parse_{status}") for status in ("ok", "repaired", "failed")}
+    claims, status = parse_claims(response, component=component)
+    counts = {
+        status: metrics.get(f"{component}.parse_{status}") - count for status, count in before.items()
+    }
+    return claims, status, counts
+
+
+def test_strict_json():
+    claims, status, counts = parse(STRICT_JSON, "test_strict")
+    assert claims == CLAIMS
+    assert status == "ok"
+    assert counts == {"ok": 1, "repaired": 0, "failed": 0}
+
+
+def test_fenced_json():
+    claims, status, counts = parse(FENCED_JSON, "test_fenced")
+    assert claims == CLAIMS
+    assert status == "ok"
+    assert counts == {"ok": 1, "repaired": 0, "failed": 0}
+
+
+def test_trailing_commas():
+    claims, status, counts = parse(TRAILING_COMMAS, "test_trailing_commas")
+    assert claims == CLAIMS
+    assert status == "repaired"
+    assert counts == {"ok": 0, "repaired": 1, "failed": 0}
+
+
+def test_prose_wrapped_array():
+    claims, status, counts = parse(PROSE_WRAPPED_ARRAY, "test_prose")
+    assert claims == CLAIMS
+    assert status == "repaired"
+    assert counts == {"ok": 0, "repaired": 1, "failed": 0}
+
+
+def test_unrecoverable_output():
+    claims, status, counts = parse(UNRECOVERABLE, "test_unrecoverable")
+    assert claims == []
+    assert status == "failed"
+    assert counts == {"ok": 0, "repaired": 0, "failed": 1}
+
+
+def test_source_claims_with_trailing_commas():
+    response = '```json\n{"sources": [{"source": 1, "claims": ["GDP grew 7.2% in 2024",]}, {"source": 2, "claims": []},]}\n```'
+    results, status = parse_source_claims(response, component="test_source_claims")
+    assert results == {1: ["GDP grew 7.2% in 2024"], 2: []}
+    assert status == "repaired"
+    assert metrics.get("test_source_claims.parse_repaired") == 1
+
+
+def test_source_claims_unrecoverable():
+    # Packed responses are never read as bulleted lists
+    results, status = parse_source_claims("- GDP grew 7.2% in 2024", component="test_source_failed")
+    assert results == {}
+    assert status == "failed"
+    assert metrics.get("test_source_failed.parse_failed") == 1
@@ -0,0 +1,103 @@
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.pipeline import SingleFlight, VerificationExecutor
+
+
+def test_concurrent_identical_runs_execute_once():
+    async def scenario():
+        flight = SingleFlight()
+        executions = 0
+
+        async def work(emit):
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.05)
+            return {"verdict": True}
+
+        results = await asyncio.gather(*(flight.run("key", work) for _ in range(10)))
+        return flight, executions, results
+
+    flight, executions, results = asyncio.run(scenario())
+    assert executions == 1
+    assert results == [{"verdict": True}] * 10
+    assert flight.coalesced == 9
+    assert flight.in_flight() == 0
+
+
+def test_late_joiner_gets_missed_events_replayed():
+    async def scenario():
+        flight = SingleFlight()
+        halfway = asyncio.Event()
+        proceed = asyncio.Event()
+
+        async def work(emit):
+            await emit("claims", {"claims": ["a"]})
+            await emit("progress", {"step": 1})
+            halfway.set()
+            await proceed.wait()
+            await emit("progress", {"step": 2})
+            return "done"
+
+        first_events, late_events = [], []
+
+        def record(into):
+            async def on_event(event, data):
+                into.append((event, data))
+            return on_event
+
+        first = asyncio.create_task(flight.run("key", work, on_event=record(first_events)))
+        await halfway.wait()
+        late = asyncio.create_task(flight.run("key", work, on_event=record(late_events)))
+        await asyncio.sleep(0.01)
+        proceed.set()
+        return await first, await late, first_events, late_events
+
+    first, late, first_events, late_events = asyncio.run(scenario())
+    expected = [("claims", {"claims": ["a"]}), ("progress", {"step": 1}), ("progress", {"step": 2})]
+    assert first == late == "done"
+    assert first_events == expected
+    assert late_events == expected
+
+
+def test_cancelling_every_caller_releases_entry_and_admission():
+    async def scenario():
+        flight = SingleFlight()
+        executor = VerificationExecutor(max_workers=1, max_concurrent=1, max_pending=1)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work(emit):
+            async with executor.admit():
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        callers = [asyncio.create_task(flight.run("key", work)) for _ in range(3)]
+        await started.wait()
+        assert flight.in_flight() == 1
+        assert executor.admitted == 1
+
+        callers[0].cancel()
+        await asyncio.sleep(0.01)
+        # Others are still waiting, so the shared work keeps running
+        assert not cancelled.is_set()
+
+        for caller in callers[1:]:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0.01)
+        return flight, executor
+
+    flight, executor = asyncio.run(scenario())
+    assert flight.in_flight() == 0
+    assert executor.admitted == 0
+    assert executor.stats()["running"] == 0
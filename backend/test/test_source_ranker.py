@@ -0,0 +1,74 @@
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from main.source_ranker import SourceRanker, DomainReputation
+
+SITES = [
+    "reuters.com", "apnews.com", "bbc.co.uk", "who.int", "nature.com", "thehindu.com",
+    "medium.com", "reddit.com", "blogspot.com", "example.org", "cnn.com", "gov.in",
+]
+
+
+def search_results(seed: int, claims: int, per_claim: int = 5):
+    """Seeded fake search results, with pages shared between claims and crowded sites."""
+    rng = random.Random(seed)
+    results = {}
+    for i in range(claims):
+        results[f"claim {i}"] = [
+            {
+                "url": f"https://www.{rng.choice(SITES)}/story/{rng.randrange(20)}",
+                "score": round(rng.uniform(0.05, 0.99), 2),
+            }
+            for _ in range(per_claim)
+        ]
+    return results
+
+
+def rank(results, **kwargs):
+    ranker = SourceRanker(DomainReputation(), **kwargs)
+    for claim, claim_results in results.items():
+        ranker.offer(claim, claim_results)
+    ranker.finish()
+    return ranker
+
+
+def test_every_claim_gets_a_source_within_the_default_budget():
+    for seed in range(50):
+        results = search_results(seed, claims=seed % 12 + 1)
+        ranker = rank(results)
+
+        assert ranker.budget == 12
+        assert len(ranker.selected) <= ranker.budget
+        assert len(set(ranker.selected)) == len(ranker.selected)
+        per_claim = ranker.sources()
+        for claim in results:
+            assert per_claim.get(claim), f"seed {seed}: {claim} has no source"
+
+
+def test_low_scoring_claims_still_get_a_source():
+    results = {
+        "claim 0": [{"url": "https://www.reuters.com/a", "score": 0.9}],
+        "claim 1": [{"url": "https://someone.blogspot.com/post", "score": 0.01}],
+    }
+    ranker = rank(results)
+    assert ranker.sources() == {
+        "claim 0": ["https://www.reuters.com/a"],
+        "claim 1": ["https://someone.blogspot.com/post"],
+    }
+
+
+def test_budget_is_never_exceeded():
+    for seed in range(20):
+        results = search_results(seed, claims=12, per_claim=10)
+        for budget in (1, 5, 12):
+            ranker = rank(results, budget=budget)
+            assert 1 <= len(ranker.selected) <= budget
+
+
+def test_ranking_is_deterministic():
+    results = search_results(7, claims=6)
+    assert rank(results).selected == rank(results).selected
@@ -1,9 +1,10 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Any, Optional, List, Dict
 import sys
 import os
+import asyncio
 from pathlib import Path
 
 # Add backend directory to path to import shared modules
@@ -12,13 +13,8 @@ if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
 # Import after adding to path
-import main.claim_extractor
-import main.claim_discoverer
-import main.reasoning
-from main.claim_extractor import ClaimExtractor
-from main.claim_discoverer import ClaimDiscoverer
-from main.reasoning import ClaimReasoner
-from database.supabase_client import SupabaseClient
+from main.pipeline import get_pipeline, VerificationError, PipelineBusyError
+from main.resources import warm_up
 
 app = FastAPI(title="Web Extension Misinformation Detection API")
 
@@ -32,11 +28,18 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup_event():
+    # Only the verification pipeline and its clients are used here
+    await asyncio.to_thread(warm_up, ["tiktoken", "supabase", "pipeline"])
+
+
 class VerifyRequest(BaseModel):
     input_type: str  # "text" or "url"
     content: str
     user_id: Optional[str] = "0"
     user_email: Optional[str] = "user0@gmail.com"
+    force_refresh: bool = False  # skip the verdict cache
 
 
 class VerifyResponse(BaseModel):
@@ -46,6 +49,8 @@ class VerifyResponse(BaseModel):
     claims: List[str]
     sources: Dict[str, List[str]]
     website_claims: Dict[str, List[str]]
+    cached: bool = False
+    reasoning_tier: Optional[Dict[str, Any]] = None  # which reasoning model answered, and why
 
 
 @app.get("/")
@@ -81,85 +86,39 @@ async def verify_content(request: VerifyRequest):
         print(f"[EXTENSION] Processing {request.input_type}: {safe_content}...")
         print(f"{'='*70}\n")
 
-        # Step 1: Extract claims
-        extractor = ClaimExtractor(max_tokens_per_chunk=15000)
-
-        if request.input_type == "url":
-            result = extractor.extract_claims_from_url(request.content, key_name="user")
-        else:
-            result = extractor.extract_claims(request.content, key_name="user")
-
-        if not result["user"]:
-            raise HTTPException(
-                status_code=400, detail="No claims could be extracted from the content"
-            )
-
-        print(f"[EXTENSION] Extracted {len(result['user'])} claims")
-
-        # Step 2: Discover sources
-        discoverer = ClaimDiscoverer()
-        sources = discoverer.discover_sources(result["user"])
-
-        total_links = sum(len(links) for links in sources.values())
-        print(f"[EXTENSION] Discovered {total_links} sources")
-
-        # Step 3: Extract website claims
-        all_urls = []
-        for urls in sources.values():
-            all_urls.extend(urls)
-        all_urls = list(set(all_urls))
-
-        if not all_urls:
-            raise HTTPException(
-                status_code=400,
-                detail="No sources discovered. Please check your Tavily API key."
-            )
-        
-        website_claims = extractor.extract_website_claims(all_urls, result["user"])
-
-        # Flatten website claims for response
-        all_website_claims_flat = {}
-        for url, claims in website_claims.items():
-            if claims:
-                all_website_claims_flat[url] = claims
-
-        print(f"[EXTENSION] Extracted claims from {len(all_website_claims_flat)} websites")
-
-        # Step 4: Reasoning
-        if not all_website_claims_flat:
-            raise HTTPException(
-                status_code=400,
-                detail="No credible sources found for verification. Please check your API keys and try again."
-            )
-        
-        reasoner = ClaimReasoner()
-        final_result = reasoner.reason_all_claims(result["user"], all_website_claims_flat)
-        print(f"[EXTENSION] Final verdict: {final_result['verdict']}")
+        pipeline = get_pipeline()
+        result = await pipeline.run(
+            request.content, request.input_type, force_refresh=request.force_refresh
+        )
+        print(f"[EXTENSION] Final verdict: {result['verdict']}")
 
         # Save to Supabase
-        db = SupabaseClient()
-        saved_record = db.save_verification(
-            user_id=request.user_id,
-            user_email=request.user_email,
-            input_content=request.content,
-            input_type=request.input_type,
-            verdict=final_result["verdict"],
-            reasoning=final_result["reasoning"],
-            claims=result["user"],
-            sources=sources,
+        verification_id = await pipeline.save_verification(
+            result, user_id=request.user_id, user_email=request.user_email
         )
-        verification_id = saved_record.get("id", "")
         print(f"[EXTENSION] Saved to Supabase with ID: {verification_id}")
 
         return VerifyResponse(
             verification_id=verification_id,
-            verdict=final_result["verdict"],
-            reasoning=final_result["reasoning"],
-            claims=result["user"],
-            sources=sources,
-            website_claims=all_website_claims_flat,
+            verdict=result["verdict"],
+            reasoning=result["reasoning"],
+            claims=result["claims"],
+            sources=result["sources"],
+            website_claims=result["website_claims"],
+            cached=result["cached"],
+            reasoning_tier=result.get("reasoning_tier"),
         )
 
+    except PipelineBusyError as e:
+        print(f"[EXTENSION] Rejected verification: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="Verification service is busy. Please retry shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    except VerificationError as e:
+        print(f"[EXTENSION] Error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException as http_exc:
         # Re-raise HTTPExceptions with their original status code
         print(f"[EXTENSION] Error: {http_exc.detail}")
@@ -21,7 +21,7 @@ from telegram.helpers import escape_markdown
 backend_dir = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from database.supabase_client import SupabaseClient
+from main.resources import get_resource
 
 # Load .env from project root (go up two levels: bot/ -> telegram-bot/ -> project root)
 env_path = Path(__file__).parent.parent.parent / ".env"
@@ -48,7 +48,7 @@ class AnnouncementService:
         """
         self.bot = Bot(token=bot_token)
         self.channel_id = channel_id
-        self.db = SupabaseClient()
+        self.db = get_resource("supabase")
         logger.info(f"Announcement service initialized for channel: {channel_id}")
 
 
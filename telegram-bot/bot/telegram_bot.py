@@ -23,10 +23,8 @@ from telegram.ext import (
 backend_dir = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from main.claim_extractor import ClaimExtractor
-from main.claim_discoverer import ClaimDiscoverer
-from main.reasoning import ClaimReasoner
-from database.supabase_client import SupabaseClient
+from main.pipeline import get_pipeline, VerificationError, PipelineBusyError
+from main.resources import warm_up
 from bot.announcement_service import AnnouncementService
 
 
@@ -168,96 +166,70 @@ Have questions? Just send me your claim! 💡
                 parse_mode="Markdown",
             )
 
-            extractor = ClaimExtractor(max_tokens_per_chunk=15000)
-
-            if input_type == "url":
-                result = extractor.extract_claims_from_url(user_input, key_name="user")
-            else:
-                result = extractor.extract_claims(user_input, key_name="user")
-
-            if not result["user"]:
+            async def on_event(event: str, data: dict):
+                """Report pipeline progress by editing the processing message."""
+                if event == "claims":
+                    logger.info(f"Extracted {len(data['claims'])} claims")
+                    await processing_msg.edit_text(
+                        f"🔍 *Step 2/4:* Finding credible sources...\n\n"
+                        f"Found {len(data['claims'])} claims",
+                        parse_mode="Markdown",
+                    )
+                elif event == "sources":
+                    unique_urls = {url for urls in data["sources"].values() for url in urls}
+                    if not unique_urls:
+                        return
+                    logger.info(f"Discovered {len(unique_urls)} unique sources")
+                    await processing_msg.edit_text(
+                        f"🔍 *Step 3/4:* Analyzing sources...\n\n"
+                        f"Found {len(unique_urls)} sources",
+                        parse_mode="Markdown",
+                    )
+                elif event == "website_claims":
+                    if not data["website_claims"]:
+                        return
+                    logger.info(f"Extracted claims from {len(data['website_claims'])} websites")
+                    await processing_msg.edit_text(
+                        f"🔍 *Step 4/4:* AI reasoning and verification...",
+                        parse_mode="Markdown",
+                    )
+
+            pipeline = get_pipeline()
+            try:
+                final_result = await pipeline.run(user_input, input_type, on_event=on_event)
+            except PipelineBusyError as e:
                 await processing_msg.edit_text(
-                    "❌ *Error:* No claims could be extracted from the content.\n\n"
-                    "Please try with different content.",
+                    "⏳ *I'm busy verifying other requests.*\n\n"
+                    f"Please try again in about {e.retry_after} seconds.",
                     parse_mode="Markdown",
                 )
                 return
-
-            claims = result["user"]
-            logger.info(f"Extracted {len(claims)} claims")
-
-            # Step 2: Discover sources
-            await processing_msg.edit_text(
-                f"🔍 *Step 2/4:* Finding credible sources...\n\n"
-                f"Found {len(claims)} claims",
-                parse_mode="Markdown",
-            )
-
-            discoverer = ClaimDiscoverer()
-            sources = discoverer.discover_sources(claims)
-
-            all_urls = []
-            for urls in sources.values():
-                all_urls.extend(urls)
-            all_urls = list(set(all_urls))
-
-            if not all_urls:
+            except VerificationError as e:
+                error_messages = {
+                    "extract": "❌ *Error:* No claims could be extracted from the content.\n\n"
+                               "Please try with different content.",
+                    "discover": "❌ *Error:* No credible sources found for verification.\n\n"
+                                "Please check your API keys or try different content.",
+                    "evidence": "❌ *Error:* Could not extract claims from sources.\n\n"
+                                "Please try again later.",
+                }
                 await processing_msg.edit_text(
-                    "❌ *Error:* No credible sources found for verification.\n\n"
-                    "Please check your API keys or try different content.",
+                    error_messages.get(e.stage, f"❌ *Error:* {e}"),
                     parse_mode="Markdown",
                 )
                 return
 
-            logger.info(f"Discovered {len(all_urls)} unique sources")
-
-            # Step 3: Extract website claims
-            await processing_msg.edit_text(
-                f"🔍 *Step 3/4:* Analyzing sources...\n\n"
-                f"Found {len(all_urls)} sources",
-                parse_mode="Markdown",
-            )
-
-            website_claims = extractor.extract_website_claims(all_urls, claims)
-
-            all_website_claims_flat = {}
-            for url, wclaims in website_claims.items():
-                if wclaims:
-                    all_website_claims_flat[url] = wclaims
-
-            if not all_website_claims_flat:
-                await processing_msg.edit_text(
-                    "❌ *Error:* Could not extract claims from sources.\n\n"
-                    "Please try again later.",
-                    parse_mode="Markdown",
-                )
-                return
-
-            logger.info(f"Extracted claims from {len(all_website_claims_flat)} websites")
-
-            # Step 4: Reasoning
-            await processing_msg.edit_text(
-                f"🔍 *Step 4/4:* AI reasoning and verification...",
-                parse_mode="Markdown",
-            )
-
-            reasoner = ClaimReasoner()
-            final_result = reasoner.reason_all_claims(claims, all_website_claims_flat)
+            claims = final_result["claims"]
+            all_website_claims_flat = final_result["website_claims"]
 
             logger.info(f"Final verdict: {final_result['verdict']}")
 
             # Save to database
             try:
-                db = SupabaseClient()
-                db.save_verification(
+                await pipeline.save_verification(
+                    final_result,
                     user_id=user_id,
                     user_email=f"{user_name}@telegram",
-                    input_content=user_input,
-                    input_type=input_type,
-                    verdict=final_result["verdict"],
-                    reasoning=final_result["reasoning"],
-                    claims=claims,
-                    sources=sources,
                 )
             except Exception as e:
                 logger.warning(f"Failed to save to database: {e}")
@@ -397,6 +369,9 @@ Have questions? Just send me your claim! 💡
         """Run the bot."""
         logger.info("Starting Truth Lens Telegram Bot...")
 
+        # Build the pipeline and its clients before the first message arrives
+        warm_up(["tiktoken", "supabase", "pipeline"])
+
         # Create application
         application = Application.builder().token(self.token).build()
 